@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from qaagent.api.middleware import AuthMiddleware
 from qaagent.api.routes import runs, evidence, repositories, fix, doc, agent, auth, settings, branches
@@ -26,6 +27,8 @@ def create_app() -> FastAPI:
         api_only=True,
     )
 
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     @app.get("/health", tags=["meta"])
     async def healthcheck() -> dict[str, str]:
         return {"status": "ok"}
@@ -26,19 +26,20 @@ class AuthMiddleware(BaseHTTPMiddleware):
         api_only: bool = False,
     ):
         super().__init__(app)
-        self.exempt_prefixes = exempt_prefixes
+        # Tuple so dispatch can test every prefix in one str.startswith call
+        self.exempt_prefixes = tuple(exempt_prefixes)
         self.api_only = api_only
 
     async def dispatch(self, request: Request, call_next):
         path = request.url.path
 
         # Always allow exempt paths
-        if any(path.startswith(p) for p in self.exempt_prefixes):
+        if path.startswith(self.exempt_prefixes):
             return await call_next(request)
 
         # If no users configured yet, let everything through
         # (frontend will redirect to /setup-admin)
-        if db.user_count() == 0:
+        if not db.users_exist():
             return await call_next(request)
 
         # Check session cookie
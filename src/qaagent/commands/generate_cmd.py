@@ -644,9 +644,8 @@ def generate_openapi(
     workspace: bool = typer.Option(True, "--workspace/--no-workspace", help="Use workspace directory (recommended)"),
 ):
     """Generate OpenAPI 3.0 specification from discovered routes."""
-    import json
     import yaml
-    from qaagent.openapi_gen import OpenAPIGenerator
+    from qaagent.openapi_gen import OpenAPIGenerator, write_spec_json
     from qaagent.discovery import NextJsRouteDiscoverer
     from qaagent.workspace import Workspace
 
@@ -711,7 +710,7 @@ def generate_openapi(
     # Save to file
     output_file.parent.mkdir(parents=True, exist_ok=True)
     if format == "json":
-        output_file.write_text(json.dumps(spec, indent=2))
+        write_spec_json(spec, output_file)
     else:
         output_file.write_text(yaml.dump(spec, default_flow_style=False, sort_keys=False))
 
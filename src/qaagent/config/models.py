@@ -92,6 +92,15 @@ class LLMSettings(BaseModel):
 class RunSettings(BaseModel):
     """Settings for test orchestration and execution."""
     retry_count: int = Field(default=0, description="Max retries for failed tests")
+    retry_backoff_base: float = Field(
+        default=1.0,
+        ge=0,
+        description=(
+            "Backoff unit in seconds: retry N waits base * 2^(N-1) plus jitter; "
+            "the first retry is immediate and 0 disables backoff"
+        ),
+    )
+    retry_backoff_max: float = Field(default=30.0, ge=0, description="Cap on the retry backoff delay")
     timeout: int = Field(default=300, description="Per-suite timeout in seconds")
     suite_order: List[str] = Field(
         default_factory=lambda: ["unit", "behave", "e2e"],
@@ -103,6 +112,22 @@ class RunSettings(BaseModel):
         ge=1,
         description="Max concurrent suites (defaults to number of enabled suites)",
     )
+    diagnostics_cache_ttl: Optional[int] = Field(
+        default=7 * 24 * 3600,
+        ge=0,
+        description=(
+            "Seconds a cached LLM diagnosis of an identical failure set stays valid "
+            "(default one week, None = no expiry, 0 = disable the cache)"
+        ),
+    )
+    workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Test workers within a suite (pytest-xdist / Playwright --workers); "
+            "defaults to CPU count minus two for pytest when xdist is installed"
+        ),
+    )
 
 
 class DocIntegrationOverride(BaseModel):
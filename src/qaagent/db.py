@@ -17,6 +17,8 @@ import os
 import secrets
 import sqlite3
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -28,6 +30,9 @@ from typing import Any, Dict, List, Optional, Tuple
 _lock = threading.Lock()
 _connection: Optional[sqlite3.Connection] = None
 _db_path: Optional[str] = None
+# Users are never deleted, so once one exists the answer holds until the
+# connection or database path changes
+_users_exist = False
 
 
 def _default_db_path() -> str:
@@ -63,19 +68,23 @@ def get_db(db_path: Optional[str] = None) -> sqlite3.Connection:
 
 def reset_connection() -> None:
     """Close and discard the singleton connection (for test isolation)."""
-    global _connection, _db_path
+    global _connection, _db_path, _users_exist
 
     with _lock:
         if _connection is not None:
             _connection.close()
         _connection = None
         _db_path = None
+        _users_exist = False
+    _session_cache_clear()
 
 
 def set_db_path(path: str) -> None:
     """Pre-set the database path before first get_db() call."""
-    global _db_path
+    global _db_path, _users_exist
     _db_path = path
+    _users_exist = False
+    _session_cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -389,6 +398,14 @@ def user_count() -> int:
     return row["cnt"]
 
 
+def users_exist() -> bool:
+    """Return whether any user exists, skipping the query once one has been seen."""
+    global _users_exist
+    if not _users_exist:
+        _users_exist = user_count() > 0
+    return _users_exist
+
+
 def user_create(username: str, password: str) -> int:
     """Create a user. Returns user id. Raises sqlite3.IntegrityError on duplicate."""
     hash_hex, salt_hex = _hash_password(password)
@@ -442,6 +459,38 @@ def user_get_first_username() -> Optional[str]:
 # ---------------------------------------------------------------------------
 
 _SESSION_LIFETIME_HOURS = 24
+_SESSION_CACHE_TTL = 30.0
+_SESSION_CACHE_SIZE = 4096
+
+# token -> (monotonic deadline, session info), oldest first
+_session_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_session_cache_lock = threading.Lock()
+
+
+def _session_cache_get(token: str) -> Optional[Dict[str, Any]]:
+    with _session_cache_lock:
+        entry = _session_cache.get(token)
+        if entry is None:
+            return None
+        deadline, info = entry
+        if time.monotonic() >= deadline:
+            del _session_cache[token]
+            return None
+        _session_cache.move_to_end(token)
+        return dict(info)
+
+
+def _session_cache_put(token: str, info: Dict[str, Any], ttl: float) -> None:
+    with _session_cache_lock:
+        _session_cache[token] = (time.monotonic() + ttl, info)
+        _session_cache.move_to_end(token)
+        while len(_session_cache) > _SESSION_CACHE_SIZE:
+            _session_cache.popitem(last=False)
+
+
+def _session_cache_clear() -> None:
+    with _session_cache_lock:
+        _session_cache.clear()
 
 
 def session_create(user_id: int) -> str:
@@ -459,7 +508,16 @@ def session_create(user_id: int) -> str:
 
 
 def session_validate(token: str) -> Optional[Dict[str, Any]]:
-    """Validate a session token. Returns {user_id, username} or None."""
+    """Validate a session token. Returns {user_id, username} or None.
+
+    Valid sessions are cached in memory for up to ``_SESSION_CACHE_TTL``
+    seconds (never past their expiry), so a burst of dashboard requests
+    shares one lookup.
+    """
+    cached = _session_cache_get(token)
+    if cached is not None:
+        return cached
+
     conn = get_db()
     row = conn.execute(
         """SELECT s.user_id, s.expires_at, u.username
@@ -472,15 +530,20 @@ def session_validate(token: str) -> Optional[Dict[str, Any]]:
     expires = datetime.fromisoformat(row["expires_at"])
     if expires.tzinfo is None:
         expires = expires.replace(tzinfo=timezone.utc)
-    if datetime.now(timezone.utc) > expires:
+    remaining = (expires - datetime.now(timezone.utc)).total_seconds()
+    if remaining < 0:
         # Expired — clean it up
         conn.execute("DELETE FROM sessions WHERE token = ?", (token,))
         conn.commit()
         return None
-    return {"user_id": row["user_id"], "username": row["username"]}
+    info = {"user_id": row["user_id"], "username": row["username"]}
+    _session_cache_put(token, info, min(_SESSION_CACHE_TTL, remaining))
+    return dict(info)
 
 
 def session_delete(token: str) -> bool:
+    with _session_cache_lock:
+        _session_cache.pop(token, None)
     conn = get_db()
     cur = conn.execute("DELETE FROM sessions WHERE token = ?", (token,))
     conn.commit()
@@ -9,6 +9,11 @@ from typing import Iterable, Mapping, Dict
 
 from .run_manager import RunHandle
 
+try:  # orjson serializes several times faster; optional
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
 COUNT_MAPPING: Dict[str, str] = {
@@ -28,13 +33,24 @@ class JsonlWriter:
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
     def append(self, records: Iterable[Mapping[str, object]]) -> int:
-        count = 0
-        with self.path.open("a", encoding="utf-8") as fp:
-            for record in records:
-                fp.write(json.dumps(record))
-                fp.write("\n")
-                count += 1
-        return count
+        """Serialize all records into one buffer and append it with a single write."""
+        lines = [_dumps_line(record) for record in records]
+        if not lines:
+            return 0
+        with self.path.open("ab") as fp:
+            fp.write(b"".join(lines))
+        return len(lines)
+
+
+def _dumps_line(record: Mapping[str, object]) -> bytes:
+    """Encode one record as a UTF-8 JSON line."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # e.g. integers beyond 64 bits or non-str keys, which json handles
+            pass
+    return (json.dumps(record) + "\n").encode("utf-8")
 
 
 class EvidenceWriter:
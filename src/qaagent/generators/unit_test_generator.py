@@ -12,6 +12,7 @@ Generates pytest test classes with:
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -24,6 +25,22 @@ from qaagent.generators.data_generator import DataGenerator
 from qaagent.generators.validator import TestValidator
 
 
+@lru_cache(maxsize=None)
+def _jinja_env() -> Environment:
+    """Shared environment, so templates are compiled once per process.
+
+    Packaged templates do not change at runtime, so ``auto_reload`` is off
+    and cached templates are returned without re-checking their source.
+    """
+    return Environment(
+        loader=PackageLoader("qaagent", "templates/unit"),
+        autoescape=select_autoescape(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+    )
+
+
 class UnitTestGenerator(BaseGenerator):
     """Generates pytest unit tests from discovered routes."""
 
@@ -59,12 +76,7 @@ class UnitTestGenerator(BaseGenerator):
 
     def _setup_jinja(self) -> None:
         """Initialize Jinja2 environment."""
-        self.jinja_env = Environment(
-            loader=PackageLoader("qaagent", "templates/unit"),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.jinja_env = _jinja_env()
 
     def generate(self, output_dir: Optional[Path] = None, **kwargs) -> GenerationResult:
         """
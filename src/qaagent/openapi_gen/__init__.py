@@ -7,6 +7,6 @@ Generates OpenAPI 3.0 specs from:
 - Express routes (future)
 """
 
-from .generator import OpenAPIGenerator
+from .generator import OpenAPIGenerator, write_spec_json
 
-__all__ = ["OpenAPIGenerator"]
+__all__ = ["OpenAPIGenerator", "write_spec_json"]
@@ -6,10 +6,33 @@ Converts Route objects into valid OpenAPI 3.0 JSON/YAML specifications.
 
 from __future__ import annotations
 
+import json
+from pathlib import Path
 from typing import Any, Dict, List
 
 from qaagent.analyzers.models import Route
 
+try:  # C-accelerated JSON encoding; optional
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def write_spec_json(spec: Dict[str, Any], path: Path) -> None:
+    """Write a spec as 2-space indented JSON without building an intermediate str.
+
+    orjson encodes straight to bytes; the stdlib fallback streams through
+    ``json.dump`` into the open file.
+    """
+    if orjson is not None:
+        try:
+            path.write_bytes(orjson.dumps(spec, option=orjson.OPT_INDENT_2))
+            return
+        except TypeError:
+            pass
+    with path.open("w", encoding="utf-8") as fp:
+        json.dump(spec, fp, indent=2)
+
 
 class OpenAPIGenerator:
     """Generates OpenAPI 3.0 specifications from discovered routes."""
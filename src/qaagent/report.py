@@ -4,8 +4,11 @@ import datetime as _dt
 import platform
 import json
 import csv
+import os
+import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
@@ -141,13 +144,36 @@ def aggregate_suites(suites: Iterable[Suite]) -> Aggregate:
     )
 
 
+@lru_cache(maxsize=32)
+def _list_dir_cached(path: str, mtime_ns: int) -> frozenset[str]:
+    try:
+        return frozenset(os.listdir(path))
+    except OSError:
+        return frozenset()
+
+
+def _list_dir(path: Path) -> frozenset[str]:
+    """Return the entry names of ``path``, or an empty set if it is not a directory.
+
+    Listings are cached per directory mtime, so repeated lookups cost a single
+    ``stat`` and stay correct when entries are added or removed.
+    """
+    key = os.path.abspath(path)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        return frozenset()
+    return _list_dir_cached(key, mtime_ns)
+
+
 def find_default_junit_files() -> List[Path]:
     candidates = [
         Path("reports/pytest/junit.xml"),
         Path("reports/schemathesis/junit.xml"),
         Path("reports/ui/junit.xml"),
     ]
-    return [p for p in candidates if p.exists()]
+    present = _list_dir(Path("reports"))
+    return [p for p in candidates if p.parent.name in present and p.exists()]
 
 
 def collect_artifacts() -> Dict[str, List[str]]:
@@ -174,8 +200,9 @@ def collect_artifacts() -> Dict[str, List[str]]:
         "coverage_xml": ["**/coverage.xml"],
         "coverage_html": ["**/htmlcov/index.html", "**/coverage_html/index.html"],
     }
+    present = _list_dir(Path("."))
     for root in roots:
-        if not root.exists():
+        if root.name not in present:
             continue
         for key, globs in patterns.items():
             for pat in globs:
@@ -783,6 +810,40 @@ def summarize_perf(csv_files: List[str]) -> Dict[str, object] | None:
     }
 
 
+_ROOT_TAG_RE = re.compile(rb"<(?!\?|!)[\w:.-]+(\s[^>]*)?>")
+_ATTR_RE = re.compile(rb'([\w:.-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+
+def _read_root_attrib(path: Path) -> Dict[str, str] | None:
+    """Return the root element's attributes without parsing the whole document.
+
+    Only the root attributes matter for coverage summaries, so the first 4 KiB
+    are scanned for the opening tag; if it is not found there, fall back to
+    ``iterparse`` and stop at the first ``start`` event.
+    """
+    try:
+        with path.open("rb") as fh:
+            head = fh.read(4096)
+    except OSError:
+        return None
+    match = _ROOT_TAG_RE.search(head)
+    if match is not None:
+        return {
+            m.group(1).decode("utf-8", "replace"): (m.group(2) if m.group(2) is not None else m.group(3)).decode(
+                "utf-8", "replace"
+            )
+            for m in _ATTR_RE.finditer(match.group(1) or b"")
+        }
+    try:
+        it = ET.iterparse(str(path), events=("start",))
+        _, root = next(it)
+        attrib = dict(root.attrib)
+        del it
+        return attrib
+    except (ET.ParseError, StopIteration):
+        return None
+
+
 def summarize_code_coverage(files: List[str]) -> Dict[str, object] | None:
     if not files:
         return None
@@ -790,14 +851,12 @@ def summarize_code_coverage(files: List[str]) -> Dict[str, object] | None:
     path = Path(files[0])
     if not path.exists():
         return None
-    try:
-        tree = ET.parse(path)
-    except ET.ParseError:
+    attrib = _read_root_attrib(path)
+    if attrib is None:
         return None
-    root = tree.getroot()
     # Cobertura format
-    line_rate = root.attrib.get("line-rate") or root.attrib.get("lineRate")
-    branch_rate = root.attrib.get("branch-rate") or root.attrib.get("branchRate")
+    line_rate = attrib.get("line-rate") or attrib.get("lineRate")
+    branch_rate = attrib.get("branch-rate") or attrib.get("branchRate")
     def pct(val: Optional[str]) -> Optional[float]:
         try:
             f = float(val)
@@ -811,30 +870,78 @@ def summarize_code_coverage(files: List[str]) -> Dict[str, object] | None:
     }
 
 
-def summarize_api_coverage(artifacts: Dict[str, List[str]]) -> Dict[str, object] | None:
-    try:
-        from .analyzers.route_coverage import build_route_coverage
-        from .openapi_utils import find_openapi_candidates
-    except Exception:
-        return None
+def _openapi_search_signature(root: Path) -> tuple[tuple[str, int], ...]:
+    """(path, mtime_ns) of every directory the OpenAPI search visits, and of its *.yaml files.
+
+    Directory mtimes change when a spec is added, removed or renamed anywhere
+    in the tree; the .yaml mtimes cover edits that turn a file into (or out
+    of) a spec for the content-sniffing fallback. One walk here replaces the
+    several the search itself makes.
+    """
+    signature = []
+    for dirpath, _, filenames in os.walk(root):
+        try:
+            signature.append((dirpath, os.stat(dirpath).st_mtime_ns))
+            for name in filenames:
+                if name.endswith(".yaml"):
+                    path = os.path.join(dirpath, name)
+                    signature.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(signature)
+
+
+@lru_cache(maxsize=8)
+def _openapi_candidates_cached(
+    root: str,
+    signature: tuple[tuple[str, int], ...],
+) -> tuple[Path, ...]:
+    from .openapi_utils import find_openapi_candidates
+
+    return tuple(find_openapi_candidates(Path(root)))
+
+
+def _openapi_candidates(root: Path) -> tuple[Path, ...]:
+    """OpenAPI candidates under root, searched again only when the tree changed."""
+    return _openapi_candidates_cached(str(root), _openapi_search_signature(root))
 
-    junit_files = [Path(p) for p in artifacts.get("junit", []) if Path(p).exists()]
+
+@lru_cache(maxsize=32)
+def _route_coverage_cached(
+    spec: tuple[str, int],
+    junit: tuple[tuple[str, int], ...],
+) -> Dict[str, object] | None:
+    from .analyzers.route_coverage import build_route_coverage
+
+    return build_route_coverage(
+        openapi_path=spec[0],
+        junit_files=[Path(path) for path, _ in junit],
+    )
+
+
+def summarize_api_coverage(artifacts: Dict[str, List[str]]) -> Dict[str, object] | None:
+    junit_files = [Path(p) for p in artifacts.get("junit", ()) if os.path.exists(p)]
     if not junit_files:
         return None
 
-    # Pick a spec file if available
+    # Pick a spec file if available. The candidate search is cached until a
+    # directory or .yaml file under the working directory changes.
     spec_path: str | None = None
-    cands = find_openapi_candidates(Path.cwd())
+    try:
+        cands = _openapi_candidates(Path.cwd())
+    except Exception:
+        return None
     if cands:
         spec_path = cands[0].as_posix()
     if not spec_path:
         return None
 
+    # Unchanged spec and JUnit files (same paths and mtimes) reuse the
+    # previous coverage computation.
     try:
-        summary = build_route_coverage(
-            openapi_path=spec_path,
-            junit_files=junit_files,
-        )
+        spec_key = (spec_path, os.stat(spec_path).st_mtime_ns)
+        junit_key = tuple((os.path.abspath(p), p.stat().st_mtime_ns) for p in junit_files)
+        summary = _route_coverage_cached(spec_key, junit_key)
     except Exception:
         return None
 
@@ -846,7 +953,7 @@ def summarize_api_coverage(artifacts: Dict[str, List[str]]) -> Dict[str, object]
         "covered": summary.get("covered", 0),
         "total": summary.get("total", 0),
         "pct": summary.get("pct", 0.0),
-        "uncovered_samples": summary.get("uncovered_samples", []),
-        "priority_uncovered_samples": summary.get("priority_uncovered_samples", []),
-        "uncovered": summary.get("uncovered", []),
+        "uncovered_samples": list(summary.get("uncovered_samples", [])),
+        "priority_uncovered_samples": list(summary.get("priority_uncovered_samples", [])),
+        "uncovered": list(summary.get("uncovered", [])),
     }
@@ -4,9 +4,11 @@ Provides TestCase, TestResult models and TestRunner ABC.
 """
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -24,6 +26,25 @@ class TestCase(BaseModel):
     route: Optional[str] = None
 
 
+# TestResult counter field incremented for each TestCase status
+STATUS_COUNT_FIELDS: Dict[str, str] = {
+    "passed": "passed",
+    "failed": "failed",
+    "error": "errors",
+    "skipped": "skipped",
+}
+
+
+def tally_cases(cases: Iterable[TestCase]) -> Tuple[Dict[str, int], float]:
+    """Count cases per TestResult counter field and sum durations in one pass."""
+    counts = dict.fromkeys(STATUS_COUNT_FIELDS.values(), 0)
+    duration = 0.0
+    for case in cases:
+        counts[STATUS_COUNT_FIELDS[case.status]] += 1
+        duration += case.duration
+    return counts, duration
+
+
 class TestResult(BaseModel):
     """Aggregated result from running a test suite."""
     suite_name: str
@@ -45,6 +66,13 @@ class TestResult(BaseModel):
     def success(self) -> bool:
         return self.failed == 0 and self.errors == 0
 
+    def __iadd__(self, other: "TestResult") -> "TestResult":
+        """Accumulate another result's counters and duration (cases are not merged)."""
+        for counter in STATUS_COUNT_FIELDS.values():
+            setattr(self, counter, getattr(self, counter) + getattr(other, counter))
+        self.duration += other.duration
+        return self
+
 
 class TestRunner(ABC):
     """Abstract base for test suite runners."""
@@ -62,12 +90,28 @@ class TestRunner(ABC):
         self.run_settings = run_settings or RunSettings()
         self.base_url = base_url or ""
         self.output_dir = output_dir or Path("reports")
+        self._created_dirs: Set[Path] = set()
 
     @abstractmethod
-    def run(self, test_path: Path, **kwargs: Any) -> TestResult:
-        """Execute tests and return structured results."""
+    def run(
+        self,
+        test_path: Path,
+        only: Optional[List[TestCase]] = None,
+        **kwargs: Any,
+    ) -> TestResult:
+        """Execute tests and return structured results.
+
+        When `only` is given, runners restrict the run to those test cases
+        (taken from a previous result) where they can select them.
+        """
         ...
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create path once per runner; repeat runs (retries) skip the mkdir."""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+
     @abstractmethod
     def parse_results(self, junit_path: Path, stdout: str = "") -> TestResult:
         """Parse JUnit XML + stdout into a TestResult."""
@@ -80,43 +124,28 @@ class TestRunner(ABC):
         Detects param patterns like `_id`, `_pk`, `_slug`, `_uuid` and
         merges them with the preceding segment into `{resource_id}`.
         """
-        name = test_name.lower()
-        for prefix in ("test_",):
-            if name.startswith(prefix):
-                name = name[len(prefix):]
-                break
-
-        # Try to extract method
-        methods = ("get", "post", "put", "patch", "delete")
-        method = None
-        for m in methods:
-            if name.startswith(m + "_"):
-                method = m.upper()
-                name = name[len(m) + 1:]
-                break
-
-        if not method:
-            return None
-
-        # Remove suffix (success, invalid_data, etc.)
-        for suffix in ("_success", "_invalid_data", "_invalid_params", "_error"):
-            if name.endswith(suffix):
-                name = name[: -len(suffix)]
-                break
-
-        # Convert underscores to path segments, detecting param patterns
-        tokens = name.split("_")
-        segments: list[str] = []
-        param_suffixes = {"id", "pk", "slug", "uuid"}
-        i = 0
-        while i < len(tokens):
-            # Check if next token is a param suffix (e.g., "pet" + "id" -> {pet_id})
-            if i + 1 < len(tokens) and tokens[i + 1] in param_suffixes:
-                segments.append("{" + tokens[i] + "_" + tokens[i + 1] + "}")
-                i += 2
-            else:
-                segments.append(tokens[i])
-                i += 1
-
-        path = "/" + "/".join(segments)
-        return f"{method} {path}"
+        return _route_for_test_name(test_name.lower())
+
+
+# test_<method>_<path tokens>[_<outcome suffix>]
+_ROUTE_RE = re.compile(
+    r"(?:test_)?(get|post|put|patch|delete)_(.*?)(?:_(?:success|invalid_data|invalid_params|error))?",
+    re.S,
+)
+# One path segment per match: either "<name>_<param suffix>" merged into a
+# placeholder, or a plain underscore-delimited token.
+_SEGMENT_RE = re.compile(r"(?:^|_)(?:([^_]*)_(id|pk|slug|uuid)(?=_|$)|([^_]*))", re.S)
+
+
+@lru_cache(maxsize=4096)
+def _route_for_test_name(name: str) -> Optional[str]:
+    match = _ROUTE_RE.fullmatch(name)
+    if match is None:
+        return None
+
+    method, rest = match.groups()
+    segments = [
+        "{" + m.group(1) + "_" + m.group(2) + "}" if m.group(2) else m.group(3)
+        for m in _SEGMENT_RE.finditer(rest)
+    ]
+    return f"{method.upper()} /" + "/".join(segments)
@@ -1,23 +1,61 @@
 """Behave BDD test runner."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import logging
+import os
+import re
 from pathlib import Path
-from typing import Any
+from typing import Any, List, Optional
 
-from qaagent.runners.base import TestResult, TestRunner
+from qaagent.runners.base import TestCase, TestResult, TestRunner, tally_cases
 from qaagent.runners.junit_parser import parse_junit_xml
 from qaagent.tools import CmdResult, run_command, which
 
 logger = logging.getLogger(__name__)
 
+# Below this many feature files a thread pool costs more than it saves.
+_PARALLEL_PARSE_THRESHOLD = 3
+
+# Smallest document that can hold a test case is
+# "<testsuite><testcase/></testsuite>" (34 bytes); anything at or below
+# this size cannot contribute cases and is not worth opening.
+_MIN_JUNIT_BYTES = 32
+
+
+def _junit_files(junit_dir: Path) -> list[Path]:
+    """Return the feature XML files in junit_dir that may contain test cases."""
+    with os.scandir(junit_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".xml")
+            and entry.is_file()
+            and entry.stat().st_size > _MIN_JUNIT_BYTES
+        )
+
+
+def _has_xml_file(junit_dir: Path) -> bool:
+    """Return True as soon as any XML file is found in junit_dir."""
+    try:
+        with os.scandir(junit_dir) as entries:
+            return any(entry.name.endswith(".xml") and entry.is_file() for entry in entries)
+    except OSError:
+        return False
+
 
 class BehaveRunner(TestRunner):
     """Run Behave BDD tests and parse results."""
 
     runner_name = "behave"
 
-    def run(self, test_path: Path, **kwargs: Any) -> TestResult:
+    def run(
+        self,
+        test_path: Path,
+        only: Optional[List[TestCase]] = None,
+        **kwargs: Any,
+    ) -> TestResult:
         if not which("python"):
             return TestResult(
                 suite_name=test_path.name,
@@ -28,7 +66,7 @@ class BehaveRunner(TestRunner):
             )
 
         junit_dir = self.output_dir / "behave-junit"
-        junit_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(junit_dir)
 
         abs_test_path = test_path.resolve()
         cmd = [
@@ -38,6 +76,10 @@ class BehaveRunner(TestRunner):
             f"--junit-directory={junit_dir}",
             "--no-capture",
         ]
+        if only:
+            # --name takes a regex and may be repeated; scenarios matching any run.
+            for name in dict.fromkeys(case.name for case in only):
+                cmd.append(f"--name={re.escape(name)}")
 
         result = run_command(
             cmd,
@@ -51,38 +93,38 @@ class BehaveRunner(TestRunner):
         # Behave produces one XML file per feature in the junit dir
         all_cases = []
         if junit_path.is_dir():
-            for xml_file in sorted(junit_path.glob("*.xml")):
-                all_cases.extend(parse_junit_xml(xml_file))
+            xml_files = _junit_files(junit_path)
+            if len(xml_files) >= _PARALLEL_PARSE_THRESHOLD:
+                max_workers = min(8, os.cpu_count() or 4, len(xml_files))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    parsed = list(executor.map(parse_junit_xml, xml_files))
+            else:
+                parsed = [parse_junit_xml(xml_file) for xml_file in xml_files]
+            all_cases = list(itertools.chain.from_iterable(parsed))
         elif junit_path.is_file():
             all_cases = parse_junit_xml(junit_path)
 
-        passed = sum(1 for c in all_cases if c.status == "passed")
-        failed = sum(1 for c in all_cases if c.status == "failed")
-        errors = sum(1 for c in all_cases if c.status == "error")
-        skipped = sum(1 for c in all_cases if c.status == "skipped")
-        duration = sum(c.duration for c in all_cases)
+        counts, duration = tally_cases(all_cases)
 
-        return TestResult(
+        # Counts and cases come from the parser already typed; skip validation.
+        return TestResult.model_construct(
             suite_name="behave",
             runner=self.runner_name,
-            passed=passed,
-            failed=failed,
-            errors=errors,
-            skipped=skipped,
+            **counts,
             duration=duration,
             cases=all_cases,
             artifacts={"junit_dir": str(junit_path)},
-            returncode=0 if (failed == 0 and errors == 0) else 1,
+            returncode=0 if (counts["failed"] == 0 and counts["errors"] == 0) else 1,
         )
 
     def _build_result(self, suite_name: str, cmd_result: CmdResult, junit_dir: Path) -> TestResult:
-        if junit_dir.exists() and any(junit_dir.glob("*.xml")):
+        if _has_xml_file(junit_dir):
             result = self.parse_results(junit_dir, cmd_result.stdout)
             result.suite_name = suite_name
             result.returncode = cmd_result.returncode
             return result
 
-        return TestResult(
+        return TestResult.model_construct(
             suite_name=suite_name,
             runner=self.runner_name,
             returncode=cmd_result.returncode,
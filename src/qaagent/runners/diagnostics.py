@@ -5,8 +5,11 @@ Falls back to structured error summaries when LLM is unavailable.
 """
 from __future__ import annotations
 
+import json
 import logging
 import re
+from collections import Counter
+from enum import Enum
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
@@ -16,14 +19,26 @@ from qaagent.runners.base import TestCase, TestResult
 
 logger = logging.getLogger(__name__)
 
-# Failure categories
-CATEGORY_ASSERTION = "assertion"
-CATEGORY_TIMEOUT = "timeout"
-CATEGORY_CONNECTION = "connection"
-CATEGORY_AUTH = "auth"
-CATEGORY_DATA = "data"
-CATEGORY_FLAKY = "flaky"
-CATEGORY_UNKNOWN = "unknown"
+class FailureCategory(str, Enum):
+    ASSERTION = "assertion"
+    TIMEOUT = "timeout"
+    CONNECTION = "connection"
+    AUTH = "auth"
+    DATA = "data"
+    FLAKY = "flaky"
+    UNKNOWN = "unknown"
+
+
+# Failure categories as plain strings, as stored on DiagnosticResult
+CATEGORY_ASSERTION = FailureCategory.ASSERTION.value
+CATEGORY_TIMEOUT = FailureCategory.TIMEOUT.value
+CATEGORY_CONNECTION = FailureCategory.CONNECTION.value
+CATEGORY_AUTH = FailureCategory.AUTH.value
+CATEGORY_DATA = FailureCategory.DATA.value
+CATEGORY_FLAKY = FailureCategory.FLAKY.value
+CATEGORY_UNKNOWN = FailureCategory.UNKNOWN.value
+
+_VALID_CATEGORIES = frozenset(category.value for category in FailureCategory)
 
 
 class DiagnosticResult(BaseModel):
@@ -43,15 +58,81 @@ class RunDiagnosticSummary(BaseModel):
     summary_text: str = ""
 
 
-# Patterns for heuristic classification
-_PATTERNS = [
+# Test statuses that count as failures for diagnosis
+_FAILURE_STATUSES = frozenset(("failed", "error"))
+
+# Patterns for heuristic classification, highest priority first
+_PATTERNS = (
     (CATEGORY_TIMEOUT, re.compile(r"timeout|timed?\s*out|TimeoutError|deadline exceeded", re.I)),
-    (CATEGORY_CONNECTION, re.compile(r"connection\s*(refused|reset|error)|ECONNREFUSED|socket|network", re.I)),
+    (CATEGORY_CONNECTION, re.compile(r"connection\s*(?:refused|reset|error)|ECONNREFUSED|socket|network", re.I)),
     (CATEGORY_AUTH, re.compile(r"401|403|unauthorized|forbidden|authentication|permission denied", re.I)),
     (CATEGORY_DATA, re.compile(r"404|not found|null|undefined|missing.*field|KeyError", re.I)),
     (CATEGORY_FLAKY, re.compile(r"flaky|intermittent|race condition|stale element", re.I)),
-    (CATEGORY_ASSERTION, re.compile(r"assert(ion)?|AssertionError|Expected.*but got|not equal", re.I)),
-]
+    (CATEGORY_ASSERTION, re.compile(r"assert(?:ion)?|AssertionError|Expected.*?but got|not equal", re.I)),
+)
+
+# All patterns in one regex, each wrapped in a lookahead so a match never
+# consumes text another category could match. A single scan therefore sees
+# every category present, and the earliest one in _PATTERNS wins as before.
+_COMBINED_PATTERN = re.compile(
+    "(?=" + "|".join(f"(?P<{cat}>{pattern.pattern})" for cat, pattern in _PATTERNS) + ")",
+    re.I,
+)
+_PATTERN_PRIORITY = {cat: rank for rank, (cat, _) in enumerate(_PATTERNS)}
+
+# Classification signals sit near the top of captured output; bound the
+# scan so multi-megabyte captures don't dominate heuristic analysis.
+_OUTPUT_SCAN_LIMIT = 8192
+
+
+def _classify(text: str) -> str:
+    """Return the highest-priority category whose pattern occurs in text."""
+    best: Optional[int] = None
+    for match in _COMBINED_PATTERN.finditer(text):
+        rank = _PATTERN_PRIORITY[match.lastgroup]
+        if best is None or rank < best:
+            best = rank
+            if rank == 0:
+                break
+    return _PATTERNS[best][0] if best is not None else CATEGORY_UNKNOWN
+
+
+# "KEY: value" lines, possibly indented, in a single-failure LLM diagnostic response
+_LLM_FIELD_RE = re.compile(
+    r"^[ \t]*(ROOT_CAUSE|CATEGORY|SUGGESTION|CONFIDENCE)\s*:(.*)$", re.M | re.I,
+)
+
+# Marks an LLM client that was tried and found unavailable
+_LLM_UNAVAILABLE = object()
+
+# Failures sent to the LLM per batched diagnostic request
+_LLM_BATCH_SIZE = 20
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a surrounding Markdown code fence from an LLM response."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        if text.rstrip().endswith("```"):
+            text = text.rstrip()[:-3]
+    return text.strip()
+
+
+def _failure_fingerprint(case: TestCase) -> tuple[str, str, str]:
+    """Key identifying failures that would receive the same diagnosis.
+
+    The full message is part of the key because it becomes the root cause.
+    The head of the output (as much as the heuristic scans) only takes part
+    when the message alone does not classify the failure, since the
+    heuristic classifier then falls back to the output.
+    """
+    message = case.error_message or ""
+    if message and _classify(message) != CATEGORY_UNKNOWN:
+        output = ""
+    else:
+        output = (case.output or "")[:_OUTPUT_SCAN_LIMIT]
+    return (case.status, message, output)
 
 
 class FailureDiagnostics:
@@ -60,10 +141,21 @@ class FailureDiagnostics:
     def __init__(self, llm_settings: Optional[LLMSettings] = None) -> None:
         self.llm_settings = llm_settings or LLMSettings()
         self._llm_client = None
+        # Whether the last summarize_run() came entirely from the LLM, with
+        # no heuristic fallback for any failure or for the summary text
+        self.used_llm = False
+        self._llm_fell_back = False
 
     def _get_llm(self):
-        """Lazy-init the LLM client."""
+        """Lazy-init the LLM client.
+
+        A failed or unavailable client is remembered, so later calls return
+        None without constructing and probing it again.
+        """
+        if self._llm_client is _LLM_UNAVAILABLE:
+            return None
         if self._llm_client is None and self.llm_settings.enabled:
+            self._llm_client = _LLM_UNAVAILABLE
             try:
                 from qaagent.llm import LLMClient
                 client = LLMClient(
@@ -74,6 +166,8 @@ class FailureDiagnostics:
                     self._llm_client = client
             except Exception:
                 logger.debug("LLM client not available for diagnostics")
+            if self._llm_client is _LLM_UNAVAILABLE:
+                return None
         return self._llm_client
 
     def analyze_failure(
@@ -85,39 +179,69 @@ class FailureDiagnostics:
 
         Uses LLM if available, otherwise falls back to heuristic pattern matching.
         """
-        llm = self._get_llm()
+        return self._analyze_failure_with(case, self._get_llm(), test_code)
+
+    def _analyze_failure_with(
+        self,
+        case: TestCase,
+        llm,
+        test_code: Optional[str] = None,
+    ) -> DiagnosticResult:
+        """Analyze a failure with an already-resolved LLM client (or None)."""
         if llm is not None:
             return self._analyze_with_llm(case, test_code, llm)
         return self._analyze_heuristic(case)
 
     def summarize_run(self, suites: dict[str, TestResult]) -> RunDiagnosticSummary:
         """Produce a diagnostic summary for an entire test run."""
-        all_failures: List[TestCase] = []
+        # One streaming pass over the cases: keep only failure names, their
+        # fingerprints, and one representative per fingerprint. Failures with
+        # the same status and error are diagnosed once and the result shared,
+        # so a single broken endpoint costs one analysis.
+        failure_names: List[str] = []
+        fingerprints: List[tuple[str, str, str]] = []
+        unique: dict[tuple[str, str, str], TestCase] = {}
         for suite_result in suites.values():
             for tc in suite_result.cases:
-                if tc.status in ("failed", "error"):
-                    all_failures.append(tc)
-
-        if not all_failures:
+                if tc.status not in _FAILURE_STATUSES:
+                    continue
+                fingerprint = _failure_fingerprint(tc)
+                failure_names.append(tc.name)
+                fingerprints.append(fingerprint)
+                unique.setdefault(fingerprint, tc)
+
+        self.used_llm = False
+        self._llm_fell_back = False
+        if not failure_names:
             return RunDiagnosticSummary(
                 summary_text="All tests passed. No failures to diagnose.",
             )
+        representatives = list(unique.values())
 
-        diagnostics = [self.analyze_failure(tc) for tc in all_failures]
-
-        categories: dict[str, int] = {}
-        for d in diagnostics:
-            categories[d.category] = categories.get(d.category, 0) + 1
+        llm = self._get_llm()
+        unique_diagnostics = None
+        if llm is not None and len(representatives) > 1:
+            unique_diagnostics = self._analyze_batch_with_llm(representatives, llm)
+        if unique_diagnostics is None:
+            unique_diagnostics = [self._analyze_failure_with(tc, llm) for tc in representatives]
+
+        by_fingerprint = dict(zip(unique, unique_diagnostics))
+        diagnostics = [by_fingerprint[fingerprint] for fingerprint in fingerprints]
+        # Count in C per fingerprint, then fold into categories per group.
+        category_counts: Counter[str] = Counter()
+        for fingerprint, count in Counter(fingerprints).items():
+            category_counts[by_fingerprint[fingerprint].category] += count
+        categories = dict(category_counts)
 
         # Build summary text
-        llm = self._get_llm()
         if llm is not None:
-            summary_text = self._summarize_with_llm(all_failures, diagnostics, llm)
+            summary_text = self._summarize_with_llm(failure_names, diagnostics, llm)
         else:
-            summary_text = self._summarize_heuristic(all_failures, diagnostics, categories)
+            summary_text = self._summarize_heuristic(failure_names, diagnostics, categories)
+        self.used_llm = llm is not None and not self._llm_fell_back
 
         return RunDiagnosticSummary(
-            total_failures=len(all_failures),
+            total_failures=len(failure_names),
             categories=categories,
             diagnostics=diagnostics,
             summary_text=summary_text,
@@ -125,13 +249,14 @@ class FailureDiagnostics:
 
     def _analyze_heuristic(self, case: TestCase) -> DiagnosticResult:
         """Classify failure using regex patterns."""
-        text = f"{case.error_message or ''} {case.output or ''}"
+        # The error message usually carries the signal, so only fall back to
+        # (the head of) the captured output when the message says nothing.
         category = CATEGORY_UNKNOWN
-
-        for cat, pattern in _PATTERNS:
-            if pattern.search(text):
-                category = cat
-                break
+        for text in (case.error_message, (case.output or "")[:_OUTPUT_SCAN_LIMIT]):
+            if text:
+                category = _classify(text)
+                if category != CATEGORY_UNKNOWN:
+                    break
 
         suggestions = {
             CATEGORY_ASSERTION: "Check expected values against actual API response or UI state.",
@@ -189,23 +314,77 @@ class FailureDiagnostics:
             return self._parse_llm_diagnostic(response.content, case)
         except Exception:
             logger.debug("LLM diagnostic failed, falling back to heuristic")
+            self._llm_fell_back = True
             return self._analyze_heuristic(case)
 
+    def _analyze_batch_with_llm(
+        self,
+        failures: List[TestCase],
+        llm,
+    ) -> Optional[List[DiagnosticResult]]:
+        """Analyze several failures per LLM request.
+
+        Returns None if any batch fails or its response cannot be matched
+        up with the failures, so the caller can fall back to one request
+        per failure.
+        """
+        from qaagent.llm import ChatMessage
+
+        diagnostics: List[DiagnosticResult] = []
+        for start in range(0, len(failures), _LLM_BATCH_SIZE):
+            batch = failures[start:start + _LLM_BATCH_SIZE]
+            entries = "\n".join(
+                f"[{index}] Test: {case.name}\n"
+                f"Status: {case.status}\n"
+                f"Error: {case.error_message or 'N/A'}\n"
+                f"Output: {(case.output or 'N/A')[:500]}\n"
+                for index, case in enumerate(batch)
+            )
+            prompt = (
+                f"Analyze these {len(batch)} test failures. For each one provide "
+                "the root cause (one sentence), a category (one of: assertion, "
+                "timeout, connection, auth, data, flaky, unknown), a suggested "
+                "fix (one sentence) and a confidence (0.0-1.0).\n\n"
+                f"{entries}\n"
+                "Respond with only a JSON array with one object per failure, in "
+                'the same order, each with keys "root_cause", "category", '
+                '"suggestion" and "confidence".\n'
+            )
+
+            try:
+                response = llm.chat([
+                    ChatMessage(role="system", content="You are a QA engineer analyzing test failures."),
+                    ChatMessage(role="user", content=prompt),
+                ])
+                items = json.loads(_strip_code_fence(response.content))
+            except Exception:
+                logger.debug("Batched LLM diagnostic failed, falling back to per-failure analysis")
+                return None
+
+            if not isinstance(items, list) or len(items) != len(batch):
+                return None
+            for item, case in zip(items, batch):
+                if not isinstance(item, dict):
+                    return None
+                diagnostics.append(self._build_llm_diagnostic(
+                    {key.upper(): str(value) for key, value in item.items() if value is not None},
+                    case,
+                ))
+        return diagnostics
+
     def _parse_llm_diagnostic(self, response: str, case: TestCase) -> DiagnosticResult:
         """Parse structured LLM response into DiagnosticResult."""
-        lines = response.strip().split("\n")
-        parsed = {}
-        for line in lines:
-            for key in ("ROOT_CAUSE", "CATEGORY", "SUGGESTION", "CONFIDENCE"):
-                if line.upper().startswith(key + ":"):
-                    parsed[key] = line.split(":", 1)[1].strip()
-
-        valid_categories = {
-            CATEGORY_ASSERTION, CATEGORY_TIMEOUT, CATEGORY_CONNECTION,
-            CATEGORY_AUTH, CATEGORY_DATA, CATEGORY_FLAKY, CATEGORY_UNKNOWN,
+        parsed = {
+            match.group(1).upper(): match.group(2).strip()
+            for match in _LLM_FIELD_RE.finditer(response.strip())
         }
+
+        return self._build_llm_diagnostic(parsed, case)
+
+    def _build_llm_diagnostic(self, parsed: dict[str, str], case: TestCase) -> DiagnosticResult:
+        """Turn LLM fields keyed ROOT_CAUSE/CATEGORY/SUGGESTION/CONFIDENCE into a result."""
         category = parsed.get("CATEGORY", "").lower()
-        if category not in valid_categories:
+        if category not in _VALID_CATEGORIES:
             category = CATEGORY_UNKNOWN
 
         try:
@@ -223,7 +402,7 @@ class FailureDiagnostics:
 
     def _summarize_with_llm(
         self,
-        failures: List[TestCase],
+        failure_names: List[str],
         diagnostics: List[DiagnosticResult],
         llm,
     ) -> str:
@@ -231,9 +410,9 @@ class FailureDiagnostics:
         from qaagent.llm import ChatMessage
 
         failure_lines = []
-        for tc, diag in zip(failures, diagnostics):
+        for name, diag in zip(failure_names, diagnostics):
             failure_lines.append(
-                f"- {tc.name}: [{diag.category}] {diag.root_cause}"
+                f"- {name}: [{diag.category}] {diag.root_cause}"
             )
         failures_text = "\n".join(failure_lines[:20])  # Cap at 20
 
@@ -250,19 +429,20 @@ class FailureDiagnostics:
             ])
             return response.content.strip()
         except Exception:
-            return self._summarize_heuristic(failures, diagnostics, {})
+            self._llm_fell_back = True
+            return self._summarize_heuristic(failure_names, diagnostics, {})
 
     def _summarize_heuristic(
         self,
-        failures: List[TestCase],
+        failure_names: List[str],
         diagnostics: List[DiagnosticResult],
         categories: dict[str, int],
     ) -> str:
         """Build a structured summary without LLM."""
-        parts = [f"{len(failures)} test failure(s) detected."]
+        parts = [f"{len(failure_names)} test failure(s) detected."]
 
         if categories:
-            cat_parts = [f"{count} {cat}" for cat, count in sorted(categories.items(), key=lambda x: -x[1])]
+            cat_parts = [f"{count} {cat}" for cat, count in Counter(categories).most_common()]
             parts.append(f"Breakdown: {', '.join(cat_parts)}.")
 
         # Top suggestions
@@ -4,42 +4,70 @@ Handles JUnit output from pytest, Playwright, and Behave.
 """
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+import os
 from pathlib import Path
 from typing import List
 
 from qaagent.runners.base import TestCase
 
+# lxml exposes the ElementTree API on top of libxml2 and parses noticeably
+# faster; QAAGENT_XML_BACKEND=stdlib forces the standard library parser.
+if os.environ.get("QAAGENT_XML_BACKEND", "").lower() == "stdlib":
+    import xml.etree.ElementTree as ET
+
+    LXML_AVAILABLE = False
+else:
+    try:
+        from lxml import etree as ET
+
+        LXML_AVAILABLE = True
+    except ImportError:
+        import xml.etree.ElementTree as ET
+
+        LXML_AVAILABLE = False
+
 
 def parse_junit_xml(path: Path) -> List[TestCase]:
     """Parse a JUnit XML file into a list of TestCase objects.
 
     Handles format variations from pytest, Playwright, and Behave.
     """
-    if not path.exists():
-        return []
+    cases: List[TestCase] = []
+    # Currently open elements, root first.
+    stack: List[ET.Element] = []
 
+    # Stream the document so only one <testcase> subtree is held at a time;
+    # reports from large suites can run to tens of megabytes.
     try:
-        tree = ET.parse(path)
-    except ET.ParseError:
+        for event, elem in ET.iterparse(str(path), events=("start", "end")):
+            if event == "start":
+                # Handle both <testsuites><testsuite> and bare <testsuite> roots
+                if not stack and elem.tag not in ("testsuites", "testsuite"):
+                    return []
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if elem.tag == "testcase" and _is_suite_child(stack):
+                cases.append(_parse_testcase(elem))
+                elem.clear()
+                # Detach already-parsed siblings too, so a suite with tens of
+                # thousands of cases doesn't keep as many empty elements.
+                del stack[-1][:-1]
+            elif elem.tag == "testsuite":
+                elem.clear()
+    except (ET.ParseError, OSError):
+        # Malformed, or missing (checked by opening rather than a separate stat)
         return []
 
-    root = tree.getroot()
-    cases: List[TestCase] = []
-
-    # Handle both <testsuites><testsuite> and bare <testsuite> roots
-    if root.tag == "testsuites":
-        suites = root.findall("testsuite")
-    elif root.tag == "testsuite":
-        suites = [root]
-    else:
-        return []
+    return cases
 
-    for suite in suites:
-        for tc in suite.findall("testcase"):
-            cases.append(_parse_testcase(tc))
 
-    return cases
+def _is_suite_child(stack: List[ET.Element]) -> bool:
+    """Return True if the open elements place a testcase directly in a top-level suite."""
+    if len(stack) == 1:
+        return stack[0].tag == "testsuite"
+    return len(stack) == 2 and stack[0].tag == "testsuites" and stack[1].tag == "testsuite"
 
 
 def _parse_testcase(tc: ET.Element) -> TestCase:
@@ -48,10 +76,16 @@ def _parse_testcase(tc: ET.Element) -> TestCase:
     classname = tc.get("classname")
     duration = float(tc.get("time", "0"))
 
+    # Index the first child of each tag in one pass over the (usually
+    # zero to two) children instead of a find() scan per tag.
+    children = {}
+    for child in tc:
+        children.setdefault(child.tag, child)
+
     # Determine status from child elements
-    failure = tc.find("failure")
-    error = tc.find("error")
-    skipped = tc.find("skipped")
+    failure = children.get("failure")
+    error = children.get("error")
+    skipped = children.get("skipped")
 
     if failure is not None:
         status = "failed"
@@ -71,19 +105,22 @@ def _parse_testcase(tc: ET.Element) -> TestCase:
         output = None
 
     # Capture system-out/system-err if present
-    sys_out = tc.find("system-out")
-    sys_err = tc.find("system-err")
+    sys_out = children.get("system-out")
+    sys_err = children.get("system-err")
     if output is None and sys_out is not None and sys_out.text:
         output = sys_out.text
     if sys_err is not None and sys_err.text:
         extra = sys_err.text
         output = f"{output}\n{extra}" if output else extra
 
-    return TestCase(
+    # Every value above is already typed, so skip pydantic validation;
+    # large reports produce thousands of cases.
+    return TestCase.model_construct(
         name=name,
         classname=classname,
         status=status,
         duration=duration,
         output=output,
         error_message=error_message,
+        route=None,
     )
@@ -6,19 +6,24 @@ collects artifacts, and writes evidence.
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
 import logging
+import os
+import random
 import shutil
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
+from qaagent.config.loader import get_qaagent_home
 from qaagent.config.models import LLMSettings, QAAgentProfile, RunSettings
 from qaagent.evidence.id_generator import EvidenceIDGenerator
 from qaagent.evidence.models import TestRecord
 from qaagent.evidence.run_manager import RunHandle, RunManager
 from qaagent.evidence.writer import EvidenceWriter
 from qaagent.generators.base import GenerationResult
-from qaagent.runners.base import TestCase, TestResult, TestRunner
+from qaagent.runners.base import TestCase, TestResult, TestRunner, tally_cases
 from qaagent.runners.behave_runner import BehaveRunner
 from qaagent.runners.diagnostics import FailureDiagnostics, RunDiagnosticSummary
 from qaagent.runners.playwright_runner import PlaywrightRunner
@@ -59,6 +64,91 @@ _DEFAULT_PATHS = {
 }
 
 
+# Upper bound of the random jitter added to each retry backoff, in seconds
+_RETRY_JITTER = 0.5
+
+# Concurrent file copies when collecting artifact directories
+_ARTIFACT_COPY_WORKERS = 8
+
+
+def _copy_tree_parallel(src: Path, dest: Path) -> None:
+    """Copy a directory tree like ``shutil.copytree(..., dirs_exist_ok=True)``.
+
+    The tree is walked with ``os.scandir`` and destination directories are
+    created up front; files are then copied concurrently with
+    ``shutil.copyfile`` (``sendfile`` on Linux), which matters for
+    Playwright output with hundreds of screenshots, videos and traces.
+    Timestamps and permission bits are not preserved; evidence consumers
+    only read the contents.
+    """
+    pairs: List[Tuple[str, Path]] = []
+    _scan_tree(src, dest, pairs)
+
+    if len(pairs) > 1:
+        with ThreadPoolExecutor(max_workers=min(_ARTIFACT_COPY_WORKERS, len(pairs))) as executor:
+            # Consume the iterator so copy errors propagate.
+            list(executor.map(lambda pair: shutil.copyfile(*pair), pairs))
+    else:
+        for src_file, dest_file in pairs:
+            shutil.copyfile(src_file, dest_file)
+
+
+def _scan_tree(src: Path, dest: Path, pairs: List[Tuple[str, Path]]) -> None:
+    """Create dest directories for src and collect (file, target) pairs."""
+    dest.mkdir(parents=True, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            # Symlinks are followed, as copytree's copy_function does.
+            if entry.is_dir():
+                _scan_tree(Path(entry.path), dest / entry.name, pairs)
+            else:
+                pairs.append((entry.path, dest / entry.name))
+
+
+def _merge_retry(previous: TestResult, retry: TestResult) -> TestResult:
+    """Overlay a partial retry onto the previous result and recount.
+
+    Cases the retry didn't report (it crashed, or the runner couldn't select
+    them) keep their previous outcome.
+    """
+    if not retry.cases:
+        return previous
+    retried = {(c.classname, c.name): c for c in retry.cases}
+    cases = [retried.get((c.classname, c.name), c) for c in previous.cases]
+
+    counts, _ = tally_cases(cases)
+    success = counts["failed"] == 0 and counts["errors"] == 0
+    return previous.model_copy(update={
+        **counts,
+        "cases": cases,
+        "duration": previous.duration + retry.duration,
+        "artifacts": {**previous.artifacts, **retry.artifacts},
+        "returncode": 0 if success else (retry.returncode or 1),
+    })
+
+
+def _diagnostics_cache_path(
+    suites: Dict[str, TestResult],
+    llm_settings: LLMSettings,
+) -> Optional[Path]:
+    """Cache file for an LLM diagnosis of this exact set of failures and model.
+
+    Returns None when there are no failing cases, as there is nothing to ask
+    the LLM about.
+    """
+    signature = sorted(
+        f"{suite_name}:{case.name}:{case.status}:{case.error_message or ''}"
+        for suite_name, suite_result in suites.items()
+        for case in suite_result.cases
+        if case.status in ("failed", "error")
+    )
+    if not signature:
+        return None
+    signature.append(f"{llm_settings.provider}:{llm_settings.model}")
+    digest = hashlib.blake2b("\n".join(signature).encode("utf-8"), digest_size=16).hexdigest()
+    return get_qaagent_home() / "cache" / "diagnostics" / f"{digest}.json"
+
+
 class RunOrchestrator:
     """Orchestrate test suite execution."""
 
@@ -78,6 +168,21 @@ class RunOrchestrator:
         if max_workers is not None:
             self.run_settings.max_workers = max_workers
         self._external_handle = run_handle
+        # Config is treated as fixed for the orchestrator's lifetime, so
+        # resolve suite settings and base URL once instead of per suite.
+        self._suite_settings = {
+            "unit": config.tests.unit,
+            "behave": config.tests.behave,
+            "e2e": config.tests.e2e,
+        }
+        self._base_url = self._resolve_base_url()
+        # Existing test path per suite for the current run_all call; the
+        # parallel pre-filter and the suite worker both ask for it.
+        self._test_paths: Dict[str, Optional[Path]] = {}
+        # Directories already created, and runners kept for retries, so
+        # repeat runs of a suite don't redo the mkdir calls.
+        self._created_dirs: Set[Path] = set()
+        self._runners: Dict[Tuple[str, Optional[str]], TestRunner] = {}
 
     def run_all(
         self,
@@ -97,21 +202,27 @@ class RunOrchestrator:
         handle = self._external_handle or self._create_run_handle()
         result = OrchestratorResult(run_handle=handle)
 
-        base_url = self._resolve_base_url()
+        base_url = self._base_url
+        # Start each run from a clean slate in case output dirs were removed.
+        self._test_paths = {}
+        self._created_dirs = set()
+        self._runners = {}
         if self.run_settings.parallel:
             suite_results = self._run_suites_parallel(generated, base_url)
         else:
             suite_results = self._run_suites_sequential(generated, base_url)
 
         # Evidence writes happen here, after execution completes.
+        totals = TestResult(suite_name="all", runner="orchestrator")
         for suite_name, suite_result in suite_results:
             result.suites[suite_name] = suite_result
-            result.total_passed += suite_result.passed
-            result.total_failed += suite_result.failed
-            result.total_errors += suite_result.errors
-            result.total_duration += suite_result.duration
+            totals += suite_result
             self._collect_artifacts(handle, suite_name, suite_result)
-            self._write_test_records(handle, suite_name, suite_result)
+        result.total_passed = totals.passed
+        result.total_failed = totals.failed
+        result.total_errors = totals.errors
+        result.total_duration = totals.duration
+        self._write_test_records(handle, suite_results)
 
         # Run diagnostics on failures
         if not result.success:
@@ -141,9 +252,8 @@ class RunOrchestrator:
             logger.info("Suite '%s' is disabled, skipping", suite_name)
             return None
 
-        test_path = self._resolve_test_path(suite_name, generated)
-        if test_path is None or not test_path.exists():
-            logger.info("Suite '%s': test path not found, skipping", suite_name)
+        test_path = self._existing_test_path(suite_name, generated)
+        if test_path is None:
             return None
 
         logger.info("Running suite '%s' from %s", suite_name, test_path)
@@ -155,6 +265,24 @@ class RunOrchestrator:
             )
         return suite_name, suite_result
 
+    def _existing_test_path(
+        self,
+        suite_name: str,
+        generated: Optional[Dict[str, GenerationResult]],
+    ) -> Optional[Path]:
+        """Resolve a suite's test path, or None (logged) if it does not exist.
+
+        The answer is cached for the rest of the run_all call.
+        """
+        if suite_name in self._test_paths:
+            return self._test_paths[suite_name]
+        test_path = self._resolve_test_path(suite_name, generated)
+        if test_path is None or not test_path.exists():
+            logger.info("Suite '%s': test path not found, skipping", suite_name)
+            test_path = None
+        self._test_paths[suite_name] = test_path
+        return test_path
+
     def _run_suites_sequential(
         self,
         generated: Optional[Dict[str, GenerationResult]],
@@ -174,10 +302,13 @@ class RunOrchestrator:
         base_url: Optional[str],
     ) -> List[Tuple[str, TestResult]]:
         """Run enabled suites concurrently and return suite_order output."""
+        # Drop suites with nothing to run before sizing the pool, so no
+        # worker thread is spent on a suite that would only be skipped.
         enabled_suites = [
             suite_name
             for suite_name in self.run_settings.suite_order
             if self._suite_enabled(suite_name)
+            and self._existing_test_path(suite_name, generated) is not None
         ]
         if not enabled_suites:
             return []
@@ -232,8 +363,9 @@ class RunOrchestrator:
         suite_name: str,
         test_path: Path,
         base_url: Optional[str] = None,
+        only: Optional[List[TestCase]] = None,
     ) -> TestResult:
-        """Run a single test suite."""
+        """Run a single test suite, optionally restricted to `only` these cases."""
         runner_cls = _RUNNER_MAP.get(suite_name)
         if runner_cls is None:
             logger.warning("No runner found for suite '%s'", suite_name)
@@ -244,17 +376,21 @@ class RunOrchestrator:
                 errors=1,
             )
 
-        suite_settings = self._get_suite_settings(suite_name)
-        suite_output = self.output_dir / suite_name
-        suite_output.mkdir(parents=True, exist_ok=True)
-
-        runner = runner_cls(
-            suite_settings=suite_settings,
-            run_settings=self.run_settings,
-            base_url=base_url or self._resolve_base_url(),
-            output_dir=suite_output,
-        )
+        runner_key = (suite_name, base_url or self._base_url)
+        runner = self._runners.get(runner_key)
+        if runner is None:
+            suite_output = self.output_dir / suite_name
+            self._ensure_dir(suite_output)
+            runner = runner_cls(
+                suite_settings=self._get_suite_settings(suite_name),
+                run_settings=self.run_settings,
+                base_url=runner_key[1],
+                output_dir=suite_output,
+            )
+            self._runners[runner_key] = runner
 
+        if only:
+            return runner.run(test_path, only=only)
         return runner.run(test_path)
 
     def _retry_failed(
@@ -264,20 +400,46 @@ class RunOrchestrator:
         base_url: Optional[str],
         previous: TestResult,
     ) -> TestResult:
-        """Retry failed tests up to configured max."""
+        """Retry failed tests up to configured max.
+
+        When the failing cases are known, only those are rerun and their new
+        outcomes merged into the previous result; otherwise the whole suite
+        is rerun.
+        """
         best = previous
         for attempt in range(1, self.run_settings.retry_count + 1):
             if best.success:
                 break
+            if attempt > 1:
+                time.sleep(self._retry_delay(attempt))
             logger.info(
                 "Retrying suite '%s' (attempt %d/%d)",
                 suite_name, attempt, self.run_settings.retry_count,
             )
-            retry_result = self.run_suite(suite_name, test_path, base_url)
+            failed_cases = [c for c in best.cases if c.status in ("failed", "error")]
+            if failed_cases:
+                retry_result = self.run_suite(suite_name, test_path, base_url, only=failed_cases)
+                retry_result = _merge_retry(best, retry_result)
+            else:
+                retry_result = self.run_suite(suite_name, test_path, base_url)
             if retry_result.failed < best.failed:
                 best = retry_result
         return best
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create path unless this orchestrator already has."""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter, so retries don't hit the same transient fault."""
+        settings = self.run_settings
+        if settings.retry_backoff_base <= 0:
+            return 0.0
+        backoff = min(settings.retry_backoff_max, settings.retry_backoff_base * 2 ** (attempt - 1))
+        return backoff + random.uniform(0, _RETRY_JITTER)
+
     def _create_run_handle(self) -> Optional[RunHandle]:
         """Create a RunHandle for evidence collection."""
         try:
@@ -290,9 +452,12 @@ class RunOrchestrator:
             logger.warning("Could not create evidence run handle")
             return None
 
+    def invalidate_base_url(self) -> None:
+        """Re-resolve the cached base URL after changing config.app or BASE_URL."""
+        self._base_url = self._resolve_base_url()
+
     def _resolve_base_url(self) -> Optional[str]:
-        """Get base_url from config."""
-        import os
+        """Get base_url from config (resolved once; see invalidate_base_url)."""
         for env_settings in self.config.app.values():
             if env_settings.base_url:
                 return env_settings.base_url
@@ -307,13 +472,7 @@ class RunOrchestrator:
 
     def _get_suite_settings(self, suite_name: str):
         """Get SuiteSettings for a suite name."""
-        tests = self.config.tests
-        mapping = {
-            "unit": tests.unit,
-            "behave": tests.behave,
-            "e2e": tests.e2e,
-        }
-        return mapping.get(suite_name)
+        return self._suite_settings.get(suite_name)
 
     def _resolve_test_path(
         self,
@@ -339,46 +498,100 @@ class RunOrchestrator:
         self,
         suites: Dict[str, TestResult],
     ) -> Optional[RunDiagnosticSummary]:
-        """Run failure diagnostics if there are failures."""
+        """Run failure diagnostics if there are failures.
+
+        LLM diagnoses are cached on disk keyed by the exact failure set, so a
+        rerun hitting the same failures (e.g. a misconfigured target) skips
+        the LLM entirely. Summaries where any part fell back to the heuristic
+        (no API key, provider error) are not cached, so the next run retries.
+        """
         try:
             llm_settings = getattr(self.config, "llm", LLMSettings())
+            cache_path = None
+            if llm_settings.enabled and self.run_settings.diagnostics_cache_ttl != 0:
+                cache_path = _diagnostics_cache_path(suites, llm_settings)
+            if cache_path is not None:
+                cached = self._load_cached_diagnostics(cache_path)
+                if cached is not None:
+                    return cached
+
             diag = FailureDiagnostics(llm_settings=llm_settings)
-            return diag.summarize_run(suites)
+            summary = diag.summarize_run(suites)
+            if cache_path is not None and diag.used_llm:
+                self._store_cached_diagnostics(cache_path, summary)
+            return summary
         except Exception:
             logger.warning("Diagnostics failed", exc_info=True)
             return None
 
+    def _load_cached_diagnostics(self, cache_path: Path) -> Optional[RunDiagnosticSummary]:
+        """Return a cached diagnosis if present and within the configured TTL."""
+        try:
+            ttl = self.run_settings.diagnostics_cache_ttl
+            if ttl is not None and time.time() - cache_path.stat().st_mtime > ttl:
+                cache_path.unlink(missing_ok=True)
+                return None
+            summary = RunDiagnosticSummary.model_validate_json(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        logger.info("Reusing cached diagnostics for identical failures")
+        return summary
+
+    def _store_cached_diagnostics(self, cache_path: Path, summary: RunDiagnosticSummary) -> None:
+        """Write a diagnosis to the cache, evicting entries past the TTL."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            ttl = self.run_settings.diagnostics_cache_ttl
+            if ttl is not None:
+                cutoff = time.time() - ttl
+                with os.scandir(cache_path.parent) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+            cache_path.write_text(summary.model_dump_json(), encoding="utf-8")
+        except OSError:
+            logger.debug("Could not cache diagnostics at %s", cache_path, exc_info=True)
+
     def _write_test_records(
         self,
         handle: Optional[RunHandle],
-        suite_name: str,
-        result: TestResult,
+        suite_results: List[Tuple[str, TestResult]],
     ) -> None:
-        """Write a TestRecord per test case into evidence."""
-        if handle is None or not result.cases:
+        """Write a TestRecord per test case into evidence in a single batch."""
+        if handle is None or not any(result.cases for _, result in suite_results):
             return
 
         try:
             id_gen = EvidenceIDGenerator(handle.run_id)
-            writer = EvidenceWriter(handle)
-            records = []
-            for case in result.cases:
-                record = TestRecord(
-                    test_id=id_gen.next_id("tst"),
-                    kind=suite_name,
-                    name=case.name,
-                    status=case.status,
-                    suite_name=suite_name,
-                    runner_type=result.runner,
-                    duration=case.duration,
-                    route=case.route,
-                    error_message=case.error_message,
-                )
-                records.append(record.to_dict())
-            writer.write_records("tests", records)
+            records: List[Dict[str, object]] = []
+            for suite_name, result in suite_results:
+                records.extend(self._build_test_records(id_gen, suite_name, result))
+            EvidenceWriter(handle).write_records("tests", records)
         except Exception:
             logger.warning("Could not write test records to evidence", exc_info=True)
 
+    @staticmethod
+    def _build_test_records(
+        id_gen: EvidenceIDGenerator,
+        suite_name: str,
+        result: TestResult,
+    ) -> List[Dict[str, object]]:
+        """Build TestRecord dicts for a suite's test cases (no I/O)."""
+        return [
+            TestRecord(
+                test_id=id_gen.next_id("tst"),
+                kind=suite_name,
+                name=case.name,
+                status=case.status,
+                suite_name=suite_name,
+                runner_type=result.runner,
+                duration=case.duration,
+                route=case.route,
+                error_message=case.error_message,
+            ).to_dict()
+            for case in result.cases
+        ]
+
     def _persist_diagnostics(
         self,
         handle: RunHandle,
@@ -412,8 +625,8 @@ class RunOrchestrator:
             artifact_path = Path(artifact_path_str)
             if artifact_path.exists():
                 dest = handle.artifacts_dir / suite_name / artifact_name
-                dest.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(dest.parent)
                 if artifact_path.is_dir():
-                    shutil.copytree(artifact_path, dest, dirs_exist_ok=True)
+                    _copy_tree_parallel(artifact_path, dest)
                 else:
                     shutil.copy2(artifact_path, dest)
@@ -2,22 +2,38 @@
 from __future__ import annotations
 
 import logging
+import re
 from pathlib import Path
-from typing import Any
+from typing import Any, List, Optional, Set
 
-from qaagent.runners.base import TestResult, TestRunner
+from qaagent.runners.base import TestCase, TestResult, TestRunner, tally_cases
 from qaagent.runners.junit_parser import parse_junit_xml
 from qaagent.tools import CmdResult, run_command, which
 
 logger = logging.getLogger(__name__)
 
+# Separator Playwright's JUnit reporter puts between describe blocks and the test title
+_TITLE_SEPARATOR = " › "
+
+# Prefer the local npm cache and skip the audit/funding network round-trips
+_NPM_INSTALL_FLAGS = ("--prefer-offline", "--no-audit", "--no-fund")
+
 
 class PlaywrightRunner(TestRunner):
     """Run Playwright TypeScript tests and parse results."""
 
     runner_name = "playwright"
 
-    def run(self, test_path: Path, **kwargs: Any) -> TestResult:
+    # Project directories whose npm dependencies were checked (and installed
+    # if missing) in this process
+    _installed: Set[Path] = set()
+
+    def run(
+        self,
+        test_path: Path,
+        only: Optional[List[TestCase]] = None,
+        **kwargs: Any,
+    ) -> TestResult:
         if not which("npx"):
             return TestResult(
                 suite_name=test_path.name,
@@ -31,14 +47,10 @@ class PlaywrightRunner(TestRunner):
         if test_path.is_file():
             project_dir = test_path.parent
 
-        # Install npm deps if node_modules missing
-        node_modules = project_dir / "node_modules"
-        if not node_modules.exists() and (project_dir / "package.json").exists():
-            logger.info("Installing npm dependencies for Playwright project")
-            run_command(["npm", "install"], cwd=project_dir, timeout=120)
+        self._install_dependencies(project_dir)
 
         junit_path = self.output_dir / "playwright-junit.xml"
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.output_dir)
 
         env = {"PLAYWRIGHT_JUNIT_OUTPUT_FILE": str(junit_path)}
         if self.base_url:
@@ -48,6 +60,11 @@ class PlaywrightRunner(TestRunner):
             "npx", "playwright", "test",
             "--reporter=junit",
         ]
+        # Playwright parallelises on its own; only override when configured.
+        if self.run_settings.workers:
+            cmd.append(f"--workers={self.run_settings.workers}")
+        if only:
+            cmd.append(f"--grep={_grep_pattern(only)}")
 
         result = run_command(
             cmd,
@@ -58,25 +75,42 @@ class PlaywrightRunner(TestRunner):
 
         return self._build_result(test_path.name, result, junit_path)
 
+    def _install_dependencies(self, project_dir: Path) -> None:
+        """Install npm deps if node_modules is missing, at most once per project per process.
+
+        Retries and repeat runs would otherwise repeat a failed (up to two
+        minute) install every time.
+        """
+        project_dir = project_dir.resolve()
+        if project_dir in PlaywrightRunner._installed:
+            return
+        # Record the project before probing, so later runs skip the stats too.
+        PlaywrightRunner._installed.add(project_dir)
+        if (project_dir / "node_modules").exists() or not (project_dir / "package.json").exists():
+            return
+
+        logger.info("Installing npm dependencies for Playwright project")
+        # npm ci installs straight from the lockfile without resolving versions.
+        verb = "ci" if (project_dir / "package-lock.json").exists() else "install"
+        run_command(
+            ["npm", verb, *_NPM_INSTALL_FLAGS],
+            cwd=project_dir,
+            timeout=120,
+        )
+
     def parse_results(self, junit_path: Path, stdout: str = "") -> TestResult:
         cases = parse_junit_xml(junit_path)
-        passed = sum(1 for c in cases if c.status == "passed")
-        failed = sum(1 for c in cases if c.status == "failed")
-        errors = sum(1 for c in cases if c.status == "error")
-        skipped = sum(1 for c in cases if c.status == "skipped")
-        duration = sum(c.duration for c in cases)
+        counts, duration = tally_cases(cases)
 
         return TestResult(
             suite_name="playwright",
             runner=self.runner_name,
-            passed=passed,
-            failed=failed,
-            errors=errors,
-            skipped=skipped,
+            **counts,
             duration=duration,
             cases=cases,
-            artifacts={"junit": str(junit_path)} if junit_path.exists() else {},
-            returncode=0 if (failed == 0 and errors == 0) else 1,
+            # Parsed cases prove the file exists; only stat when there were none.
+            artifacts={"junit": str(junit_path)} if cases or junit_path.exists() else {},
+            returncode=0 if (counts["failed"] == 0 and counts["errors"] == 0) else 1,
         )
 
     def _build_result(self, suite_name: str, cmd_result: CmdResult, junit_path: Path) -> TestResult:
@@ -104,3 +138,9 @@ class PlaywrightRunner(TestRunner):
 
         result.artifacts = artifacts
         return result
+
+
+def _grep_pattern(cases: List[TestCase]) -> str:
+    """Build a --grep regex matching any of the given test titles."""
+    titles = dict.fromkeys(case.name.split(_TITLE_SEPARATOR)[-1] for case in cases)
+    return "|".join(re.escape(title) for title in titles)
@@ -2,23 +2,48 @@
 from __future__ import annotations
 
 import logging
+import os
+import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, List, Optional
 
-from qaagent.runners.base import TestResult, TestRunner
+from qaagent.runners.base import TestCase, TestResult, TestRunner, tally_cases
 from qaagent.runners.junit_parser import parse_junit_xml
 from qaagent.tools import CmdResult, run_command, which
 
 logger = logging.getLogger(__name__)
 
+_XDIST_PROBE = "import importlib.util, sys; sys.exit(0 if importlib.util.find_spec('xdist') else 1)"
+
+
+@lru_cache(maxsize=8)
+def _python_has_xdist(python: str) -> bool:
+    """Whether the given interpreter can import pytest-xdist, probed once per path.
+
+    The tests run under the ``python`` on PATH, which need not be the
+    interpreter qaagent itself runs in.
+    """
+    try:
+        probe = subprocess.run([python, "-c", _XDIST_PROBE], capture_output=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return probe.returncode == 0
+
 
 class PytestRunner(TestRunner):
     """Run pytest tests and parse results."""
 
     runner_name = "pytest"
 
-    def run(self, test_path: Path, **kwargs: Any) -> TestResult:
-        if not which("python"):
+    def run(
+        self,
+        test_path: Path,
+        only: Optional[List[TestCase]] = None,
+        **kwargs: Any,
+    ) -> TestResult:
+        python = which("python")
+        if not python:
             return TestResult(
                 suite_name=test_path.name,
                 runner=self.runner_name,
@@ -28,31 +53,50 @@ class PytestRunner(TestRunner):
             )
 
         junit_path = self.output_dir / "pytest-junit.xml"
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.output_dir)
 
         abs_test_path = test_path.resolve()
+        # One stat for the file/directory question; both uses below need it.
+        is_file = abs_test_path.is_file()
+        targets = [str(abs_test_path)]
+        if only:
+            node_ids = _node_ids(abs_test_path.parent if is_file else abs_test_path, only)
+            if node_ids:
+                targets = node_ids
         cmd = [
             "python", "-m", "pytest",
-            str(abs_test_path),
+            *targets,
             f"--junitxml={junit_path}",
             "-q",
+            *self._xdist_args(python),
         ]
 
         result = run_command(
             cmd,
-            cwd=abs_test_path.parent if abs_test_path.is_file() else None,
+            cwd=abs_test_path.parent if is_file else None,
             timeout=self.run_settings.timeout,
         )
 
         return self._build_result(test_path.name, result, junit_path)
 
+    def _xdist_args(self, python: str) -> List[str]:
+        """Return pytest-xdist sharding options, or nothing to run serially.
+
+        Uses run.workers when set (1 disables sharding), otherwise leaves two
+        cores free. Sharding is only used when `python`, the interpreter that
+        runs the tests, has xdist installed. --dist=loadfile keeps each
+        module's tests, and their module-scoped fixtures, on one worker.
+        """
+        workers = self.run_settings.workers
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 2) - 2)
+        if workers <= 1 or not _python_has_xdist(python):
+            return []
+        return ["-n", str(workers), "--dist=loadfile"]
+
     def parse_results(self, junit_path: Path, stdout: str = "") -> TestResult:
         cases = parse_junit_xml(junit_path)
-        passed = sum(1 for c in cases if c.status == "passed")
-        failed = sum(1 for c in cases if c.status == "failed")
-        errors = sum(1 for c in cases if c.status == "error")
-        skipped = sum(1 for c in cases if c.status == "skipped")
-        duration = sum(c.duration for c in cases)
+        counts, duration = tally_cases(cases)
 
         # Map test names to routes
         for case in cases:
@@ -62,14 +106,12 @@ class PytestRunner(TestRunner):
         return TestResult(
             suite_name="pytest",
             runner=self.runner_name,
-            passed=passed,
-            failed=failed,
-            errors=errors,
-            skipped=skipped,
+            **counts,
             duration=duration,
             cases=cases,
-            artifacts={"junit": str(junit_path)} if junit_path.exists() else {},
-            returncode=0 if (failed == 0 and errors == 0) else 1,
+            # Parsed cases prove the file exists; only stat when there were none.
+            artifacts={"junit": str(junit_path)} if cases or junit_path.exists() else {},
+            returncode=0 if (counts["failed"] == 0 and counts["errors"] == 0) else 1,
         )
 
     def _build_result(self, suite_name: str, cmd_result: CmdResult, junit_path: Path) -> TestResult:
@@ -88,3 +130,40 @@ class PytestRunner(TestRunner):
             cases=[],
             artifacts={},
         )
+
+
+def _node_ids(test_dir: Path, cases: List[TestCase]) -> Optional[List[str]]:
+    """Rebuild pytest node IDs for JUnit test cases, or None if any can't be found.
+
+    pytest writes ``classname`` as the rootdir-relative module path with
+    dots for slashes, followed by any class names (``tests.test_pets.TestGet``).
+    The rootdir isn't known here, so the module is looked up under the test
+    directory and each of its parents.
+    """
+    bases = [test_dir, *test_dir.parents]
+    prefixes: Dict[str, Optional[str]] = {}
+    node_ids = []
+    for case in cases:
+        classname = case.classname or ""
+        if classname not in prefixes:
+            prefixes[classname] = _node_prefix(bases, classname)
+        prefix = prefixes[classname]
+        if prefix is None:
+            logger.debug("Could not locate pytest node for %s; running full suite", case.name)
+            return None
+        node_ids.append(f"{prefix}::{case.name}")
+    return node_ids
+
+
+def _node_prefix(bases: List[Path], classname: str) -> Optional[str]:
+    """Resolve a JUnit classname to ``/abs/module.py[::Class...]``."""
+    if not classname:
+        return None
+    parts = classname.split(".")
+    for base in bases:
+        # Longest module path first: "a.b.TestC" may be a/b.py::TestC or a/b/TestC.py
+        for split in range(len(parts), 0, -1):
+            module = base.joinpath(*parts[:split]).with_suffix(".py")
+            if module.is_file():
+                return "::".join([str(module), *parts[split:]])
+    return None
@@ -1,32 +1,90 @@
 from __future__ import annotations
 
-from typing import List
+import importlib.util
+import threading
+from typing import Any, List, Optional, Tuple
+
+_SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+_LOC_TAG = f"{_SITEMAP_NS}loc"
+_INDEX_TAG = f"{_SITEMAP_NS}sitemapindex"
+
+# Shared client so repeated fetches (several base URLs, sitemap-index
+# children) reuse pooled connections instead of a new TLS handshake each.
+_CLIENT: Optional[Any] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client(httpx) -> Any:
+    """Return the module's pooled httpx.Client, creating it on first use."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = httpx.Client(
+                # HTTP/2 needs the optional h2 package
+                http2=importlib.util.find_spec("h2") is not None,
+                timeout=15.0,
+                follow_redirects=True,
+            )
+        return _CLIENT
 
 
 def fetch_sitemap_urls(base_url: str, limit: int = 50) -> List[str]:
     try:
         import httpx  # type: ignore
-        import xml.etree.ElementTree as ET
     except Exception as e:  # noqa: BLE001
         raise RuntimeError(
             "Sitemap fetching requires httpx. Install API extras: pip install -e .[api]"
         ) from e
 
+    client = _get_client(httpx)
     url = base_url.rstrip("/") + "/sitemap.xml"
-    r = httpx.get(url, timeout=15.0)
-    r.raise_for_status()
-    text = r.text
-    try:
-        root = ET.fromstring(text)
-    except ET.ParseError as e:  # noqa: BLE001
-        raise RuntimeError("Invalid sitemap.xml format") from e
-
-    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-    locs = []
-    for loc in root.findall(".//sm:loc", ns):
-        if loc.text:
-            locs.append(loc.text.strip())
-            if len(locs) >= limit:
-                break
-    return locs
+    locs, is_index = _stream_locs(client, url, limit)
+    if not is_index:
+        return locs
+
+    # Sitemap index: each <loc> names a child sitemap holding the page URLs.
+    # Indexes may not nest, so children are read as plain urlsets.
+    pages: List[str] = []
+    for child_url in locs:
+        if len(pages) >= limit:
+            break
+        child_locs, _ = _stream_locs(client, child_url, limit - len(pages))
+        pages.extend(child_locs)
+    return pages
+
+
+def _stream_locs(client, url: str, limit: int) -> Tuple[List[str], bool]:
+    """Stream a sitemap and return up to `limit` <loc> values plus whether it is an index.
+
+    The response is parsed incrementally and closed as soon as `limit` locs are
+    found, so memory and transfer stay proportional to `limit`, not sitemap size.
+    """
+    import xml.etree.ElementTree as ET
 
+    locs: List[str] = []
+    is_index = False
+    root = None
+    parser = ET.XMLPullParser(events=("start", "end"))
+    with client.stream("GET", url) as r:
+        r.raise_for_status()
+        try:
+            for chunk in r.iter_bytes():
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if event == "start":
+                        if root is None:
+                            root = elem
+                            is_index = elem.tag == _INDEX_TAG
+                        continue
+                    if elem.tag == _LOC_TAG and elem.text:
+                        locs.append(elem.text.strip())
+                        if len(locs) >= limit:
+                            return locs, is_index
+                # Drop processed entries; the parser keeps its own references
+                # to any element still being built.
+                if root is not None:
+                    del root[:]
+            parser.close()
+        except ET.ParseError as e:  # noqa: BLE001
+            raise RuntimeError("Invalid sitemap.xml format") from e
+    return locs, is_index
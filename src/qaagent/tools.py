@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import codecs
+import io
+import locale
 import shutil
 import subprocess
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Deque, List, Optional
+
+# Bytes read from a child's pipe at a time
+_READ_CHUNK = 8192
+# Seconds to keep draining pipes after the child exits when a timeout was
+# given and the deadline has already passed
+_DRAIN_GRACE = 1.0
 
 
 @dataclass
@@ -15,10 +28,49 @@ class CmdResult:
     stderr: str
 
 
+@lru_cache(maxsize=64)
 def which(cmd: str) -> Optional[str]:
+    """Locate an executable on PATH, caching the answer per command.
+
+    Runners look up ``python``/``npx`` on every invocation, and each lookup
+    stats every PATH entry. PATH is assumed not to change within a process;
+    call ``which.cache_clear()`` after modifying it.
+    """
     return shutil.which(cmd)
 
 
+def _drain_tail(stream: IO[bytes], chunks: Deque[str], tail: int, lock: threading.Lock) -> None:
+    """Read stream to EOF, keeping only enough chunks to cover the last `tail` characters.
+
+    Uses read1() so output is decoded and kept as it arrives, even if the
+    pipe never reaches EOF (e.g. a grandchild still holds it open). The
+    reader may then outlive run_command, so `chunks` is only touched under
+    `lock`.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace"),
+        translate=True,
+    )
+    size = 0
+
+    def keep(chunk: str) -> None:
+        nonlocal size
+        with lock:
+            chunks.append(chunk)
+            size += len(chunk)
+            while tail > 0 and size - len(chunks[0]) >= tail:
+                size -= len(chunks.popleft())
+
+    for raw in iter(lambda: stream.read1(_READ_CHUNK), b""):
+        chunk = decoder.decode(raw)
+        if chunk:
+            keep(chunk)
+    chunk = decoder.decode(b"", final=True)
+    if chunk:
+        keep(chunk)
+    stream.close()
+
+
 def run_command(
     cmd: List[str],
     cwd: Optional[Path] = None,
@@ -26,23 +78,54 @@ def run_command(
     env: Optional[dict] = None,
     timeout: Optional[int] = None,
 ) -> CmdResult:
-    proc_env = os.environ.copy()
-    if env:
-        proc_env.update(env)
+    """Run a command and return its exit code plus the tail of stdout/stderr.
+
+    Output is streamed through reader threads into bounded buffers, so
+    verbose commands never hold more than roughly `tail` characters per
+    stream in memory. The process is killed if it outlives `timeout`, and
+    with a timeout the pipes are drained only until the deadline, since a
+    grandchild (npx wrapper, background dev server) may hold them open.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    # With no overrides the child inherits os.environ as-is; no copy needed.
+    proc_env = {**os.environ, **env} if env else None
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(cwd) if cwd else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=proc_env,
+    )
+    stdout_chunks: Deque[str] = deque()
+    stderr_chunks: Deque[str] = deque()
+    # Guards both buffers; readers left running past the deadline keep writing
+    lock = threading.Lock()
+    readers = [
+        threading.Thread(target=_drain_tail, args=(proc.stdout, stdout_chunks, tail, lock), daemon=True),
+        threading.Thread(target=_drain_tail, args=(proc.stderr, stderr_chunks, tail, lock), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
     try:
-        proc = subprocess.run(
-            cmd,
-            cwd=str(cwd) if cwd else None,
-            capture_output=True,
-            text=True,
-            env=proc_env,
-            timeout=timeout,
-        )
+        returncode = proc.wait(timeout=timeout)
     except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        # Grandchildren may still hold the pipes open; don't wait on them.
+        for reader in readers:
+            reader.join(timeout=1)
         return CmdResult(-1, "", f"Command timed out after {timeout}s")
-    stdout = proc.stdout[-tail:] if proc.stdout else ""
-    stderr = proc.stderr[-tail:] if proc.stderr else ""
-    return CmdResult(proc.returncode, stdout, stderr)
+
+    for reader in readers:
+        if deadline is None:
+            reader.join()
+        else:
+            reader.join(timeout=max(deadline - time.monotonic(), _DRAIN_GRACE))
+    with lock:
+        stdout = "".join(stdout_chunks)[-tail:]
+        stderr = "".join(stderr_chunks)[-tail:]
+    return CmdResult(returncode, stdout, stderr)
 
 
 def ensure_dir(path: Path) -> None:
@@ -13,23 +13,28 @@ from __future__ import annotations
 
 import asyncio
 import json
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 
 from qaagent import db
 from qaagent.api.middleware import AuthMiddleware
 from qaagent.config.manager import TargetManager
 from qaagent.workspace import Workspace
-from qaagent.discovery import NextJsRouteDiscoverer
-from qaagent.analyzers.risk_assessment import assess_risks
-from qaagent.dashboard import generate_dashboard
-from qaagent.openapi_gen import OpenAPIGenerator
-from qaagent.generators.unit_test_generator import UnitTestGenerator
+
+if TYPE_CHECKING:
+    from qaagent.analyzers.models import Route
+
+try:  # faster JSON encoding for broadcasts; optional
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
 
 
 app = FastAPI(title="QA Agent Web UI", version="1.0.0")
@@ -45,15 +50,31 @@ app.add_middleware(
     api_only=False,
 )
 
+# Compress JSON/HTML responses; WebSocket traffic is not affected
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+# Active WebSocket connections for real-time updates, each with a bounded
+# queue of encoded messages drained by its own sender task
+active_connections: Dict[WebSocket, asyncio.Queue[str]] = {}
+_CLIENT_QUEUE_SIZE = 100
+# Strong references to in-flight closes of lagging clients
+_closing_tasks: Set[asyncio.Task] = set()
 
-# Store active WebSocket connections for real-time updates
-active_connections: List[WebSocket] = []
+# Discovered routes per project root, tagged with the sorted (path, mtime_ns)
+# pairs of its route files so edits, additions and removals invalidate it
+_discover_cache: Dict[str, Tuple[Tuple[Tuple[str, int], ...], List[Route]]] = {}
 
 # Mount the React dashboard static files
 dashboard_dist = Path(__file__).parent / "dashboard" / "frontend" / "dist"
 if dashboard_dist.exists():
     app.mount("/assets", StaticFiles(directory=str(dashboard_dist / "assets")), name="assets")
 
+# React entry point, held in memory as (mtime_ns, body) and re-read only
+# when a rebuild changes its mtime
+dashboard_index = dashboard_dist / "index.html"
+_index_cache: Optional[Tuple[int, bytes]] = None
+
 # Mount API routers used by the React dashboard
 from qaagent.api.routes import runs, evidence, repositories, fix, doc, agent, auth, settings, branches
 app.include_router(auth.router, prefix="/api")
@@ -80,11 +101,11 @@ class CommandRequest(BaseModel):
 
 
 @app.get("/", response_class=HTMLResponse)
-async def home():
+async def home(request: Request):
     """Serve the React dashboard."""
-    dashboard_index = Path(__file__).parent / "dashboard" / "frontend" / "dist" / "index.html"
-    if dashboard_index.exists():
-        return FileResponse(dashboard_index)
+    response = _index_response(request)
+    if response is not None:
+        return response
     return HTMLResponse(
         "<h1>QA Agent Web UI</h1>"
         "<p>React dashboard not built. Run <code>npm run build</code> "
@@ -93,16 +114,56 @@ async def home():
     )
 
 
+def _index_response(request: Request) -> Optional[Response]:
+    """Serve the built index.html from memory, or None if the dashboard is not built.
+
+    Each request costs a single stat. ETag/Last-Modified come from the mtime,
+    and matching conditional requests get a bodiless 304.
+    """
+    global _index_cache
+    try:
+        mtime_ns = dashboard_index.stat().st_mtime_ns
+    except OSError:
+        return None
+    if _index_cache is None or _index_cache[0] != mtime_ns:
+        _index_cache = (mtime_ns, dashboard_index.read_bytes())
+    body = _index_cache[1]
+
+    mtime = mtime_ns // 1_000_000_000
+    etag = f'"{mtime_ns:x}-{len(body):x}"'
+    headers = {"ETag": etag, "Last-Modified": formatdate(mtime, usegmt=True)}
+    if _not_modified(request, etag, mtime):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
+
+
+def _not_modified(request: Request, etag: str, mtime: int) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no ETag was sent."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return mtime <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
 @app.get("/api/targets")
 async def list_targets():
     """Get list of configured targets."""
     manager = TargetManager()
+    active = manager.get_active()
     targets = [
         {
             "name": entry.name,
             "path": str(entry.path),
             "project_type": entry.project_type,
-            "is_active": manager.get_active() and manager.get_active().name == entry.name,
+            "is_active": active is not None and active.name == entry.name,
         }
         for entry in manager.list_targets()
     ]
@@ -172,8 +233,7 @@ async def discover_routes(request: CommandRequest):
         if not entry:
             return JSONResponse({"success": False, "error": "Target not found"}, status_code=404)
 
-        discoverer = NextJsRouteDiscoverer(entry.resolved_path())
-        routes = discoverer.discover()
+        routes = await asyncio.to_thread(_get_routes, entry)
 
         await broadcast({"type": "status", "message": f"Discovered {len(routes)} routes"})
 
@@ -198,6 +258,8 @@ async def discover_routes(request: CommandRequest):
 @app.post("/api/commands/generate-openapi")
 async def generate_openapi_endpoint(request: CommandRequest):
     """Generate OpenAPI specification."""
+    from qaagent.openapi_gen import OpenAPIGenerator, write_spec_json
+
     try:
         await broadcast({"type": "status", "message": "Discovering routes..."})
 
@@ -207,8 +269,7 @@ async def generate_openapi_endpoint(request: CommandRequest):
             return JSONResponse({"success": False, "error": "Target not found"}, status_code=404)
 
         # Discover routes
-        discoverer = NextJsRouteDiscoverer(entry.resolved_path())
-        routes = discoverer.discover()
+        routes = await asyncio.to_thread(_get_routes, entry)
 
         await broadcast({"type": "status", "message": f"Generating OpenAPI spec for {len(routes)} routes..."})
 
@@ -218,12 +279,12 @@ async def generate_openapi_endpoint(request: CommandRequest):
             title=request.params.get("title", entry.name),
             version=request.params.get("version", "1.0.0"),
         )
-        spec = generator.generate()
+        spec = await asyncio.to_thread(generator.generate)
 
         # Save to workspace
         ws = Workspace()
         output_file = ws.get_openapi_path(request.target, format="json")
-        output_file.write_text(json.dumps(spec, indent=2))
+        await asyncio.to_thread(write_spec_json, spec, output_file)
 
         await broadcast({"type": "success", "message": f"OpenAPI spec generated: {output_file}"})
 
@@ -241,6 +302,9 @@ async def generate_openapi_endpoint(request: CommandRequest):
 @app.post("/api/commands/generate-dashboard")
 async def generate_dashboard_endpoint(request: CommandRequest):
     """Generate visual dashboard."""
+    from qaagent.analyzers.risk_assessment import assess_risks
+    from qaagent.dashboard import generate_dashboard
+
     try:
         await broadcast({"type": "status", "message": "Analyzing project..."})
 
@@ -251,19 +315,19 @@ async def generate_dashboard_endpoint(request: CommandRequest):
 
         # Discover routes
         await broadcast({"type": "status", "message": "Discovering routes..."})
-        discoverer = NextJsRouteDiscoverer(entry.resolved_path())
-        routes = discoverer.discover()
+        routes = await asyncio.to_thread(_get_routes, entry)
 
         # Assess risks
         await broadcast({"type": "status", "message": "Assessing risks..."})
-        risks = assess_risks(routes)
+        risks = await asyncio.to_thread(assess_risks, routes)
 
         # Generate dashboard
         await broadcast({"type": "status", "message": "Generating dashboard..."})
         ws = Workspace()
         dashboard_path = ws.get_reports_dir(request.target) / "dashboard.html"
 
-        generate_dashboard(
+        await asyncio.to_thread(
+            generate_dashboard,
             routes=routes,
             risks=risks,
             output_path=dashboard_path,
@@ -287,6 +351,8 @@ async def generate_dashboard_endpoint(request: CommandRequest):
 @app.post("/api/commands/generate-tests")
 async def generate_tests_endpoint(request: CommandRequest):
     """Generate unit tests."""
+    from qaagent.generators.unit_test_generator import UnitTestGenerator
+
     try:
         await broadcast({"type": "status", "message": "Discovering routes..."})
 
@@ -296,8 +362,7 @@ async def generate_tests_endpoint(request: CommandRequest):
             return JSONResponse({"success": False, "error": "Target not found"}, status_code=404)
 
         # Discover routes
-        discoverer = NextJsRouteDiscoverer(entry.resolved_path())
-        routes = discoverer.discover()
+        routes = await asyncio.to_thread(_get_routes, entry)
 
         await broadcast({"type": "status", "message": f"Generating tests for {len(routes)} routes..."})
 
@@ -306,7 +371,7 @@ async def generate_tests_endpoint(request: CommandRequest):
         tests_dir = ws.get_tests_dir(request.target, test_type="unit")
 
         generator = UnitTestGenerator(routes, base_url=request.params.get("base_url", "http://localhost:3000"))
-        generated = generator.generate(tests_dir)
+        generated = await asyncio.to_thread(generator.generate, tests_dir)
 
         await broadcast({"type": "success", "message": f"Generated {generated.file_count} test files"})
 
@@ -320,6 +385,27 @@ async def generate_tests_endpoint(request: CommandRequest):
         return JSONResponse({"success": False, "error": str(e)}, status_code=400)
 
 
+def _get_routes(entry) -> List[Route]:
+    """Discover a target's routes, reusing the last result while its route files are unchanged."""
+    from qaagent.discovery import NextJsRouteDiscoverer
+
+    root = entry.resolved_path()
+    discoverer = NextJsRouteDiscoverer(root)
+    # The walk still runs each call so added/removed files are noticed; only
+    # the parse is skipped. Paths are part of the key because a replaced file
+    # can keep an older mtime (mv, cp -p, VCS checkouts).
+    route_files = discoverer.find_route_files(root)
+    signature = tuple(sorted((str(f), f.stat().st_mtime_ns) for f in route_files))
+
+    key = str(root)
+    cached = _discover_cache.get(key)
+    if cached is None or cached[0] != signature:
+        cached = (signature, discoverer.discover())
+        _discover_cache[key] = cached
+    # Callers get their own copies so nothing they change leaks into the cache
+    return [route.model_copy(deep=True) for route in cached[1]]
+
+
 @app.get("/api/reports/{target_name}/dashboard")
 async def get_dashboard(target_name: str):
     """Serve the dashboard HTML."""
@@ -337,13 +423,13 @@ async def get_dashboard(target_name: str):
 
 # Catch-all route for React Router (must be last)
 @app.get("/{full_path:path}", response_class=HTMLResponse)
-async def catch_all(full_path: str):
+async def catch_all(full_path: str, request: Request):
     """Serve React app for all non-API routes (for client-side routing)."""
     # Only serve React app for non-API routes
     if not full_path.startswith("api/"):
-        dashboard_index = Path(__file__).parent / "dashboard" / "frontend" / "dist" / "index.html"
-        if dashboard_index.exists():
-            return FileResponse(dashboard_index)
+        response = _index_response(request)
+        if response is not None:
+            return response
 
     # If it's an API route that wasn't caught, return 404
     return JSONResponse({"error": "Not found"}, status_code=404)
@@ -353,30 +439,92 @@ async def catch_all(full_path: str):
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates."""
     await websocket.accept()
-    active_connections.append(websocket)
+    queue: asyncio.Queue[str] = asyncio.Queue(maxsize=_CLIENT_QUEUE_SIZE)
+    active_connections[websocket] = queue
+    sender = asyncio.create_task(_drain(websocket, queue))
     try:
         while True:
             # Keep connection alive
             await websocket.receive_text()
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
+        pass
+    finally:
+        active_connections.pop(websocket, None)
+        sender.cancel()
+
+
+async def _drain(websocket: WebSocket, queue: asyncio.Queue[str]) -> None:
+    """Send one client's queued messages in order; drop the client if a send fails."""
+    try:
+        while True:
+            payload = await queue.get()
+            await websocket.send_text(payload)
+    except Exception:
+        active_connections.pop(websocket, None)
 
 
 async def broadcast(message: dict):
-    """Broadcast message to all connected WebSocket clients."""
-    for connection in active_connections:
+    """Broadcast message to all connected WebSocket clients.
+
+    The message is encoded once (the same compact JSON ``send_json``
+    produces) and queued for each client's sender task without awaiting
+    any send, so a slow client never delays the caller or other clients.
+    A client whose queue is full has fallen too far behind: it is dropped
+    and its socket closed rather than buffered without bound.
+    """
+    payload = _encode_message(message)
+    # Snapshot: closing a lagging client mutates the mapping
+    for connection, queue in list(active_connections.items()):
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            active_connections.pop(connection, None)
+            task = asyncio.create_task(_close_lagging(connection))
+            _closing_tasks.add(task)
+            task.add_done_callback(_closing_tasks.discard)
+
+
+async def _close_lagging(websocket: WebSocket) -> None:
+    """Close a client that could not keep up (1013: try again later)."""
+    try:
+        await websocket.close(code=1013)
+    except Exception:
+        pass
+
+
+def _encode_message(message: dict) -> str:
+    if orjson is not None:
         try:
-            await connection.send_json(message)
-        except:
+            return orjson.dumps(message).decode("utf-8")
+        except TypeError:
             pass
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
 
 
 def start_web_ui(host: str = "0.0.0.0", port: int = 8080):
-    """Start the web UI server."""
-    import uvicorn
+    """Start the web UI server.
+
+    Runs under Granian when it is installed: Granian implements the ASGI
+    ``http.response.pathsend`` extension, so ``FileResponse`` and the static
+    asset mount hand files to ``sendfile(2)`` instead of streaming them
+    through Python. Otherwise falls back to uvicorn.
+    """
     print(f"Starting QA Agent Web UI at http://{host}:{port}")
     print(f"Open your browser to: http://{host}:{port}")
-    uvicorn.run(app, host=host, port=port)
+    try:
+        from granian import Granian
+        from granian.constants import Interfaces
+    except ImportError:
+        import uvicorn
+        uvicorn.run(app, host=host, port=port)
+        return
+
+    Granian(
+        "qaagent.web_ui:app",
+        address=host,
+        port=port,
+        interface=Interfaces.ASGI,
+    ).serve()
 
 
 if __name__ == "__main__":
@@ -20,9 +20,15 @@ Structure:
 
 from __future__ import annotations
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Set, Tuple
+
+# Thread count for copy_to_target; copies are I/O bound
+_COPY_WORKERS = 8
 
 
 class Workspace:
@@ -79,8 +85,8 @@ class Workspace:
         Returns:
             Path to tests directory
         """
-        workspace = self.get_target_workspace(target_name)
-        tests_dir = workspace / "tests" / test_type
+        # parents=True creates the target workspace too, in the same call
+        tests_dir = self.base_dir / target_name / "tests" / test_type
         tests_dir.mkdir(parents=True, exist_ok=True)
         return tests_dir
 
@@ -94,8 +100,7 @@ class Workspace:
         Returns:
             Path to reports directory
         """
-        workspace = self.get_target_workspace(target_name)
-        reports_dir = workspace / "reports"
+        reports_dir = self.base_dir / target_name / "reports"
         reports_dir.mkdir(parents=True, exist_ok=True)
         return reports_dir
 
@@ -109,8 +114,7 @@ class Workspace:
         Returns:
             Path to fixtures directory
         """
-        workspace = self.get_target_workspace(target_name)
-        fixtures_dir = workspace / "fixtures"
+        fixtures_dir = self.base_dir / target_name / "fixtures"
         fixtures_dir.mkdir(parents=True, exist_ok=True)
         return fixtures_dir
 
@@ -154,8 +158,10 @@ class Workspace:
             Dictionary with workspace info
         """
         workspace = self.base_dir / target_name
-        if not workspace.exists():
+        entries = _scan(workspace)
+        if entries is None:
             return {"exists": False}
+        by_name = {entry.name: entry for entry in entries}
 
         info = {
             "exists": True,
@@ -165,34 +171,26 @@ class Workspace:
 
         # Check for OpenAPI specs
         for ext in ["json", "yaml"]:
-            spec_file = workspace / f"openapi.{ext}"
-            if spec_file.exists():
+            spec_entry = by_name.get(f"openapi.{ext}")
+            if spec_entry is not None:
+                stat = spec_entry.stat()
                 info["files"][f"openapi.{ext}"] = {
-                    "size": spec_file.stat().st_size,
-                    "modified": spec_file.stat().st_mtime,
+                    "size": stat.st_size,
+                    "modified": stat.st_mtime,
                 }
 
         # Check for tests
-        tests_dir = workspace / "tests"
-        if tests_dir.exists():
+        if "tests" in by_name:
+            tests_dir = workspace / "tests"
             info["files"]["tests"] = {
-                "unit": len(list((tests_dir / "unit").glob("*.py")))
-                if (tests_dir / "unit").exists()
-                else 0,
-                "behave": len(list((tests_dir / "behave").glob("*.feature")))
-                if (tests_dir / "behave").exists()
-                else 0,
+                "unit": _count_entries(tests_dir / "unit", ".py"),
+                "behave": _count_entries(tests_dir / "behave", ".feature"),
             }
 
-        # Check for reports
-        reports_dir = workspace / "reports"
-        if reports_dir.exists():
-            info["files"]["reports"] = len(list(reports_dir.glob("*")))
-
-        # Check for fixtures
-        fixtures_dir = workspace / "fixtures"
-        if fixtures_dir.exists():
-            info["files"]["fixtures"] = len(list(fixtures_dir.glob("*")))
+        # Check for reports and fixtures
+        for name in ("reports", "fixtures"):
+            if name in by_name:
+                info["files"][name] = _count_entries(workspace / name)
 
         return info
 
@@ -219,16 +217,90 @@ class Workspace:
         target_path = Path(target_path)
 
         copied = []
-        for src_file in workspace.rglob(file_pattern):
-            if src_file.is_file():
-                # Calculate relative path from workspace
-                rel_path = src_file.relative_to(workspace)
-                dest_file = target_path / rel_path
+        for rel_path in _match_files(workspace, file_pattern):
+            copied.append((workspace / rel_path, target_path / rel_path))
+
+        if not dry_run:
+            for dest_dir in {dest_file.parent for _, dest_file in copied}:
+                dest_dir.mkdir(parents=True, exist_ok=True)
+            if len(copied) > 1:
+                with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(copied))) as executor:
+                    # Consume the iterator so copy errors propagate.
+                    list(executor.map(lambda pair: shutil.copyfile(*pair), copied))
+            else:
+                for src_file, dest_file in copied:
+                    shutil.copyfile(src_file, dest_file)
 
-                copied.append((src_file, dest_file))
+        return copied
 
-                if not dry_run:
-                    dest_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(src_file, dest_file)
 
-        return copied
+def _match_files(root: Path, pattern: str) -> Iterator[str]:
+    """Yield relative paths of files under root matching pattern like ``root.rglob(pattern)``.
+
+    Walks with ``os.walk`` and matches the trailing path components with
+    ``fnmatch``, so no Path is built for entries that do not match. As with
+    rglob, matching follows the platform's case rules (case-insensitive on
+    Windows) and symlinked directories are followed; each directory is
+    visited once, so symlink loops terminate. Only regular files (or
+    symlinks to them) are yielded.
+    Patterns using ``**`` fall back to ``rglob``.
+    """
+    if "**" in pattern:
+        for path in root.rglob(pattern):
+            if path.is_file():
+                yield str(path.relative_to(root))
+        return
+
+    normcase = os.path.normcase
+    parts = [normcase(part) for part in pattern.split("/")]
+    name_pattern, dir_patterns = parts[-1], parts[:-1]
+    root_str = str(root)
+    visited: Set[Tuple[int, int]] = set()
+    for dirpath, dirnames, filenames in os.walk(root_str, followlinks=True):
+        try:
+            stat = os.stat(dirpath)
+        except OSError:
+            dirnames[:] = []
+            continue
+        if (stat.st_dev, stat.st_ino) in visited:
+            dirnames[:] = []
+            continue
+        visited.add((stat.st_dev, stat.st_ino))
+
+        rel_dir = os.path.relpath(dirpath, root_str)
+        dir_parts = [] if rel_dir == "." else rel_dir.split(os.sep)
+        if dir_patterns:
+            if len(dir_parts) < len(dir_patterns):
+                continue
+            tail = dir_parts[len(dir_parts) - len(dir_patterns):]
+            if not all(fnmatchcase(normcase(d), p) for d, p in zip(tail, dir_patterns)):
+                continue
+        for name in filenames:
+            # os.walk lists broken symlinks and special files as filenames too;
+            # rglob's is_file() skipped them, so stat only the matches here
+            if fnmatchcase(normcase(name), name_pattern) and os.path.isfile(os.path.join(dirpath, name)):
+                yield name if not dir_parts else os.path.join(rel_dir, name)
+
+
+def _scan(directory: Path) -> Optional[List[os.DirEntry]]:
+    """List a directory's entries in one scandir pass, or None if it is not a directory."""
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _count_entries(directory: Path, suffix: Optional[str] = None) -> int:
+    """Count a directory's entries while scanning, without collecting them.
+
+    With ``suffix``, only regular files whose name ends with it are counted.
+    A missing directory counts as empty.
+    """
+    try:
+        with os.scandir(directory) as it:
+            if suffix is None:
+                return sum(1 for _ in it)
+            return sum(1 for entry in it if entry.name.endswith(suffix) and entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
@@ -0,0 +1,72 @@
+"""Shared fixtures for web UI API tests — one app and TestClient per session."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+
+try:
+    from qaagent.web_ui import app as _web_ui_app
+except ImportError:  # web UI extras (e.g. qa_docgen) not installed
+    _web_ui_app = None
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The web_ui app (has all routers mounted), imported with this conftest."""
+    if _web_ui_app is None:
+        pytest.skip("qaagent.web_ui is not importable")
+    return _web_ui_app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Session-wide test client; per-test state is reset by each module's fixtures."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture()
+async def async_client(app):
+    """In-process async client for tests that issue independent requests concurrently."""
+    import httpx
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as http_client:
+        yield http_client
+
+
+@pytest.fixture(autouse=True)
+def _clean_anthropic_env(monkeypatch):
+    """Start every test without an ambient ANTHROPIC_API_KEY; tests opt in with setenv."""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+
+def _resp(content: str, model: str, usage: dict) -> SimpleNamespace:
+    """Plain stand-in for an LLM response; tests only read its attributes."""
+    return SimpleNamespace(content=content, model=model, usage=usage)
+
+
+@pytest.fixture()
+def mocked_llm(monkeypatch):
+    """Replace qaagent.llm.LLMClient with a prebuilt mock client.
+
+    ``chat`` returns a default successful response; tests adjust its
+    ``content``/``usage`` or set ``chat.side_effect`` as needed.
+    """
+    mock_client = MagicMock()
+    mock_client.chat.return_value = _resp(
+        "# Enhanced Documentation\n\nGreat app.",
+        "claude-sonnet-4-5-20250929",
+        {"prompt_tokens": 500, "completion_tokens": 200, "total_tokens": 700},
+    )
+    # The analyze route imports LLMClient from qaagent.llm at call time, so the
+    # module attribute is the only binding to replace.
+    monkeypatch.setattr("qaagent.llm.LLMClient", lambda *args, **kwargs: mock_client)
+    return mock_client
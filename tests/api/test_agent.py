@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 from qaagent import db
 from qaagent.api.routes.repositories import Repository, repositories
-from qaagent.api.routes.agent import _mask_key, _estimate_cost, _parse_sections, LLM_TIMEOUT_SECONDS
+from qaagent.api.routes.agent import delete_agent_config
 from qaagent.doc.generator import save_documentation
 from qaagent.doc.models import AppDocumentation
 
@@ -24,130 +25,57 @@ def _isolated_db(tmp_path):
     db.reset_connection()
 
 
-@pytest.fixture()
-def client():
-    """Test client for the web_ui app (has all routers mounted)."""
-    from qaagent.web_ui import app
-    return TestClient(app)
+# Built once without validation; each registration copies it with its own path
+_TEST_REPO = Repository.model_construct(
+    id="test-repo", name="test-repo", path="", repo_type="local",
+    analysis_options={"testCoverage": True},
+)
 
 
-@pytest.fixture()
-def sample_repo(tmp_path: Path) -> Repository:
-    """Register a sample repo with pre-generated documentation."""
-    repo = Repository(
-        id="test-repo",
-        name="test-repo",
-        path=str(tmp_path),
-        repo_type="local",
-        analysis_options={"testCoverage": True},
-    )
+def _register_repo(path: Path) -> Repository:
+    repo = _TEST_REPO.model_copy(update={"path": str(path)})
     repositories["test-repo"] = repo
-
-    doc = AppDocumentation(
-        app_name="test-repo",
-        generated_at="2026-01-01T00:00:00",
-        content_hash="abc123",
-        source_dir=str(tmp_path),
-        features=[],
-        integrations=[],
-        total_routes=5,
-    )
-    save_documentation(doc, tmp_path)
     return repo
 
 
-# ---------------------------------------------------------------------------
-# Unit tests for helper functions
-# ---------------------------------------------------------------------------
-
-
-class TestMaskKey:
-    def test_masks_long_key(self):
-        assert _mask_key("sk-123456789abcdef") == "sk-1***cdef"
-
-    def test_short_key_fully_masked(self):
-        assert _mask_key("short") == "***"
+_BASE_DOC = AppDocumentation(
+    app_name="test-repo",
+    generated_at="2026-01-01T00:00:00",
+    content_hash="abc123",
+    source_dir="",
+    features=[],
+    integrations=[],
+    total_routes=5,
+)
 
-    def test_exactly_eight_chars(self):
-        assert _mask_key("12345678") == "***"
 
-    def test_nine_chars_shows_edges(self):
-        assert _mask_key("123456789") == "1234***6789"
+def _write_doc(path: Path) -> None:
+    save_documentation(_BASE_DOC.model_copy(update={"source_dir": str(path)}), path)
 
 
-class TestEstimateCost:
-    def test_known_model_cost(self):
-        # claude-sonnet-4-5-20250929: $3/M input, $15/M output
-        cost = _estimate_cost("claude-sonnet-4-5-20250929", 1_000_000, 1_000_000)
-        assert cost == 18.0  # 3 + 15
+@pytest.fixture(scope="module")
+def _repo_dir(tmp_path_factory) -> Path:
+    """Sample repo directory with pre-generated documentation, written once per module."""
+    path = tmp_path_factory.mktemp("sample_repo")
+    _write_doc(path)
+    return path
 
-    def test_unknown_model_zero(self):
-        assert _estimate_cost("unknown-model", 100_000, 100_000) == 0.0
-
-    def test_prefix_match(self):
-        cost = _estimate_cost("claude-sonnet-4-5", 1_000_000, 0)
-        assert cost == 3.0
 
+@pytest.fixture()
+def sample_repo(_repo_dir: Path, mocker) -> Repository:
+    """Register the shared sample repo, read-only: analyze's auto-save is patched out.
 
-class TestTimeoutConstant:
-    def test_agent_timeout_is_300_seconds(self):
-        """Agent analysis timeout is 300s (large prompts need extended processing)."""
-        assert LLM_TIMEOUT_SECONDS == 300
+    Tests that need the saved appdoc.json or add files use ``writable_repo``.
+    """
+    mocker.patch("qa_docgen.generator.save_documentation")
+    return _register_repo(_repo_dir)
 
 
-class TestParseSections:
-    def test_parses_standard_sections(self):
-        """Standard LLM output with ## headings is split into sections."""
-        md = (
-            "## Product Overview\n\nThis is an app.\n\n"
-            "## Features\n\n### Login\n\nUsers can log in.\n\n"
-            "## Gaps & Recommendations\n\nNeed more tests."
-        )
-        sections = _parse_sections(md)
-        assert len(sections) == 3
-        assert sections[0].title == "Product Overview"
-        assert "This is an app" in sections[0].content
-        assert sections[1].title == "Features"
-        assert "### Login" in sections[1].content
-        assert sections[2].title == "Gaps & Recommendations"
-
-    def test_preamble_captured_as_introduction(self):
-        """Text before the first ## heading becomes an 'Introduction' section."""
-        md = "Some intro text.\n\n## Product Overview\n\nOverview content."
-        sections = _parse_sections(md)
-        assert len(sections) == 2
-        assert sections[0].title == "Introduction"
-        assert "Some intro text" in sections[0].content
-        assert sections[1].title == "Product Overview"
-
-    def test_no_headings_returns_single_section(self):
-        """If LLM ignores the format, all text goes into one section."""
-        md = "Just a big wall of text with no headings at all."
-        sections = _parse_sections(md)
-        assert len(sections) == 1
-        assert sections[0].title == "Introduction"
-        assert "big wall of text" in sections[0].content
-
-    def test_empty_string_returns_empty_list(self):
-        """Empty input produces no sections."""
-        assert _parse_sections("") == []
-        assert _parse_sections("   ") == []
-
-    def test_h3_not_split(self):
-        """### headings inside a section are NOT treated as section boundaries."""
-        md = "## Features\n\n### Login\n\nLogin flow.\n\n### Signup\n\nSignup flow."
-        sections = _parse_sections(md)
-        assert len(sections) == 1
-        assert sections[0].title == "Features"
-        assert "### Login" in sections[0].content
-        assert "### Signup" in sections[0].content
-
-    def test_strips_whitespace_from_title_and_content(self):
-        """Titles and content are trimmed."""
-        md = "##   Architecture & Tech Stack  \n\n  Content here.  \n\n"
-        sections = _parse_sections(md)
-        assert sections[0].title == "Architecture & Tech Stack"
-        assert sections[0].content == "Content here."
+@pytest.fixture()
+def writable_repo(tmp_path: Path) -> Repository:
+    """Register a sample repo in tmp_path for tests that inspect or add files on disk."""
+    _write_doc(tmp_path)
+    return _register_repo(tmp_path)
 
 
 # ---------------------------------------------------------------------------
@@ -156,6 +84,8 @@ class TestParseSections:
 
 
 class TestAgentConfigEndpoints:
+    """Key masking is checked on the serialized HTTP body; delete calls its handler directly."""
+
     def test_save_config(self, client: TestClient, sample_repo: Repository):
         """POST /api/agent/config saves config and returns masked key."""
         response = client.post(
@@ -172,8 +102,8 @@ class TestAgentConfigEndpoints:
         assert "sk-t" in data["api_key_masked"]
         assert "5678" in data["api_key_masked"]
         assert "***" in data["api_key_masked"]
-        # Raw key is NOT in response
-        assert "sk-test1234abcd5678" not in str(data)
+        # Raw key is NOT anywhere in the response body
+        assert "sk-test1234abcd5678" not in response.text
 
     def test_get_config_returns_masked_key(self, client: TestClient, sample_repo: Repository):
         """GET /api/agent/config returns masked key, never raw."""
@@ -185,31 +115,21 @@ class TestAgentConfigEndpoints:
         assert data["provider"] == "openai"
         assert data["model"] == "gpt-4o"
         assert "***" in data["api_key_masked"]
-        # Ensure raw key never appears
-        assert "sk-secret1234secret" not in str(data)
+        # Ensure raw key never appears in the response body
+        assert "sk-secret1234secret" not in response.text
 
     def test_get_config_unconfigured(self, client: TestClient, sample_repo: Repository):
         """GET /api/agent/config with no saved config and no env var returns defaults."""
-        with patch.dict("os.environ", {}, clear=False):
-            # Remove env var if present
-            import os
-            env_backup = os.environ.pop("ANTHROPIC_API_KEY", None)
-            try:
-                response = client.get("/api/agent/config", params={"repo_id": "test-repo"})
-                assert response.status_code == 200
-                data = response.json()
-                assert data["configured"] is False
-                assert data["api_key_masked"] == ""
-            finally:
-                if env_backup is not None:
-                    os.environ["ANTHROPIC_API_KEY"] = env_backup
-
-    def test_delete_config(self, client: TestClient, sample_repo: Repository):
-        """DELETE /api/agent/config removes config."""
-        db.agent_config_save("test-repo", "anthropic", "m", "sk-toberemoved12345678")
-        response = client.delete("/api/agent/config", params={"repo_id": "test-repo"})
+        response = client.get("/api/agent/config", params={"repo_id": "test-repo"})
         assert response.status_code == 200
-        assert response.json()["status"] == "deleted"
+        data = response.json()
+        assert data["configured"] is False
+        assert data["api_key_masked"] == ""
+
+    def test_delete_config(self, sample_repo: Repository):
+        """delete_agent_config removes config."""
+        db.agent_config_save("test-repo", "anthropic", "m", "sk-toberemoved12345678")
+        assert delete_agent_config(repo_id="test-repo")["status"] == "deleted"
         assert db.agent_config_get("test-repo") is None
 
 
@@ -218,15 +138,34 @@ class TestAgentConfigEndpoints:
 # ---------------------------------------------------------------------------
 
 
+# Static request body, serialized once
+_CONFIG_BODY = json.dumps({"provider": "anthropic", "model": "m", "api_key": "k"}).encode()
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
 class TestAgentRepoValidation:
-    def test_missing_repo_id_returns_400(self, client: TestClient):
+    @pytest.fixture(autouse=True, scope="class")
+    def _isolated_db(self, tmp_path_factory):
+        """One empty DB for the class; these requests are rejected before any write."""
+        db.reset_connection()
+        db.set_db_path(str(tmp_path_factory.mktemp("db") / "test.db"))
+        yield
+        db.reset_connection()
+
+    @pytest.mark.parametrize(
+        "method,path,kwargs",
+        [
+            ("GET", "/api/agent/config", {}),
+            ("POST", "/api/agent/config", {"content": _CONFIG_BODY, "headers": _JSON_HEADERS}),
+            ("DELETE", "/api/agent/config", {}),
+            ("POST", "/api/agent/analyze", {}),
+            ("GET", "/api/agent/usage", {}),
+            ("DELETE", "/api/agent/usage", {}),
+        ],
+    )
+    def test_missing_repo_id_returns_400(self, client: TestClient, method: str, path: str, kwargs: dict):
         """All agent endpoints require repo_id — omitting it -> 400."""
-        assert client.get("/api/agent/config").status_code == 400
-        assert client.post("/api/agent/config", json={"provider": "anthropic", "model": "m", "api_key": "k"}).status_code == 400
-        assert client.delete("/api/agent/config").status_code == 400
-        assert client.post("/api/agent/analyze").status_code == 400
-        assert client.get("/api/agent/usage").status_code == 400
-        assert client.delete("/api/agent/usage").status_code == 400
+        assert client.request(method, path, **kwargs).status_code == 400
 
     def test_unknown_repo_id_returns_404(self, client: TestClient):
         """Agent endpoints with non-existent repo_id -> 404."""
@@ -243,32 +182,15 @@ class TestAgentRepoValidation:
 class TestAnalyzeEndpoint:
     def test_analyze_no_config_returns_400(self, client: TestClient, sample_repo: Repository):
         """POST /api/agent/analyze without config and no env var -> 400."""
-        import os
-        env_backup = os.environ.pop("ANTHROPIC_API_KEY", None)
-        try:
-            response = client.post("/api/agent/analyze", params={"repo_id": "test-repo"})
-            assert response.status_code == 400
-            assert "not configured" in response.json()["detail"].lower()
-        finally:
-            if env_backup is not None:
-                os.environ["ANTHROPIC_API_KEY"] = env_backup
-
-    def test_analyze_success_with_mocked_llm(self, client: TestClient, sample_repo: Repository):
+        response = client.post("/api/agent/analyze", params={"repo_id": "test-repo"})
+        assert response.status_code == 400
+        assert "not configured" in response.json()["detail"].lower()
+
+    def test_analyze_success_with_mocked_llm(self, client: TestClient, sample_repo: Repository, mocked_llm):
         """POST /api/agent/analyze with mocked LLM returns content and accumulates usage."""
         db.agent_config_save("test-repo", "anthropic", "claude-sonnet-4-5-20250929", "sk-test1234abcd5678")
 
-        mock_response = MagicMock()
-        mock_response.content = "# Enhanced Documentation\n\nGreat app."
-        mock_response.model = "claude-sonnet-4-5-20250929"
-        mock_response.usage = {
-            "prompt_tokens": 500,
-            "completion_tokens": 200,
-            "total_tokens": 700,
-        }
-
-        with patch("qaagent.llm.LLMClient") as MockClient:
-            MockClient.return_value.chat.return_value = mock_response
-            response = client.post("/api/agent/analyze", params={"repo_id": "test-repo"})
+        response = client.post("/api/agent/analyze", params={"repo_id": "test-repo"})
 
         assert response.status_code == 200
         data = response.json()
@@ -282,15 +204,14 @@ class TestAnalyzeEndpoint:
         assert usage["completion_tokens"] == 200
         assert usage["total_tokens"] == 700
 
-    def test_analyze_llm_error_returns_502(self, client: TestClient, sample_repo: Repository):
+    def test_analyze_llm_error_returns_502(self, client: TestClient, sample_repo: Repository, mocked_llm):
         """POST /api/agent/analyze when LLM fails -> 502 and request still counted."""
         db.agent_config_save("test-repo", "anthropic", "claude-sonnet-4-5-20250929", "sk-test1234abcd5678")
 
         from qaagent.llm import QAAgentLLMError
 
-        with patch("qaagent.llm.LLMClient") as MockClient:
-            MockClient.return_value.chat.side_effect = QAAgentLLMError("timeout")
-            response = client.post("/api/agent/analyze", params={"repo_id": "test-repo"})
+        mocked_llm.chat.side_effect = QAAgentLLMError("timeout")
+        response = client.post("/api/agent/analyze", params={"repo_id": "test-repo"})
 
         assert response.status_code == 502
         assert "timeout" in response.json()["detail"]
@@ -298,7 +219,7 @@ class TestAnalyzeEndpoint:
         usage = db.agent_usage_get("test-repo")
         assert usage["requests"] == 1
 
-    def test_analyze_no_documentation_returns_404(self, client: TestClient):
+    def test_analyze_no_documentation_returns_404(self, client: TestClient, mocker):
         """POST /api/agent/analyze when repo has no documentation -> 404."""
         repo = Repository(
             id="empty-repo", name="empty-repo", path="/tmp/empty",
@@ -307,8 +228,8 @@ class TestAnalyzeEndpoint:
         repositories["empty-repo"] = repo
         db.agent_config_save("empty-repo", "anthropic", "m", "sk-test1234abcd5678")
 
-        with patch("qa_docgen.generator.load_documentation", return_value=None):
-            response = client.post("/api/agent/analyze", params={"repo_id": "empty-repo"})
+        mocker.patch("qa_docgen.generator.load_documentation", return_value=None)
+        response = client.post("/api/agent/analyze", params={"repo_id": "empty-repo"})
         assert response.status_code == 404
         assert "No documentation found" in response.json()["detail"]
 
@@ -353,7 +274,8 @@ class TestUsageEndpoints:
         usage = db.agent_usage_get("test-repo")
         assert usage["requests"] == 0
 
-    def test_usage_keyed_by_repo_id(self, client: TestClient):
+    @pytest.mark.asyncio
+    async def test_usage_keyed_by_repo_id(self, async_client):
         """Usage is keyed by repo_id — separate repos have independent counters."""
         repo_a = Repository(id="repo-a", name="a", path="/tmp/a", repo_type="local", analysis_options={})
         repo_b = Repository(id="repo-b", name="b", path="/tmp/b", repo_type="local", analysis_options={})
@@ -363,8 +285,10 @@ class TestUsageEndpoints:
         db.agent_config_save("repo-a", "anthropic", "gpt-4o", "k")
         db.agent_usage_add("repo-a", prompt_tokens=100, completion_tokens=50, total_tokens=150)
 
-        resp_a = client.get("/api/agent/usage", params={"repo_id": "repo-a"})
-        resp_b = client.get("/api/agent/usage", params={"repo_id": "repo-b"})
+        resp_a, resp_b = await asyncio.gather(
+            async_client.get("/api/agent/usage", params={"repo_id": "repo-a"}),
+            async_client.get("/api/agent/usage", params={"repo_id": "repo-b"}),
+        )
 
         assert resp_a.json()["requests"] == 1
         assert resp_b.json()["requests"] == 0
@@ -376,21 +300,18 @@ class TestUsageEndpoints:
 
 
 class TestAgentAnalysisPersistence:
-    def test_analyze_auto_saves_agent_analysis(self, client: TestClient, sample_repo: Repository, tmp_path: Path):
+    def test_analyze_auto_saves_agent_analysis(
+        self, client: TestClient, writable_repo: Repository, tmp_path: Path, mocked_llm,
+    ):
         """POST /api/agent/analyze auto-saves agent_analysis with sections into appdoc.json."""
         db.agent_config_save("test-repo", "anthropic", "claude-sonnet-4-5-20250929", "sk-test1234abcd5678")
 
-        mock_response = MagicMock()
-        mock_response.content = (
+        mocked_llm.chat.return_value.content = (
             "## Product Overview\n\nThis is the app.\n\n"
             "## Gaps & Recommendations\n\nNeed more docs."
         )
-        mock_response.model = "claude-sonnet-4-5-20250929"
-        mock_response.usage = {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
 
-        with patch("qaagent.llm.LLMClient") as MockClient:
-            MockClient.return_value.chat.return_value = mock_response
-            response = client.post("/api/agent/analyze", params={"repo_id": "test-repo"})
+        response = client.post("/api/agent/analyze", params={"repo_id": "test-repo"})
 
         assert response.status_code == 200
 
@@ -407,7 +328,7 @@ class TestAgentAnalysisPersistence:
         assert doc.agent_analysis.sections[0].title == "Product Overview"
         assert doc.agent_analysis.sections[1].title == "Gaps & Recommendations"
 
-    def test_app_doc_get_includes_agent_analysis(self, client: TestClient, sample_repo: Repository, tmp_path: Path):
+    def test_app_doc_get_includes_agent_analysis(self, client: TestClient, writable_repo: Repository, tmp_path: Path):
         """GET /api/doc returns agent_analysis after it has been saved."""
         from qaagent.doc.models import AgentAnalysis
         from qaagent.doc.generator import load_documentation
@@ -436,37 +357,34 @@ class TestAgentAnalysisPersistence:
 
 
 class TestEnvVarFallback:
-    def test_env_var_fallback_shows_configured(self, client: TestClient, sample_repo: Repository):
+    def test_env_var_fallback_shows_configured(self, client: TestClient, sample_repo: Repository, monkeypatch):
         """GET /api/agent/config with ANTHROPIC_API_KEY env var shows configured."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-envvar1234567890"}):
-            response = client.get("/api/agent/config", params={"repo_id": "test-repo"})
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-envvar1234567890")
+        response = client.get("/api/agent/config", params={"repo_id": "test-repo"})
 
         assert response.status_code == 200
         data = response.json()
         assert data["configured"] is True
         assert "***" in data["api_key_masked"]
 
-    def test_env_var_fallback_enables_analyze(self, client: TestClient, sample_repo: Repository):
+    def test_env_var_fallback_enables_analyze(
+        self, client: TestClient, sample_repo: Repository, monkeypatch, mocked_llm,
+    ):
         """POST /api/agent/analyze succeeds with env-var API key (no explicit config)."""
-        mock_response = MagicMock()
-        mock_response.content = "# From env key"
-        mock_response.model = "claude-sonnet-4-5-20250929"
-        mock_response.usage = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        mocked_llm.chat.return_value.content = "# From env key"
 
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-envvar1234567890"}):
-            with patch("qaagent.llm.LLMClient") as MockClient:
-                MockClient.return_value.chat.return_value = mock_response
-                response = client.post("/api/agent/analyze", params={"repo_id": "test-repo"})
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-envvar1234567890")
+        response = client.post("/api/agent/analyze", params={"repo_id": "test-repo"})
 
         assert response.status_code == 200
         assert response.json()["content"] == "# From env key"
 
-    def test_explicit_config_overrides_env_var(self, client: TestClient, sample_repo: Repository):
+    def test_explicit_config_overrides_env_var(self, client: TestClient, sample_repo: Repository, monkeypatch):
         """Explicit config takes precedence over ANTHROPIC_API_KEY env var."""
         db.agent_config_save("test-repo", "openai", "gpt-4o", "sk-explicit12345678")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-envvar1234567890")
 
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-envvar1234567890"}):
-            response = client.get("/api/agent/config", params={"repo_id": "test-repo"})
+        response = client.get("/api/agent/config", params={"repo_id": "test-repo"})
 
         data = response.json()
         assert data["configured"] is True
@@ -480,61 +398,53 @@ class TestEnvVarFallback:
 
 
 class TestPerformanceFocusAnalysis:
-    def test_focus_performance_uses_performance_prompt(self, client: TestClient, sample_repo: Repository):
+    def test_focus_performance_uses_performance_prompt(
+        self, client: TestClient, sample_repo: Repository, mocked_llm,
+    ):
         """POST /api/agent/analyze with focus=performance uses performance system prompt."""
         db.agent_config_save("test-repo", "anthropic", "claude-sonnet-4-5-20250929", "sk-test1234abcd5678")
 
-        mock_response = MagicMock()
-        mock_response.content = "## Performance Overview\n\nApp has issues."
-        mock_response.model = "claude-sonnet-4-5-20250929"
-        mock_response.usage = {"prompt_tokens": 300, "completion_tokens": 100, "total_tokens": 400}
+        mocked_llm.chat.return_value.content = "## Performance Overview\n\nApp has issues."
 
-        with patch("qaagent.llm.LLMClient") as MockClient:
-            MockClient.return_value.chat.return_value = mock_response
-            response = client.post(
-                "/api/agent/analyze",
-                params={"repo_id": "test-repo"},
-                json={"focus": "performance"},
-            )
+        response = client.post(
+            "/api/agent/analyze",
+            params={"repo_id": "test-repo"},
+            json={"focus": "performance"},
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["content"] == "## Performance Overview\n\nApp has issues."
 
         # Verify the system prompt was performance-focused
-        call_args = MockClient.return_value.chat.call_args
+        call_args = mocked_llm.chat.call_args
         messages = call_args[0][0]
         system_msg = messages[0].content
         assert "performance engineer" in system_msg.lower()
         assert "Pagination Assessment" in system_msg
 
-    def test_focus_null_uses_general_prompt(self, client: TestClient, sample_repo: Repository):
+    def test_focus_null_uses_general_prompt(self, client: TestClient, sample_repo: Repository, mocked_llm):
         """POST /api/agent/analyze with focus=null uses the general prompt."""
         db.agent_config_save("test-repo", "anthropic", "claude-sonnet-4-5-20250929", "sk-test1234abcd5678")
 
-        mock_response = MagicMock()
-        mock_response.content = "## Product Overview\n\nGeneral docs."
-        mock_response.model = "claude-sonnet-4-5-20250929"
-        mock_response.usage = {"prompt_tokens": 300, "completion_tokens": 100, "total_tokens": 400}
+        mocked_llm.chat.return_value.content = "## Product Overview\n\nGeneral docs."
 
-        with patch("qaagent.llm.LLMClient") as MockClient:
-            MockClient.return_value.chat.return_value = mock_response
-            response = client.post(
-                "/api/agent/analyze",
-                params={"repo_id": "test-repo"},
-                json={"focus": None},
-            )
+        response = client.post(
+            "/api/agent/analyze",
+            params={"repo_id": "test-repo"},
+            json={"focus": None},
+        )
 
         assert response.status_code == 200
-        call_args = MockClient.return_value.chat.call_args
+        call_args = mocked_llm.chat.call_args
         messages = call_args[0][0]
         system_msg = messages[0].content
         assert "product documentation writer" in system_msg.lower()
 
-    def test_focus_performance_includes_route_context(self, client: TestClient, sample_repo: Repository, tmp_path: Path):
+    def test_focus_performance_includes_route_context(
+        self, client: TestClient, writable_repo: Repository, tmp_path: Path, mocked_llm,
+    ):
         """Performance focus enriches the user prompt with PERF rule findings."""
-        import json
-
         db.agent_config_save("test-repo", "anthropic", "claude-sonnet-4-5-20250929", "sk-test1234abcd5678")
 
         # Write routes.json to the project root
@@ -544,22 +454,17 @@ class TestPerformanceFocusAnalysis:
         ]
         (tmp_path / "routes.json").write_text(json.dumps(routes), encoding="utf-8")
 
-        mock_response = MagicMock()
-        mock_response.content = "## Performance Overview\n\nMissing pagination."
-        mock_response.model = "claude-sonnet-4-5-20250929"
-        mock_response.usage = {"prompt_tokens": 300, "completion_tokens": 100, "total_tokens": 400}
+        mocked_llm.chat.return_value.content = "## Performance Overview\n\nMissing pagination."
 
-        with patch("qaagent.llm.LLMClient") as MockClient:
-            MockClient.return_value.chat.return_value = mock_response
-            response = client.post(
-                "/api/agent/analyze",
-                params={"repo_id": "test-repo"},
-                json={"focus": "performance"},
-            )
+        response = client.post(
+            "/api/agent/analyze",
+            params={"repo_id": "test-repo"},
+            json={"focus": "performance"},
+        )
 
         assert response.status_code == 200
         # Verify user prompt included performance context
-        call_args = MockClient.return_value.chat.call_args
+        call_args = mocked_llm.chat.call_args
         messages = call_args[0][0]
         user_msg = messages[1].content
         assert "PERF-001" in user_msg
@@ -569,7 +474,6 @@ class TestPerformanceFocusAnalysis:
 class TestBackwardCompatibility:
     def test_old_appdoc_without_sections_loads_cleanly(self, tmp_path: Path):
         """An appdoc.json with agent_analysis but no 'sections' field still loads."""
-        import json
         qaagent_dir = tmp_path / ".qaagent"
         qaagent_dir.mkdir()
         old_data = {
@@ -0,0 +1,87 @@
+"""Tests for WebSocket broadcast() in the web UI."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+web_ui = pytest.importorskip("qaagent.web_ui")
+
+
+def _client(fail: bool = False) -> AsyncMock:
+    client = AsyncMock()
+    if fail:
+        client.send_text.side_effect = RuntimeError("connection closed")
+    return client
+
+
+def test_broadcast_queues_message_for_every_client():
+    connections = {_client(): asyncio.Queue(maxsize=10) for _ in range(3)}
+
+    with patch.object(web_ui, "active_connections", dict(connections)):
+        asyncio.run(web_ui.broadcast({"type": "status", "message": "hi"}))
+
+    for queue in connections.values():
+        assert queue.get_nowait() == '{"type":"status","message":"hi"}'
+        assert queue.empty()
+
+
+def test_broadcast_drops_and_closes_lagging_client():
+    healthy, lagging = _client(), _client()
+    full = asyncio.Queue(maxsize=1)
+    full.put_nowait("backlog")
+    connections = {healthy: asyncio.Queue(maxsize=1), lagging: full}
+
+    async def run():
+        await web_ui.broadcast({"type": "progress"})
+        await asyncio.sleep(0)
+
+    with patch.object(web_ui, "active_connections", connections):
+        asyncio.run(run())
+        remaining = set(web_ui.active_connections)
+
+    assert remaining == {healthy}
+    lagging.close.assert_awaited_once_with(code=1013)
+    healthy.close.assert_not_awaited()
+
+
+def test_drain_sends_in_order_and_drops_failed_client():
+    client = _client()
+    client.send_text.side_effect = [None, None, RuntimeError("connection closed")]
+    queue = asyncio.Queue()
+    for payload in ("a", "b", "c"):
+        queue.put_nowait(payload)
+
+    with patch.object(web_ui, "active_connections", {client: queue}):
+        asyncio.run(web_ui._drain(client, queue))
+        remaining = dict(web_ui.active_connections)
+
+    assert [call.args[0] for call in client.send_text.await_args_list] == ["a", "b", "c"]
+    assert remaining == {}
+
+
+def test_broadcast_encodes_once():
+    connections = {_client(): asyncio.Queue() for _ in range(5)}
+
+    with patch.object(web_ui, "active_connections", dict(connections)), \
+            patch.object(web_ui, "_encode_message", wraps=web_ui._encode_message) as mock_encode:
+        asyncio.run(web_ui.broadcast({"type": "progress", "message": "café"}))
+
+    mock_encode.assert_called_once()
+    first_queue = next(iter(connections.values()))
+    assert first_queue.get_nowait() == '{"type":"progress","message":"café"}'
+
+
+def test_websocket_endpoint_registers_and_removes_client(client):
+    with patch.object(web_ui, "active_connections", {}):
+        with client.websocket_connect("/ws"):
+            assert len(web_ui.active_connections) == 1
+        # The server notices the close on its next receive
+        for _ in range(100):
+            if not web_ui.active_connections:
+                break
+            time.sleep(0.01)
+        assert web_ui.active_connections == {}
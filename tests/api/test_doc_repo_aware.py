@@ -19,46 +19,66 @@ from qaagent.doc.models import (
 )
 
 
-@pytest.fixture(autouse=True)
-def _isolated_db(tmp_path):
-    """Point SQLite at a temp file so tests don't touch the real DB."""
+# Built once; fixtures take copies rather than re-validating per test
+_TEST_REPO = Repository.model_construct(
+    id="test-repo", name="test-repo", path="", repo_type="local",
+    analysis_options={"testCoverage": True},
+)
+_ENHANCED_REPO = Repository.model_construct(
+    id="enhanced-repo", name="enhanced-repo", path="", repo_type="local",
+    analysis_options={},
+)
+
+_BASE_DOC = AppDocumentation(
+    app_name="test-repo",
+    generated_at="2026-01-01T00:00:00",
+    content_hash="abc123",
+    source_dir="",
+    features=[],
+    integrations=[],
+    total_routes=5,
+)
+
+_ENHANCED_DOC = AppDocumentation(
+    app_name="enhanced-repo",
+    total_routes=10,
+    app_overview="This is a multi-paragraph overview.\n\nIt describes the application.",
+    tech_stack=["Python", "FastAPI", "React"],
+    user_roles=[
+        UserRole(id="user", name="User", description="End user", permissions=["view", "create"]),
+        UserRole(id="admin", name="Admin", description="Administrator", permissions=["manage"]),
+    ],
+    user_journeys=[
+        UserJourney(
+            id="j1", name="Login Flow", actor="user", priority="high",
+            steps=[JourneyStep(order=1, action="Log in", expected_outcome="Authenticated")],
+        ),
+    ],
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _isolated_db(tmp_path_factory):
+    """Point SQLite at a temp file so tests don't touch the real DB.
+
+    Every request still reads it via the auth middleware, but nothing here
+    writes to it, so one database serves the whole module.
+    """
     from qaagent import db
     db.reset_connection()
-    db.set_db_path(str(tmp_path / "test.db"))
+    db.set_db_path(str(tmp_path_factory.mktemp("db") / "test.db"))
     yield
     db.reset_connection()
 
 
-@pytest.fixture()
-def client():
-    """Create a test client for the web_ui app (has all routers mounted)."""
-    from qaagent.web_ui import app
-    return TestClient(app)
-
-
 @pytest.fixture()
 def sample_repo(tmp_path: Path) -> Repository:
     """Register a sample repo with pre-generated documentation."""
-    repo = Repository(
-        id="test-repo",
-        name="test-repo",
-        path=str(tmp_path),
-        repo_type="local",
-        analysis_options={"testCoverage": True},
-    )
+    repo = _TEST_REPO.model_copy(update={"path": str(tmp_path)})
     repositories["test-repo"] = repo
 
     # Generate minimal documentation
-    doc = AppDocumentation(
-        app_name="test-repo",
-        generated_at="2026-01-01T00:00:00",
-        content_hash="abc123",
-        source_dir=str(tmp_path),
-        features=[],
-        integrations=[],
-        total_routes=5,
-    )
-    save_documentation(doc, tmp_path)
+    save_documentation(_BASE_DOC.model_copy(update={"source_dir": str(tmp_path)}), tmp_path)
     return repo
 
 
@@ -91,6 +111,7 @@ class TestGetDocWithRepoId:
 class TestRegenerateDocWithRepoId:
     """POST /api/doc/regenerate?repo_id=<value> contract tests."""
 
+    @pytest.mark.slow
     def test_regenerate_valid_repo_id(self, client: TestClient, sample_repo: Repository):
         """regenerate with valid repo_id → 200, regenerated doc has correct source_dir."""
         response = client.post(
@@ -120,75 +141,39 @@ class TestPhase19Fields:
     @pytest.fixture()
     def repo_with_enhanced_doc(self, tmp_path: Path) -> Repository:
         """Register a repo with Phase 19 enhanced documentation."""
-        repo = Repository(
-            id="enhanced-repo",
-            name="enhanced-repo",
-            path=str(tmp_path),
-            repo_type="local",
-            analysis_options={},
-        )
+        repo = _ENHANCED_REPO.model_copy(update={"path": str(tmp_path)})
         repositories["enhanced-repo"] = repo
 
-        doc = AppDocumentation(
-            app_name="enhanced-repo",
-            total_routes=10,
-            app_overview="This is a multi-paragraph overview.\n\nIt describes the application.",
-            tech_stack=["Python", "FastAPI", "React"],
-            user_roles=[
-                UserRole(id="user", name="User", description="End user", permissions=["view", "create"]),
-                UserRole(id="admin", name="Admin", description="Administrator", permissions=["manage"]),
-            ],
-            user_journeys=[
-                UserJourney(
-                    id="j1", name="Login Flow", actor="user", priority="high",
-                    steps=[JourneyStep(order=1, action="Log in", expected_outcome="Authenticated")],
-                ),
-            ],
-        )
-        save_documentation(doc, tmp_path)
+        save_documentation(_ENHANCED_DOC, tmp_path)
         return repo
 
-    def test_enhanced_doc_has_app_overview(self, client: TestClient, repo_with_enhanced_doc: Repository):
-        """GET /api/doc returns app_overview as string."""
+    def test_enhanced_doc_has_phase19_fields(self, client: TestClient, repo_with_enhanced_doc: Repository):
+        """GET /api/doc returns app_overview, tech_stack, user_roles and user_journeys with correct shapes."""
         response = client.get("/api/doc", params={"repo_id": "enhanced-repo"})
         assert response.status_code == 200
         data = response.json()
-        assert "app_overview" in data
+
+        # app_overview as string
         assert isinstance(data["app_overview"], str)
         assert "multi-paragraph" in data["app_overview"]
 
-    def test_enhanced_doc_has_tech_stack(self, client: TestClient, repo_with_enhanced_doc: Repository):
-        """GET /api/doc returns tech_stack as list of strings."""
-        response = client.get("/api/doc", params={"repo_id": "enhanced-repo"})
-        data = response.json()
-        assert "tech_stack" in data
-        assert isinstance(data["tech_stack"], list)
+        # tech_stack as list of strings
         assert data["tech_stack"] == ["Python", "FastAPI", "React"]
 
-    def test_enhanced_doc_has_user_roles(self, client: TestClient, repo_with_enhanced_doc: Repository):
-        """GET /api/doc returns user_roles as list with correct shape."""
-        response = client.get("/api/doc", params={"repo_id": "enhanced-repo"})
-        data = response.json()
-        assert "user_roles" in data
+        # user_roles as list with correct shape
         assert isinstance(data["user_roles"], list)
         assert len(data["user_roles"]) == 2
         role = data["user_roles"][0]
         assert "id" in role
         assert "name" in role
-        assert "permissions" in role
         assert isinstance(role["permissions"], list)
 
-    def test_enhanced_doc_has_user_journeys(self, client: TestClient, repo_with_enhanced_doc: Repository):
-        """GET /api/doc returns user_journeys as list with correct shape."""
-        response = client.get("/api/doc", params={"repo_id": "enhanced-repo"})
-        data = response.json()
-        assert "user_journeys" in data
+        # user_journeys as list with correct shape
         assert isinstance(data["user_journeys"], list)
         assert len(data["user_journeys"]) == 1
         journey = data["user_journeys"][0]
         assert journey["name"] == "Login Flow"
         assert journey["priority"] == "high"
-        assert "steps" in journey
         assert isinstance(journey["steps"], list)
         assert journey["steps"][0]["action"] == "Log in"
         assert journey["steps"][0]["expected_outcome"] == "Authenticated"
@@ -5,8 +5,10 @@ Ensures the endpoint uses GenerationResult.file_count instead of len(GenerationR
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -23,10 +25,12 @@ def _isolated_db(tmp_path):
     db.reset_connection()
 
 
-@pytest.fixture()
-def client():
-    from qaagent.web_ui import app
-    return TestClient(app)
+@pytest.fixture(autouse=True)
+def _empty_route_cache():
+    from qaagent import web_ui
+    web_ui._discover_cache.clear()
+    yield
+    web_ui._discover_cache.clear()
 
 
 def _make_generation_result(file_count: int = 3) -> GenerationResult:
@@ -35,38 +39,51 @@ def _make_generation_result(file_count: int = 3) -> GenerationResult:
     return GenerationResult(files=files, stats={"tests": file_count * 2})
 
 
-@patch("qaagent.web_ui.UnitTestGenerator")
-@patch("qaagent.web_ui.NextJsRouteDiscoverer")
-@patch("qaagent.web_ui.Workspace")
-@patch("qaagent.web_ui.TargetManager")
-def test_generate_tests_returns_file_count(
-    mock_target_mgr_cls,
-    mock_workspace_cls,
-    mock_discoverer_cls,
-    mock_generator_cls,
-    client: TestClient,
-):
-    """POST /api/commands/generate-tests returns integer files count from GenerationResult.file_count."""
-    # Mock TargetManager.get() → returns a target entry
+@pytest.fixture()
+def generate_tests_mocks(monkeypatch) -> SimpleNamespace:
+    """Replace the target, workspace, discovery and generator classes used by generate-tests.
+
+    Defaults describe a found target with no routes and an empty result;
+    tests override behavior on the returned class mocks.
+    """
+    mocks = SimpleNamespace(
+        target_mgr=MagicMock(),
+        workspace=MagicMock(),
+        discoverer=MagicMock(),
+        generator=MagicMock(),
+    )
     mock_entry = MagicMock()
     mock_entry.resolved_path.return_value = Path("/fake/repo")
-    mock_target_mgr_cls.return_value.get.return_value = mock_entry
+    mocks.target_mgr.return_value.get.return_value = mock_entry
+    mocks.workspace.return_value.get_tests_dir.return_value = Path("/fake/tests")
+    mocks.discoverer.return_value.discover.return_value = []
+    mocks.generator.return_value.generate.return_value = _make_generation_result(0)
+
+    monkeypatch.setattr("qaagent.web_ui.TargetManager", mocks.target_mgr)
+    monkeypatch.setattr("qaagent.web_ui.Workspace", mocks.workspace)
+    monkeypatch.setattr("qaagent.discovery.NextJsRouteDiscoverer", mocks.discoverer)
+    monkeypatch.setattr("qaagent.generators.unit_test_generator.UnitTestGenerator", mocks.generator)
+    return mocks
 
-    # Mock Workspace.get_tests_dir() → returns a path
-    mock_workspace_cls.return_value.get_tests_dir.return_value = Path("/fake/tests")
 
+def _post_generate(client: TestClient, target: str = "test-repo"):
+    return client.post("/api/commands/generate-tests", json={
+        "target": target,
+        "command": "generate-tests",
+        "params": {},
+    })
+
+
+def test_generate_tests_returns_file_count(client: TestClient, generate_tests_mocks: SimpleNamespace):
+    """POST /api/commands/generate-tests returns integer files count from GenerationResult.file_count."""
     # Mock route discovery → returns a list of fake routes
-    mock_discoverer_cls.return_value.discover.return_value = [MagicMock(), MagicMock()]
+    generate_tests_mocks.discoverer.return_value.discover.return_value = [MagicMock(), MagicMock()]
 
     # Mock generator.generate() → returns a GenerationResult (NOT a list)
     expected_count = 5
-    mock_generator_cls.return_value.generate.return_value = _make_generation_result(expected_count)
+    generate_tests_mocks.generator.return_value.generate.return_value = _make_generation_result(expected_count)
 
-    response = client.post("/api/commands/generate-tests", json={
-        "target": "test-repo",
-        "command": "generate-tests",
-        "params": {},
-    })
+    response = _post_generate(client)
 
     assert response.status_code == 200, response.text
     body = response.json()
@@ -75,30 +92,9 @@ def test_generate_tests_returns_file_count(
     assert isinstance(body["files"], int)
 
 
-@patch("qaagent.web_ui.UnitTestGenerator")
-@patch("qaagent.web_ui.NextJsRouteDiscoverer")
-@patch("qaagent.web_ui.Workspace")
-@patch("qaagent.web_ui.TargetManager")
-def test_generate_tests_zero_files(
-    mock_target_mgr_cls,
-    mock_workspace_cls,
-    mock_discoverer_cls,
-    mock_generator_cls,
-    client: TestClient,
-):
+def test_generate_tests_zero_files(client: TestClient, generate_tests_mocks: SimpleNamespace):
     """Endpoint handles GenerationResult with zero files correctly."""
-    mock_entry = MagicMock()
-    mock_entry.resolved_path.return_value = Path("/fake/repo")
-    mock_target_mgr_cls.return_value.get.return_value = mock_entry
-    mock_workspace_cls.return_value.get_tests_dir.return_value = Path("/fake/tests")
-    mock_discoverer_cls.return_value.discover.return_value = []
-    mock_generator_cls.return_value.generate.return_value = _make_generation_result(0)
-
-    response = client.post("/api/commands/generate-tests", json={
-        "target": "test-repo",
-        "command": "generate-tests",
-        "params": {},
-    })
+    response = _post_generate(client)
 
     assert response.status_code == 200, response.text
     body = response.json()
@@ -106,19 +102,39 @@ def test_generate_tests_zero_files(
     assert body["files"] == 0
 
 
-@patch("qaagent.web_ui.TargetManager")
-def test_generate_tests_target_not_found(
-    mock_target_mgr_cls,
-    client: TestClient,
+def test_generate_tests_runs_blocking_work_off_event_loop(
+    client: TestClient, generate_tests_mocks: SimpleNamespace, monkeypatch,
 ):
+    """Discovery and generation run in worker threads, not on the event loop."""
+    threads = {}
+
+    async def record_loop_thread(message):
+        threads["loop"] = threading.current_thread()
+
+    def record_thread(name, result):
+        def side_effect(*args, **kwargs):
+            threads[name] = threading.current_thread()
+            return result
+        return side_effect
+
+    generate_tests_mocks.discoverer.return_value.discover.side_effect = record_thread("discover", [])
+    generate_tests_mocks.generator.return_value.generate.side_effect = record_thread(
+        "generate", _make_generation_result(1)
+    )
+    monkeypatch.setattr("qaagent.web_ui.broadcast", record_loop_thread)
+
+    response = _post_generate(client)
+
+    assert response.status_code == 200, response.text
+    assert threads["discover"] is not threads["loop"]
+    assert threads["generate"] is not threads["loop"]
+
+
+def test_generate_tests_target_not_found(client: TestClient, generate_tests_mocks: SimpleNamespace):
     """Endpoint returns 404 when target is not found."""
-    mock_target_mgr_cls.return_value.get.return_value = None
+    generate_tests_mocks.target_mgr.return_value.get.return_value = None
 
-    response = client.post("/api/commands/generate-tests", json={
-        "target": "nonexistent",
-        "command": "generate-tests",
-        "params": {},
-    })
+    response = _post_generate(client, target="nonexistent")
 
     assert response.status_code == 404
     body = response.json()
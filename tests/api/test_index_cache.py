@@ -0,0 +1,85 @@
+"""Tests for the in-memory React index.html cache."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+web_ui = pytest.importorskip("qaagent.web_ui")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_db(tmp_path):
+    from qaagent import db
+    db.reset_connection()
+    db.set_db_path(str(tmp_path / "test.db"))
+    yield
+    db.reset_connection()
+
+
+@pytest.fixture()
+def index_file(tmp_path):
+    index = tmp_path / "index.html"
+    index.write_text("<html>v1</html>")
+    with patch.object(web_ui, "dashboard_index", index), patch.object(web_ui, "_index_cache", None):
+        yield index
+
+
+def test_serves_index_with_validators(index_file, client):
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.text == "<html>v1</html>"
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["etag"]
+    assert response.headers["last-modified"]
+
+
+def test_reads_file_once_while_unchanged(index_file, client):
+    with patch.object(type(index_file), "read_bytes", autospec=True,
+                      side_effect=lambda self: b"<html>v1</html>") as mock_read:
+        client.get("/")
+        client.get("/some/client/route")
+
+    assert mock_read.call_count == 1
+
+
+def test_rereads_after_rebuild(index_file, client):
+    client.get("/")
+    index_file.write_text("<html>v2</html>")
+    stat = index_file.stat()
+    os.utime(index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert client.get("/").text == "<html>v2</html>"
+
+
+def test_if_none_match_returns_304(index_file, client):
+    etag = client.get("/").headers["etag"]
+
+    response = client.get("/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_if_modified_since_returns_304(index_file, client):
+    last_modified = client.get("/").headers["last-modified"]
+
+    response = client.get("/dashboard", headers={"If-Modified-Since": last_modified})
+
+    assert response.status_code == 304
+
+
+def test_stale_etag_returns_body(index_file, client):
+    response = client.get("/", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.text == "<html>v1</html>"
+
+
+def test_missing_build_reports_error(tmp_path, client):
+    with patch.object(web_ui, "dashboard_index", tmp_path / "missing.html"):
+        assert client.get("/").status_code == 500
+        assert client.get("/dashboard").status_code == 404
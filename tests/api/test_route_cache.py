@@ -0,0 +1,93 @@
+"""Tests for the web UI's cached route discovery."""
+
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+web_ui = pytest.importorskip("qaagent.web_ui")
+
+from qaagent.analyzers.models import Route  # noqa: E402
+from qaagent.discovery import NextJsRouteDiscoverer  # noqa: E402
+
+ROUTE_SOURCE = "export async function GET() { return Response.json([]) }\n"
+
+
+@pytest.fixture
+def project(tmp_path):
+    users = tmp_path / "app" / "api" / "users"
+    users.mkdir(parents=True)
+    (users / "route.ts").write_text(ROUTE_SOURCE)
+    return tmp_path
+
+
+def _entry(root):
+    return SimpleNamespace(resolved_path=lambda: root)
+
+
+def _discovered(self):
+    return [Route(path="/api/users", method="GET", auth_required=False)]
+
+
+def test_reuses_routes_while_files_unchanged(project):
+    with patch.dict(web_ui._discover_cache, clear=True), \
+            patch.object(NextJsRouteDiscoverer, "discover",
+                         autospec=True, side_effect=_discovered) as mock_discover:
+        first = web_ui._get_routes(_entry(project))
+        second = web_ui._get_routes(_entry(project))
+
+    assert first == second == _discovered(None)
+    assert mock_discover.call_count == 1
+
+
+def test_rediscovers_when_route_files_change(project):
+    with patch.dict(web_ui._discover_cache, clear=True), \
+            patch.object(NextJsRouteDiscoverer, "discover",
+                         autospec=True, side_effect=_discovered) as mock_discover:
+        web_ui._get_routes(_entry(project))
+
+        orders = project / "app" / "api" / "orders"
+        orders.mkdir()
+        (orders / "route.ts").write_text(ROUTE_SOURCE)
+        web_ui._get_routes(_entry(project))
+
+        users_route = project / "app" / "api" / "users" / "route.ts"
+        stat = users_route.stat()
+        os.utime(users_route, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        web_ui._get_routes(_entry(project))
+
+    assert mock_discover.call_count == 3
+
+
+def test_rediscovers_when_file_replaced_with_same_mtime(project):
+    users_route = project / "app" / "api" / "users" / "route.ts"
+    with patch.dict(web_ui._discover_cache, clear=True), \
+            patch.object(NextJsRouteDiscoverer, "discover",
+                         autospec=True, side_effect=_discovered) as mock_discover:
+        web_ui._get_routes(_entry(project))
+
+        # Same file count and newest mtime, but a different file
+        stat = users_route.stat()
+        orders = project / "app" / "api" / "orders"
+        orders.mkdir()
+        users_route.rename(orders / "route.ts")
+        os.utime(orders / "route.ts", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        web_ui._get_routes(_entry(project))
+
+    assert mock_discover.call_count == 2
+
+
+def test_returned_routes_do_not_alias_cache(project):
+    with patch.dict(web_ui._discover_cache, clear=True), \
+            patch.object(NextJsRouteDiscoverer, "discover",
+                         autospec=True, side_effect=_discovered):
+        first = web_ui._get_routes(_entry(project))
+        first[0].tags.append("mutated")
+        first[0].metadata["risk"] = "high"
+        second = web_ui._get_routes(_entry(project))
+
+    assert second[0].tags == []
+    assert second[0].metadata == {}
@@ -0,0 +1,65 @@
+"""Tests for GET /api/targets."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("qaagent.web_ui")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolated_db(tmp_path):
+    from qaagent import db
+    db.reset_connection()
+    db.set_db_path(str(tmp_path / "test.db"))
+    yield
+    db.reset_connection()
+
+
+def _entry(name: str) -> MagicMock:
+    entry = MagicMock()
+    entry.name = name
+    entry.path = f"/repos/{name}"
+    entry.project_type = "nextjs"
+    return entry
+
+
+@patch("qaagent.web_ui.TargetManager")
+def test_list_targets_marks_active_once(mock_target_mgr_cls, client: TestClient):
+    manager = mock_target_mgr_cls.return_value
+    manager.list_targets.return_value = [_entry("a"), _entry("b"), _entry("c")]
+    manager.get_active.return_value = _entry("b")
+
+    response = client.get("/api/targets")
+
+    assert response.status_code == 200, response.text
+    flags = {t["name"]: t["is_active"] for t in response.json()["targets"]}
+    assert flags == {"a": False, "b": True, "c": False}
+    manager.get_active.assert_called_once()
+
+
+@patch("qaagent.web_ui.TargetManager")
+def test_list_targets_without_active(mock_target_mgr_cls, client: TestClient):
+    manager = mock_target_mgr_cls.return_value
+    manager.list_targets.return_value = [_entry("a")]
+    manager.get_active.return_value = None
+
+    response = client.get("/api/targets")
+
+    assert response.json()["targets"][0]["is_active"] is False
+
+
+@patch("qaagent.web_ui.TargetManager")
+def test_list_targets_gzip_compressed(mock_target_mgr_cls, client: TestClient):
+    manager = mock_target_mgr_cls.return_value
+    manager.list_targets.return_value = [_entry(f"target-{i}") for i in range(50)]
+    manager.get_active.return_value = None
+
+    response = client.get("/api/targets", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["targets"]) == 50
@@ -0,0 +1,38 @@
+"""Tests for start_web_ui() server selection."""
+
+from __future__ import annotations
+
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+web_ui = pytest.importorskip("qaagent.web_ui")
+
+
+def test_prefers_granian_when_installed():
+    granian = ModuleType("granian")
+    granian.Granian = MagicMock()
+    constants = ModuleType("granian.constants")
+    constants.Interfaces = MagicMock()
+
+    with patch.dict(sys.modules, {"granian": granian, "granian.constants": constants}), \
+            patch("uvicorn.run") as mock_uvicorn:
+        web_ui.start_web_ui(host="127.0.0.1", port=9000)
+
+    granian.Granian.assert_called_once_with(
+        "qaagent.web_ui:app",
+        address="127.0.0.1",
+        port=9000,
+        interface=constants.Interfaces.ASGI,
+    )
+    granian.Granian.return_value.serve.assert_called_once()
+    mock_uvicorn.assert_not_called()
+
+
+def test_falls_back_to_uvicorn():
+    with patch.dict(sys.modules, {"granian": None}), patch("uvicorn.run") as mock_uvicorn:
+        web_ui.start_web_ui(host="127.0.0.1", port=9000)
+
+    mock_uvicorn.assert_called_once_with(web_ui.app, host="127.0.0.1", port=9000)
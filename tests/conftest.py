@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import importlib.util
 import os
 import socket
 import subprocess
 import sys
 import time
-import urllib.request
+import urllib.parse
 from pathlib import Path
 from typing import Iterator
 
@@ -27,19 +28,50 @@ def _find_free_port() -> int:
         return s.getsockname()[1]
 
 
-def _wait_for_http(url: str, timeout: float = 15.0) -> None:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+def _probe_http(address: tuple, request: bytes) -> bool:
+    """Send one raw GET over a fresh connection; True if the server answered 2xx-4xx."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(1.0)
+        if s.connect_ex(address) != 0:
+            return False
         try:
-            with urllib.request.urlopen(url, timeout=1.0) as response:
-                if 200 <= response.status < 500:
-                    return
-        except Exception:
-            pass
-        time.sleep(0.3)
+            s.sendall(request)
+            status_line = s.recv(64).split(b"\r\n", 1)[0]
+        except OSError:
+            return False
+    # e.g. b"HTTP/1.1 200 OK"
+    fields = status_line.split()
+    return len(fields) >= 2 and fields[1].isdigit() and 200 <= int(fields[1]) < 500
+
+
+def _wait_for_http(url: str, timeout: float = 15.0) -> None:
+    """Poll until url answers, backing off from 5 ms to 50 ms between probes."""
+    parts = urllib.parse.urlsplit(url)
+    address = (parts.hostname, parts.port or 80)
+    request = (
+        f"GET {parts.path or '/'} HTTP/1.0\r\nHost: {parts.netloc}\r\n\r\n"
+    ).encode("ascii")
+    deadline = time.monotonic() + timeout
+    delay = 0.005
+    while time.monotonic() < deadline:
+        if _probe_http(address, request):
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
     raise RuntimeError(f"Timed out waiting for {url}")
 
 
+def pytest_collection_modifyitems(config, items) -> None:
+    """Skip petstore_server tests up front when its server stack is missing."""
+    missing = [name for name in ("uvicorn", "fastapi") if importlib.util.find_spec(name) is None]
+    if not missing:
+        return
+    skip = pytest.mark.skip(reason=f"petstore server requires {', '.join(missing)}")
+    for item in items:
+        if "petstore_server" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="session")
 def project_root() -> Path:
     return _root()
@@ -48,8 +80,6 @@ def project_root() -> Path:
 @pytest.fixture(scope="session")
 def petstore_server(project_root: Path) -> Iterator[str]:
     """Start the FastAPI petstore server for integration tests."""
-    pytest.importorskip("uvicorn")
-    pytest.importorskip("fastapi")
     host = "127.0.0.1"
     port = _find_free_port()
     cmd = [
@@ -63,6 +93,7 @@ def petstore_server(project_root: Path) -> Iterator[str]:
         host,
         "--port",
         str(port),
+        "--no-access-log",
     ]
     env = os.environ.copy()
     env.setdefault("UVICORN_LOG_LEVEL", "warning")
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
+from qaagent.evidence import writer as writer_module
 from qaagent.evidence.run_manager import RunManager
 from qaagent.evidence.writer import EvidenceWriter, JsonlWriter
 
@@ -52,6 +54,17 @@ class TestJsonlWriter:
         lines = path.read_text().strip().splitlines()
         assert len(lines) == 3
 
+    def test_append_stdlib_json_fallback(self, tmp_path: Path):
+        """Test records round-trip identically without orjson."""
+        records = [{"id": 1, "msg": "café ✓", "big": 2 ** 70}]
+        with patch.object(writer_module, "orjson", None):
+            JsonlWriter(tmp_path / "stdlib.jsonl").append(records)
+        JsonlWriter(tmp_path / "default.jsonl").append(records)
+
+        for name in ("stdlib.jsonl", "default.jsonl"):
+            lines = (tmp_path / name).read_text(encoding="utf-8").splitlines()
+            assert [json.loads(line) for line in lines] == records
+
 
 class TestEvidenceWriter:
     def _make_handle(self, tmp_path: Path):
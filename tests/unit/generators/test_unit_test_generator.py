@@ -40,6 +40,17 @@ class TestUnitTestGenerator:
         assert generator.base_url == "http://localhost:8000"
         assert generator.jinja_env is not None
 
+    def test_templates_compiled_once_across_instances(self) -> None:
+        """Generators share one environment, so templates are not recompiled."""
+        first = UnitTestGenerator(routes=[sample_route()])
+        second = UnitTestGenerator(routes=[sample_route(path="/owners")])
+
+        assert first.jinja_env is second.jinja_env
+        assert (
+            first.jinja_env.get_template("conftest.py.j2")
+            is second.jinja_env.get_template("conftest.py.j2")
+        )
+
     def test_group_routes_by_resource(self) -> None:
         """Test route grouping by resource name."""
         routes = [
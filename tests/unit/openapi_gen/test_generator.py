@@ -4,10 +4,14 @@ Unit tests for OpenAPIGenerator
 
 from __future__ import annotations
 
+import json
+from unittest.mock import patch
+
 import pytest
 
 from qaagent.analyzers.models import Route, RouteSource
-from qaagent.openapi_gen import OpenAPIGenerator
+from qaagent.openapi_gen import OpenAPIGenerator, write_spec_json
+from qaagent.openapi_gen import generator as generator_module
 
 
 class TestOpenAPIGenerator:
@@ -405,3 +409,23 @@ class TestOpenAPIGenerator:
         assert "200" in operation["responses"]
         assert "422" in operation["responses"]
         assert operation["operationId"] == "updateUser"
+
+
+class TestWriteSpecJson:
+    """Tests for write_spec_json()."""
+
+    SPEC = {"openapi": "3.0.0", "info": {"title": "Café API"}, "paths": {}}
+
+    def test_writes_indented_json(self, tmp_path):
+        out = tmp_path / "openapi.json"
+        write_spec_json(self.SPEC, out)
+
+        assert json.loads(out.read_text(encoding="utf-8")) == self.SPEC
+        assert '\n  "info": {' in out.read_text(encoding="utf-8")
+
+    def test_stdlib_fallback(self, tmp_path):
+        out = tmp_path / "openapi.json"
+        with patch.object(generator_module, "orjson", None):
+            write_spec_json(self.SPEC, out)
+
+        assert json.loads(out.read_text(encoding="utf-8")) == self.SPEC
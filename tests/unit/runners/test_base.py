@@ -1,5 +1,5 @@
 """Tests for runner base models."""
-from qaagent.runners.base import TestCase, TestResult, TestRunner
+from qaagent.runners.base import TestCase, TestResult, TestRunner, tally_cases
 from qaagent.config.models import RunSettings
 
 
@@ -53,6 +53,26 @@ class TestTestResult:
         )
         assert r.artifacts["junit"] == "/tmp/junit.xml"
 
+    def test_iadd_accumulates_counters(self):
+        total = TestResult(suite_name="all", runner="orchestrator")
+        total += TestResult(suite_name="unit", runner="pytest", passed=3, failed=1, duration=1.5)
+        total += TestResult(suite_name="e2e", runner="playwright", errors=2, skipped=1, duration=2.0)
+        assert (total.passed, total.failed, total.errors, total.skipped) == (3, 1, 2, 1)
+        assert total.duration == 3.5
+        assert total.suite_name == "all"
+
+    def test_tally_cases(self):
+        cases = [
+            TestCase(name="a", status="passed", duration=1.0),
+            TestCase(name="b", status="failed", duration=0.5),
+            TestCase(name="c", status="error", duration=0.25),
+            TestCase(name="d", status="skipped"),
+            TestCase(name="e", status="passed", duration=1.0),
+        ]
+        counts, duration = tally_cases(cases)
+        assert counts == {"passed": 2, "failed": 1, "errors": 1, "skipped": 1}
+        assert duration == 2.75
+
 
 class TestTestRunnerRouteMapping:
     """Test the _map_test_to_route method via a concrete subclass."""
@@ -92,6 +112,15 @@ class TestTestRunnerRouteMapping:
         r = self._ConcreteRunner()
         assert r._map_test_to_route("test_something_random") is None
 
+    def test_only_one_outcome_suffix_stripped(self):
+        r = self._ConcreteRunner()
+        assert r._map_test_to_route("test_get_pets_error_success") == "GET /pets/error"
+
+    def test_consecutive_params(self):
+        r = self._ConcreteRunner()
+        result = r._map_test_to_route("test_put_owners_owner_pk_pets_pet_uuid_invalid_data")
+        assert result == "PUT /owners/{owner_pk}/pets/{pet_uuid}"
+
 
 class TestRunSettings:
     def test_defaults(self):
@@ -4,6 +4,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from qaagent.runners.behave_runner import BehaveRunner
+from qaagent.runners.junit_parser import parse_junit_xml
 from qaagent.tools import CmdResult
 
 FIXTURES = Path(__file__).resolve().parent.parent.parent / "fixtures" / "junit"
@@ -26,6 +27,37 @@ class TestBehaveRunner:
         assert result.skipped == 0
         assert result.returncode == 1  # errors > 0
 
+    def test_parse_results_many_features_keeps_file_order(self, tmp_path):
+        """Test parsing enough feature files to use the thread pool."""
+        junit_dir = tmp_path / "behave-junit"
+        junit_dir.mkdir()
+        for feature in ("a", "b", "c", "d"):
+            (junit_dir / f"TESTS-{feature}.xml").write_text(
+                f'<testsuite name="{feature}"><testcase name="{feature}_scenario" time="0.5"/></testsuite>'
+            )
+
+        runner = BehaveRunner(output_dir=tmp_path)
+        result = runner.parse_results(junit_dir)
+
+        assert [c.name for c in result.cases] == ["a_scenario", "b_scenario", "c_scenario", "d_scenario"]
+        assert result.passed == 4
+        assert result.duration == 2.0
+
+    def test_parse_results_skips_empty_and_tiny_files(self, tmp_path):
+        """Test that files too small to hold a testcase are not parsed."""
+        junit_dir = tmp_path / "behave-junit"
+        junit_dir.mkdir()
+        shutil.copy(FIXTURES / "behave_sample.xml", junit_dir / "TESTS-pets.xml")
+        (junit_dir / "TESTS-empty.xml").write_text("")
+        (junit_dir / "TESTS-bare.xml").write_text("<testsuite/>")
+
+        runner = BehaveRunner(output_dir=tmp_path)
+        with patch("qaagent.runners.behave_runner.parse_junit_xml", wraps=parse_junit_xml) as parse:
+            result = runner.parse_results(junit_dir)
+
+        parse.assert_called_once_with(junit_dir / "TESTS-pets.xml")
+        assert result.total == 3
+
     def test_parse_results_from_single_file(self, tmp_path):
         """Test parsing a single JUnit XML file."""
         runner = BehaveRunner(output_dir=tmp_path)
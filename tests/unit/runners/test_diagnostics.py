@@ -93,6 +93,35 @@ class TestHeuristicDiagnostics:
         assert result.category == CATEGORY_UNKNOWN
         assert result.confidence == 0.3
 
+    def test_category_priority_not_text_position(self):
+        case = TestCase(
+            name="test_example",
+            status="failed",
+            error_message="AssertionError: Expected 200 but got 504 after request timed out",
+        )
+        result = self.diag.analyze_failure(case)
+        assert result.category == CATEGORY_TIMEOUT
+
+    def test_error_message_takes_precedence_over_output(self):
+        case = TestCase(
+            name="test_example",
+            status="failed",
+            error_message="AssertionError: expected 'hello' but got 'world'",
+            output="retrying after socket timeout",
+        )
+        result = self.diag.analyze_failure(case)
+        assert result.category == CATEGORY_ASSERTION
+
+    def test_output_scan_is_bounded(self):
+        case = TestCase(
+            name="test_example",
+            status="error",
+            error_message="",
+            output="x" * 10000 + " ECONNREFUSED",
+        )
+        result = self.diag.analyze_failure(case)
+        assert result.category == CATEGORY_UNKNOWN
+
     def test_output_used_for_classification(self):
         case = TestCase(
             name="test_example",
@@ -150,6 +179,45 @@ class TestLLMDiagnostics:
         # Falls back to heuristic
         assert result.category == CATEGORY_ASSERTION
 
+    def test_parse_llm_response_fields_case_insensitive(self):
+        diag = FailureDiagnostics(LLMSettings(enabled=False))
+        case = TestCase(name="test_example", status="failed", error_message="boom")
+        result = diag._parse_llm_diagnostic(
+            "  root_cause: Token expired\r\nNotes: ignored\nCategory: AUTH\nconfidence: 2\n",
+            case,
+        )
+
+        assert result.root_cause == "Token expired"
+        assert result.category == CATEGORY_AUTH
+        assert result.confidence == 1.0
+        assert result.suggestion == "Review the full error output."
+
+    def test_parse_llm_response_indented_fields(self):
+        diag = FailureDiagnostics(LLMSettings(enabled=False))
+        case = TestCase(name="test_example", status="failed", error_message="boom")
+        result = diag._parse_llm_diagnostic(
+            "Diagnosis:\n  ROOT_CAUSE: Request hung\n  CATEGORY: timeout\n"
+            "\tSUGGESTION: Raise the timeout\n  CONFIDENCE: 0.7\n",
+            case,
+        )
+
+        assert result.root_cause == "Request hung"
+        assert result.category == CATEGORY_TIMEOUT
+        assert result.suggestion == "Raise the timeout"
+        assert result.confidence == 0.7
+
+    def test_unavailable_llm_probed_once(self):
+        with patch("qaagent.llm.LLMClient") as client_cls:
+            client_cls.return_value.available.return_value = False
+            diag = FailureDiagnostics(LLMSettings(enabled=True))
+            case = TestCase(name="test_example", status="failed", error_message="assert False")
+
+            diag.analyze_failure(case)
+            result = diag.analyze_failure(case)
+
+        assert result.category == CATEGORY_ASSERTION
+        client_cls.assert_called_once()
+
     def test_parse_invalid_llm_response(self):
         mock_llm = MagicMock()
         mock_llm.available.return_value = True
@@ -250,3 +318,140 @@ class TestRunSummary:
         assert summary.summary_text == "LLM-generated summary of test failures."
         # chat called twice: once for analyze_failure, once for summarize_run
         assert mock_llm.chat.call_count == 2
+        assert diag.used_llm is True
+
+    def test_used_llm_false_when_summary_falls_back(self):
+        mock_llm = MagicMock()
+        diagnosis = MagicMock()
+        diagnosis.content = "ROOT_CAUSE: Bad math\nCATEGORY: assertion\nSUGGESTION: Fix\nCONFIDENCE: 0.9"
+        mock_llm.chat.side_effect = [diagnosis, Exception("provider down")]
+
+        diag = FailureDiagnostics(LLMSettings(enabled=True))
+        diag._llm_client = mock_llm
+
+        suites = {
+            "unit": TestResult(
+                suite_name="unit", runner="pytest", failed=1,
+                cases=[TestCase(name="t1", status="failed", error_message="assert 1 == 2")],
+            ),
+        }
+        diag.summarize_run(suites)
+
+        assert diag.used_llm is False
+
+    def test_llm_batches_multiple_failures(self):
+        mock_llm = MagicMock()
+        batch_response = MagicMock()
+        batch_response.content = (
+            "```json\n"
+            '[{"root_cause": "Wrong total", "category": "assertion", "suggestion": "Fix math", "confidence": 0.9},'
+            ' {"root_cause": "Slow API", "category": "timeout", "suggestion": "Raise timeout", "confidence": 0.7}]\n'
+            "```"
+        )
+        summary_response = MagicMock()
+        summary_response.content = "Two failures."
+        mock_llm.chat.side_effect = [batch_response, summary_response]
+
+        diag = FailureDiagnostics(LLMSettings(enabled=True))
+        diag._llm_client = mock_llm
+
+        suites = {
+            "unit": TestResult(
+                suite_name="unit", runner="pytest", failed=2,
+                cases=[
+                    TestCase(name="t1", status="failed", error_message="assert 1 == 2"),
+                    TestCase(name="t2", status="failed", error_message="read timed out"),
+                ],
+            ),
+        }
+        summary = diag.summarize_run(suites)
+
+        assert mock_llm.chat.call_count == 2
+        assert [d.root_cause for d in summary.diagnostics] == ["Wrong total", "Slow API"]
+        assert summary.categories == {CATEGORY_ASSERTION: 1, CATEGORY_TIMEOUT: 1}
+
+    def test_llm_batch_mismatch_falls_back_per_failure(self):
+        mock_llm = MagicMock()
+        bad_batch = MagicMock()
+        bad_batch.content = '[{"root_cause": "only one"}]'
+        single = MagicMock()
+        single.content = "ROOT_CAUSE: x\nCATEGORY: data\nSUGGESTION: y\nCONFIDENCE: 0.5"
+        summary_response = MagicMock()
+        summary_response.content = "Summary."
+        mock_llm.chat.side_effect = [bad_batch, single, single, summary_response]
+
+        diag = FailureDiagnostics(LLMSettings(enabled=True))
+        diag._llm_client = mock_llm
+
+        suites = {
+            "unit": TestResult(
+                suite_name="unit", runner="pytest", failed=2,
+                cases=[
+                    TestCase(name="t1", status="failed", error_message="a"),
+                    TestCase(name="t2", status="failed", error_message="b"),
+                ],
+            ),
+        }
+        summary = diag.summarize_run(suites)
+
+        assert mock_llm.chat.call_count == 4
+        assert summary.categories == {CATEGORY_DATA: 2}
+
+    def test_identical_failures_diagnosed_once(self):
+        mock_llm = MagicMock()
+        single = MagicMock()
+        single.content = "ROOT_CAUSE: Server error\nCATEGORY: data\nSUGGESTION: Check API\nCONFIDENCE: 0.8"
+        summary_response = MagicMock()
+        summary_response.content = "Summary."
+        mock_llm.chat.side_effect = [single, summary_response]
+
+        diag = FailureDiagnostics(LLMSettings(enabled=True))
+        diag._llm_client = mock_llm
+
+        suites = {
+            "unit": TestResult(
+                suite_name="unit", runner="pytest", failed=3,
+                cases=[
+                    TestCase(name=f"t{i}", status="failed", error_message="HTTP 500 from /pets")
+                    for i in range(3)
+                ],
+            ),
+        }
+        summary = diag.summarize_run(suites)
+
+        assert mock_llm.chat.call_count == 2
+        assert summary.total_failures == 3
+        assert len(summary.diagnostics) == 3
+        assert summary.categories == {CATEGORY_DATA: 3}
+
+    def test_same_generic_message_diagnosed_by_output(self):
+        suites = {
+            "unit": TestResult(
+                suite_name="unit", runner="pytest", failed=2,
+                cases=[
+                    TestCase(name="t1", status="failed", error_message="Test failed",
+                             output="requests.exceptions.ReadTimeout: Read timed out"),
+                    TestCase(name="t2", status="failed", error_message="Test failed",
+                             output="HTTP 401 Unauthorized"),
+                ],
+            ),
+        }
+        summary = FailureDiagnostics(LLMSettings(enabled=False)).summarize_run(suites)
+
+        assert [d.category for d in summary.diagnostics] == [CATEGORY_TIMEOUT, CATEGORY_AUTH]
+        assert summary.categories == {CATEGORY_TIMEOUT: 1, CATEGORY_AUTH: 1}
+
+    def test_long_messages_with_shared_prefix_keep_own_root_cause(self):
+        prefix = "AssertionError: " + "x" * 300
+        suites = {
+            "unit": TestResult(
+                suite_name="unit", runner="pytest", failed=2,
+                cases=[
+                    TestCase(name="t1", status="failed", error_message=prefix + " first"),
+                    TestCase(name="t2", status="failed", error_message=prefix + " second"),
+                ],
+            ),
+        }
+        summary = FailureDiagnostics(LLMSettings(enabled=False)).summarize_run(suites)
+
+        assert [d.root_cause for d in summary.diagnostics] == [prefix + " first", prefix + " second"]
@@ -1,4 +1,5 @@
 """Tests for JUnit XML parser."""
+import importlib
 from pathlib import Path
 
 from qaagent.runners.junit_parser import parse_junit_xml
@@ -66,3 +67,46 @@ class TestJunitParser:
         cases = parse_junit_xml(FIXTURES / "pytest_sample.xml")
         assert all(c.classname is not None for c in cases)
         assert cases[0].classname == "test_pets_api.TestPetsAPI"
+
+    def test_parse_multiple_suites(self, tmp_path):
+        xml_file = tmp_path / "multi.xml"
+        xml_file.write_text(
+            "<testsuites>"
+            '<testsuite name="a"><testcase name="t1" time="0.1"/></testsuite>'
+            '<testsuite name="b"><testcase name="t2" time="0.2"><skipped message="skip"/></testcase></testsuite>'
+            "</testsuites>"
+        )
+        cases = parse_junit_xml(xml_file)
+        assert [c.name for c in cases] == ["t1", "t2"]
+        assert cases[1].status == "skipped"
+        assert cases[1].error_message == "skip"
+
+    def test_parse_interleaved_suite_children(self, tmp_path):
+        xml_file = tmp_path / "many.xml"
+        cases_xml = "".join(
+            f'<testcase name="t{i}" time="0.1"><failure message="m{i}">trace</failure></testcase>'
+            + ("<system-out>suite log</system-out>" if i % 50 == 0 else "")
+            for i in range(200)
+        )
+        xml_file.write_text(f'<testsuite name="s">{cases_xml}</testsuite>')
+        cases = parse_junit_xml(xml_file)
+        assert [c.name for c in cases] == [f"t{i}" for i in range(200)]
+        assert cases[199].error_message == "m199"
+
+    def test_parse_unknown_root(self, tmp_path):
+        xml_file = tmp_path / "other.xml"
+        xml_file.write_text('<report><testcase name="t1"/></report>')
+        assert parse_junit_xml(xml_file) == []
+
+    def test_stdlib_backend_override(self, monkeypatch):
+        from qaagent.runners import junit_parser
+
+        monkeypatch.setenv("QAAGENT_XML_BACKEND", "stdlib")
+        try:
+            module = importlib.reload(junit_parser)
+            assert module.LXML_AVAILABLE is False
+            assert module.ET.__name__ == "xml.etree.ElementTree"
+            assert len(module.parse_junit_xml(FIXTURES / "pytest_sample.xml")) == 5
+        finally:
+            monkeypatch.delenv("QAAGENT_XML_BACKEND")
+            importlib.reload(junit_parser)
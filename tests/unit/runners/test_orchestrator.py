@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from qaagent.config.models import (
+    EnvironmentSettings,
     PlaywrightSuiteSettings,
     QAAgentProfile,
     ProjectSettings,
@@ -490,6 +491,42 @@ class TestRunOrchestrator:
         mock_pool.assert_called_once_with(max_workers=2)
         assert len(result.suites) == 2
 
+    @patch("qaagent.runners.orchestrator.RunManager")
+    def test_parallel_pool_sized_to_runnable_suites(self, MockRunManager, tmp_path):
+        """Suites whose test path is missing do not get a worker."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_handle = MagicMock()
+        mock_handle.artifacts_dir = tmp_path / "artifacts"
+        mock_handle.artifacts_dir.mkdir()
+        MockRunManager.return_value.create_run.return_value = mock_handle
+
+        profile = _make_profile(
+            tests=TestsSettings(
+                unit=SuiteSettings(enabled=True, output_dir=str(tmp_path / "unit")),
+                behave=SuiteSettings(enabled=True, output_dir=str(tmp_path / "missing")),
+                e2e=PlaywrightSuiteSettings(enabled=False, output_dir=str(tmp_path / "e2e")),
+            ),
+            run=RunSettings(suite_order=["unit", "behave"], parallel=True),
+        )
+        (tmp_path / "unit").mkdir()
+
+        mock_runner_cls = MagicMock()
+        mock_runner_cls.return_value.run.return_value = _success_result("unit")
+
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path)
+        with patch.dict(
+            "qaagent.runners.orchestrator._RUNNER_MAP",
+            {"unit": mock_runner_cls, "behave": mock_runner_cls},
+        ), patch(
+            "qaagent.runners.orchestrator.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as mock_pool:
+            result = orch.run_all()
+
+        mock_pool.assert_called_once_with(max_workers=1)
+        assert list(result.suites) == ["unit"]
+
     @patch("qaagent.runners.orchestrator.RunManager")
     def test_parallel_retry_on_failure(self, MockRunManager, tmp_path):
         """Retry logic still applies when parallel mode is enabled."""
@@ -525,3 +562,263 @@ class TestRunOrchestrator:
 
         assert mock_runner_inst.run.call_count == 2
         assert result.suites["unit"].success
+
+
+class TestCollectArtifacts:
+    def test_directory_artifacts_copied_recursively(self, tmp_path):
+        src = tmp_path / "test-results"
+        (src / "trace" / "nested").mkdir(parents=True)
+        (src / "empty").mkdir()
+        (src / "shot.png").write_bytes(b"png")
+        (src / "trace" / "trace.zip").write_bytes(b"zip")
+        (src / "trace" / "nested" / "video.webm").write_bytes(b"webm")
+
+        handle = MagicMock()
+        handle.artifacts_dir = tmp_path / "evidence"
+        result = TestResult(
+            suite_name="e2e",
+            runner="playwright",
+            artifacts={"test_results": str(src)},
+        )
+
+        orch = RunOrchestrator(config=_make_profile(), output_dir=tmp_path)
+        orch._collect_artifacts(handle, "e2e", result)
+
+        dest = tmp_path / "evidence" / "e2e" / "test_results"
+        assert (dest / "shot.png").read_bytes() == b"png"
+        assert (dest / "trace" / "trace.zip").read_bytes() == b"zip"
+        assert (dest / "trace" / "nested" / "video.webm").read_bytes() == b"webm"
+        assert (dest / "empty").is_dir()
+
+
+class TestWriteTestRecords:
+    def test_all_suites_written_in_one_batch(self, tmp_path):
+        from qaagent.runners.base import TestCase as TC
+
+        handle = MagicMock()
+        handle.run_id = "20260208_120000Z"
+        suite_results = [
+            ("unit", TestResult(suite_name="unit", runner="pytest",
+                                cases=[TC(name="test_a", status="passed")])),
+            ("behave", TestResult(suite_name="behave", runner="behave")),
+            ("e2e", TestResult(suite_name="e2e", runner="playwright",
+                               cases=[TC(name="login", status="failed")])),
+        ]
+
+        orch = RunOrchestrator(config=_make_profile(), output_dir=tmp_path)
+        with patch("qaagent.runners.orchestrator.EvidenceWriter") as MockWriter:
+            orch._write_test_records(handle, suite_results)
+
+        MockWriter.return_value.write_records.assert_called_once()
+        record_type, records = MockWriter.return_value.write_records.call_args[0]
+        assert record_type == "tests"
+        assert [r["kind"] for r in records] == ["unit", "e2e"]
+        # One ID sequence across the run, so IDs stay unique between suites
+        assert len({r["test_id"] for r in records}) == 2
+
+
+class TestResolvedSettings:
+    def test_suite_settings_resolved_from_config(self, tmp_path):
+        profile = _make_profile()
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path)
+        assert orch._get_suite_settings("unit") is profile.tests.unit
+        assert orch._get_suite_settings("e2e") is profile.tests.e2e
+        assert orch._get_suite_settings("unknown") is None
+
+    def test_base_url_resolved_once(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("BASE_URL", raising=False)
+        profile = _make_profile(app={"dev": EnvironmentSettings(base_url="http://dev:8000")})
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path)
+
+        mock_runner_cls = MagicMock()
+        with patch.object(orch, "_resolve_base_url") as mock_resolve, \
+                patch.dict("qaagent.runners.orchestrator._RUNNER_MAP", {"unit": mock_runner_cls}):
+            orch.run_suite("unit", tmp_path)
+            orch.run_suite("unit", tmp_path)
+
+        mock_resolve.assert_not_called()
+        assert mock_runner_cls.call_args.kwargs["base_url"] == "http://dev:8000"
+
+    def test_invalidate_base_url(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("BASE_URL", raising=False)
+        orch = RunOrchestrator(config=_make_profile(), output_dir=tmp_path)
+        assert orch._base_url is None
+
+        monkeypatch.setenv("BASE_URL", "http://env:9000")
+        assert orch._base_url is None
+        orch.invalidate_base_url()
+        assert orch._base_url == "http://env:9000"
+
+
+class TestRetryFailedCases:
+    def test_retry_reruns_only_failed_cases_and_merges(self, tmp_path):
+        from qaagent.runners.base import TestCase as TC
+
+        previous = TestResult(
+            suite_name="unit", runner="pytest", passed=2, failed=1, returncode=1,
+            cases=[
+                TC(name="test_a", classname="t.test_m", status="passed"),
+                TC(name="test_b", classname="t.test_m", status="failed"),
+                TC(name="test_c", classname="t.test_m", status="passed"),
+            ],
+        )
+        retry = TestResult(
+            suite_name="unit", runner="pytest", passed=1, returncode=0,
+            cases=[TC(name="test_b", classname="t.test_m", status="passed")],
+        )
+        profile = _make_profile(
+            run=RunSettings(retry_count=2, suite_order=["unit"]),
+        )
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path)
+
+        with patch.object(orch, "run_suite", return_value=retry) as mock_run_suite:
+            result = orch._retry_failed("unit", tmp_path, None, previous)
+
+        mock_run_suite.assert_called_once()
+        only = mock_run_suite.call_args.kwargs["only"]
+        assert [c.name for c in only] == ["test_b"]
+        assert result.success
+        assert result.passed == 3
+        assert [c.status for c in result.cases] == ["passed", "passed", "passed"]
+
+    def test_retry_backoff_skips_first_attempt(self, tmp_path):
+        previous = _failure_result("unit")
+        profile = _make_profile(
+            run=RunSettings(retry_count=3, suite_order=["unit"], retry_backoff_base=1.0, retry_backoff_max=3.0),
+        )
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path)
+
+        with patch.object(orch, "run_suite", return_value=_failure_result("unit")), \
+                patch("qaagent.runners.orchestrator.random.uniform", return_value=0.25), \
+                patch("qaagent.runners.orchestrator.time.sleep") as mock_sleep:
+            orch._retry_failed("unit", tmp_path, None, previous)
+
+        # Attempt 1 immediate, then 2s, then 4s capped at 3s, each plus jitter
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2.25, 3.25]
+
+
+class TestTestPathCache:
+    def test_parallel_resolves_each_path_once(self, tmp_path):
+        profile = _make_profile(
+            tests=TestsSettings(
+                unit=SuiteSettings(enabled=True, output_dir=str(tmp_path / "unit")),
+                behave=SuiteSettings(enabled=False, output_dir=str(tmp_path / "behave")),
+                e2e=PlaywrightSuiteSettings(enabled=False, output_dir=str(tmp_path / "e2e")),
+            ),
+            run=RunSettings(suite_order=["unit"], parallel=True),
+        )
+        (tmp_path / "unit").mkdir()
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path, run_handle=MagicMock())
+
+        with patch.object(orch, "run_suite", return_value=_success_result("unit")), \
+                patch.object(orch, "_resolve_test_path", wraps=orch._resolve_test_path) as mock_resolve, \
+                patch.object(orch, "_collect_artifacts"), patch.object(orch, "_write_test_records"):
+            orch.run_all()
+            orch.run_all()
+
+        # Pre-filter and worker share one lookup per run; each run_all starts fresh
+        assert mock_resolve.call_count == 2
+
+
+class TestRunnerReuse:
+    def test_retries_reuse_runner_and_output_dir(self, tmp_path):
+        previous = _failure_result("unit")
+        profile = _make_profile(run=RunSettings(retry_count=2, suite_order=["unit"], retry_backoff_base=0))
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path)
+
+        mock_runner_cls = MagicMock()
+        mock_runner_cls.return_value.run.return_value = _failure_result("unit")
+        with patch.dict("qaagent.runners.orchestrator._RUNNER_MAP", {"unit": mock_runner_cls}), \
+                patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            orch._retry_failed("unit", tmp_path, None, previous)
+
+        assert mock_runner_cls.return_value.run.call_count == 2
+        mock_runner_cls.assert_called_once()
+        mock_mkdir.assert_called_once()
+
+
+class TestDiagnosticsCache:
+    def _suites(self):
+        from qaagent.runners.base import TestCase as TC
+        return {"unit": TestResult(
+            suite_name="unit", runner="pytest", failed=1, returncode=1,
+            cases=[TC(name="test_x", status="failed", error_message="Connection refused")],
+        )}
+
+    def test_identical_failures_reuse_cached_diagnosis(self, tmp_path, monkeypatch):
+        from qaagent.config.models import LLMSettings
+        from qaagent.runners.diagnostics import RunDiagnosticSummary
+
+        monkeypatch.setenv("QAAGENT_HOME", str(tmp_path / "home"))
+        profile = _make_profile(llm=LLMSettings(enabled=True))
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path)
+        summary = RunDiagnosticSummary(total_failures=1, categories={"connection": 1}, summary_text="down")
+
+        with patch("qaagent.runners.orchestrator.FailureDiagnostics") as MockDiag:
+            MockDiag.return_value.summarize_run.return_value = summary
+            MockDiag.return_value.used_llm = True
+            first = orch._run_diagnostics(self._suites())
+            second = orch._run_diagnostics(self._suites())
+
+        MockDiag.return_value.summarize_run.assert_called_once()
+        assert first == summary
+        assert second == summary
+
+    def test_cache_disabled_with_zero_ttl(self, tmp_path, monkeypatch):
+        from qaagent.config.models import LLMSettings
+        from qaagent.runners.diagnostics import RunDiagnosticSummary
+
+        monkeypatch.setenv("QAAGENT_HOME", str(tmp_path / "home"))
+        profile = _make_profile(
+            llm=LLMSettings(enabled=True),
+            run=RunSettings(suite_order=["unit"], diagnostics_cache_ttl=0),
+        )
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path)
+
+        with patch("qaagent.runners.orchestrator.FailureDiagnostics") as MockDiag:
+            MockDiag.return_value.summarize_run.return_value = RunDiagnosticSummary()
+            orch._run_diagnostics(self._suites())
+            orch._run_diagnostics(self._suites())
+
+        assert MockDiag.return_value.summarize_run.call_count == 2
+        assert not (tmp_path / "home" / "cache").exists()
+
+    def test_heuristic_fallback_not_cached_when_llm_unavailable(self, tmp_path, monkeypatch):
+        from qaagent.config.models import LLMSettings
+
+        monkeypatch.setenv("QAAGENT_HOME", str(tmp_path / "home"))
+        profile = _make_profile(llm=LLMSettings(enabled=True))
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path)
+
+        with patch("qaagent.llm.LLMClient") as client_cls:
+            client_cls.return_value.available.return_value = False
+            summary = orch._run_diagnostics(self._suites())
+
+        assert summary is not None and summary.total_failures == 1
+        cache_dir = tmp_path / "home" / "cache" / "diagnostics"
+        assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+    def test_expired_entry_evicted(self, tmp_path, monkeypatch):
+        import os
+        from qaagent.config.models import LLMSettings
+        from qaagent.runners.diagnostics import RunDiagnosticSummary
+
+        monkeypatch.setenv("QAAGENT_HOME", str(tmp_path / "home"))
+        profile = _make_profile(
+            llm=LLMSettings(enabled=True),
+            run=RunSettings(suite_order=["unit"], diagnostics_cache_ttl=60),
+        )
+        orch = RunOrchestrator(config=profile, output_dir=tmp_path)
+        cache_dir = tmp_path / "home" / "cache" / "diagnostics"
+        cache_dir.mkdir(parents=True)
+        stale = cache_dir / "stale.json"
+        stale.write_text(RunDiagnosticSummary().model_dump_json(), encoding="utf-8")
+        os.utime(stale, (0, 0))
+
+        with patch("qaagent.runners.orchestrator.FailureDiagnostics") as MockDiag:
+            MockDiag.return_value.summarize_run.return_value = RunDiagnosticSummary(total_failures=1)
+            MockDiag.return_value.used_llm = True
+            orch._run_diagnostics(self._suites())
+
+        assert not stale.exists()
+        assert len(list(cache_dir.iterdir())) == 1
@@ -56,3 +56,35 @@ class TestPlaywrightRunner:
         assert mock_run.call_count == 2
         first_call = mock_run.call_args_list[0]
         assert "npm" in first_call[0][0]
+
+    @patch("qaagent.runners.playwright_runner.run_command")
+    @patch("qaagent.runners.playwright_runner.which", return_value="/usr/bin/npx")
+    def test_run_uses_npm_ci_once(self, mock_which, mock_run, tmp_path):
+        """Test npm ci is used with a lockfile and not repeated for the same project."""
+        (tmp_path / "package.json").write_text("{}")
+        (tmp_path / "package-lock.json").write_text("{}")
+        mock_run.return_value = CmdResult(returncode=1, stdout="", stderr="install failed")
+
+        runner = PlaywrightRunner(output_dir=tmp_path)
+        runner.run(tmp_path)
+        runner.run(tmp_path)
+
+        install_calls = [c for c in mock_run.call_args_list if c[0][0][0] == "npm"]
+        assert len(install_calls) == 1
+        assert install_calls[0][0][0] == ["npm", "ci", "--prefer-offline", "--no-audit", "--no-fund"]
+
+    @patch("qaagent.runners.playwright_runner.run_command")
+    @patch("qaagent.runners.playwright_runner.which", return_value="/usr/bin/npx")
+    def test_run_only_greps_titles(self, mock_which, mock_run, tmp_path):
+        """Test that `only` cases are selected with an escaped --grep."""
+        from qaagent.runners.base import TestCase
+        mock_run.return_value = CmdResult(returncode=0, stdout="", stderr="")
+
+        runner = PlaywrightRunner(output_dir=tmp_path)
+        runner.run(tmp_path, only=[
+            TestCase(name="Pets › lists pets (GET)", status="failed"),
+            TestCase(name="creates a pet", status="failed"),
+        ])
+
+        cmd = mock_run.call_args[0][0]
+        assert r"--grep=lists\ pets\ \(GET\)|creates\ a\ pet" in cmd
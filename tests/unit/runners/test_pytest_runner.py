@@ -86,3 +86,82 @@ class TestPytestRunner:
 
         _, kwargs = mock_run.call_args
         assert kwargs["timeout"] == 120
+
+    @patch("qaagent.runners.pytest_runner._python_has_xdist", return_value=True)
+    @patch("qaagent.runners.pytest_runner.run_command")
+    @patch("qaagent.runners.pytest_runner.which", return_value="/usr/bin/python")
+    def test_xdist_workers_from_settings(self, mock_which, mock_run, mock_has_xdist, tmp_path):
+        """Test that configured workers shard the run with pytest-xdist."""
+        from qaagent.config.models import RunSettings
+        mock_run.return_value = CmdResult(returncode=0, stdout="", stderr="")
+
+        runner = PytestRunner(output_dir=tmp_path, run_settings=RunSettings(workers=4))
+        runner.run(tmp_path / "tests")
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[-3:] == ["-n", "4", "--dist=loadfile"]
+
+    @patch("qaagent.runners.pytest_runner._python_has_xdist", return_value=False)
+    @patch("qaagent.runners.pytest_runner.run_command")
+    @patch("qaagent.runners.pytest_runner.which", return_value="/usr/bin/python")
+    def test_serial_without_xdist(self, mock_which, mock_run, mock_has_xdist, tmp_path):
+        """Test that runs stay serial when pytest-xdist is not installed."""
+        from qaagent.config.models import RunSettings
+        mock_run.return_value = CmdResult(returncode=0, stdout="", stderr="")
+
+        runner = PytestRunner(output_dir=tmp_path, run_settings=RunSettings(workers=4))
+        runner.run(tmp_path / "tests")
+
+        cmd = mock_run.call_args[0][0]
+        assert "-n" not in cmd
+
+    @patch("qaagent.runners.pytest_runner.subprocess.run")
+    def test_xdist_probed_in_target_interpreter(self, mock_subprocess_run):
+        """xdist is detected in the PATH python that runs the tests, once per interpreter."""
+        from qaagent.runners.pytest_runner import _python_has_xdist
+
+        _python_has_xdist.cache_clear()
+        mock_subprocess_run.return_value.returncode = 1
+        try:
+            assert _python_has_xdist("/project/venv/bin/python") is False
+            assert _python_has_xdist("/project/venv/bin/python") is False
+        finally:
+            _python_has_xdist.cache_clear()
+
+        mock_subprocess_run.assert_called_once()
+        assert mock_subprocess_run.call_args[0][0][0] == "/project/venv/bin/python"
+
+    @patch("qaagent.runners.pytest_runner.run_command")
+    @patch("qaagent.runners.pytest_runner.which", return_value="/usr/bin/python")
+    def test_only_selects_failed_node_ids(self, mock_which, mock_run, tmp_path):
+        """Test that `only` cases are rerun by node ID instead of the whole path."""
+        from qaagent.runners.base import TestCase
+        test_dir = tmp_path / "tests"
+        (test_dir / "api").mkdir(parents=True)
+        (test_dir / "api" / "test_pets.py").write_text("")
+        mock_run.return_value = CmdResult(returncode=0, stdout="", stderr="")
+
+        runner = PytestRunner(output_dir=tmp_path)
+        runner.run(test_dir, only=[
+            TestCase(name="test_list[2]", classname="tests.api.test_pets.TestList", status="failed"),
+            TestCase(name="test_get", classname="tests.api.test_pets", status="error"),
+        ])
+
+        module = test_dir / "api" / "test_pets.py"
+        cmd = mock_run.call_args[0][0]
+        assert f"{module}::TestList::test_list[2]" in cmd
+        assert f"{module}::test_get" in cmd
+        assert str(test_dir) not in cmd
+
+    @patch("qaagent.runners.pytest_runner.run_command")
+    @patch("qaagent.runners.pytest_runner.which", return_value="/usr/bin/python")
+    def test_only_unresolvable_runs_full_path(self, mock_which, mock_run, tmp_path):
+        """Test that the whole path is rerun when a node can't be located."""
+        from qaagent.runners.base import TestCase
+        mock_run.return_value = CmdResult(returncode=0, stdout="", stderr="")
+
+        runner = PytestRunner(output_dir=tmp_path)
+        runner.run(tmp_path / "tests", only=[TestCase(name="test_x", classname="missing.mod")])
+
+        cmd = mock_run.call_args[0][0]
+        assert str((tmp_path / "tests").resolve()) in cmd
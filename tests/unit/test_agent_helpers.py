@@ -0,0 +1,94 @@
+"""Unit tests for the agent route helpers (no app, database, or docs needed)."""
+
+from __future__ import annotations
+
+import pytest
+
+from qaagent.api.routes.agent import LLM_TIMEOUT_SECONDS, _estimate_cost, _mask_key, _parse_sections
+
+
+@pytest.mark.parametrize(
+    "key,expected",
+    [
+        ("sk-123456789abcdef", "sk-1***cdef"),
+        ("short", "***"),  # short keys are fully masked
+        ("12345678", "***"),  # exactly eight chars
+        ("123456789", "1234***6789"),  # nine chars shows edges
+    ],
+)
+def test_mask_key(key: str, expected: str):
+    assert _mask_key(key) == expected
+
+
+@pytest.mark.parametrize(
+    "model,prompt_tokens,completion_tokens,expected",
+    [
+        # claude-sonnet-4-5-20250929: $3/M input, $15/M output
+        ("claude-sonnet-4-5-20250929", 1_000_000, 1_000_000, 18.0),
+        ("unknown-model", 100_000, 100_000, 0.0),
+        ("claude-sonnet-4-5", 1_000_000, 0, 3.0),  # prefix match
+    ],
+)
+def test_estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, expected: float):
+    assert _estimate_cost(model, prompt_tokens, completion_tokens) == expected
+
+
+class TestTimeoutConstant:
+    def test_agent_timeout_is_300_seconds(self):
+        """Agent analysis timeout is 300s (large prompts need extended processing)."""
+        assert LLM_TIMEOUT_SECONDS == 300
+
+
+class TestParseSections:
+    def test_parses_standard_sections(self):
+        """Standard LLM output with ## headings is split into sections."""
+        md = (
+            "## Product Overview\n\nThis is an app.\n\n"
+            "## Features\n\n### Login\n\nUsers can log in.\n\n"
+            "## Gaps & Recommendations\n\nNeed more tests."
+        )
+        sections = _parse_sections(md)
+        assert len(sections) == 3
+        assert sections[0].title == "Product Overview"
+        assert "This is an app" in sections[0].content
+        assert sections[1].title == "Features"
+        assert "### Login" in sections[1].content
+        assert sections[2].title == "Gaps & Recommendations"
+
+    def test_preamble_captured_as_introduction(self):
+        """Text before the first ## heading becomes an 'Introduction' section."""
+        md = "Some intro text.\n\n## Product Overview\n\nOverview content."
+        sections = _parse_sections(md)
+        assert len(sections) == 2
+        assert sections[0].title == "Introduction"
+        assert "Some intro text" in sections[0].content
+        assert sections[1].title == "Product Overview"
+
+    def test_no_headings_returns_single_section(self):
+        """If LLM ignores the format, all text goes into one section."""
+        md = "Just a big wall of text with no headings at all."
+        sections = _parse_sections(md)
+        assert len(sections) == 1
+        assert sections[0].title == "Introduction"
+        assert "big wall of text" in sections[0].content
+
+    def test_empty_string_returns_empty_list(self):
+        """Empty input produces no sections."""
+        assert _parse_sections("") == []
+        assert _parse_sections("   ") == []
+
+    def test_h3_not_split(self):
+        """### headings inside a section are NOT treated as section boundaries."""
+        md = "## Features\n\n### Login\n\nLogin flow.\n\n### Signup\n\nSignup flow."
+        sections = _parse_sections(md)
+        assert len(sections) == 1
+        assert sections[0].title == "Features"
+        assert "### Login" in sections[0].content
+        assert "### Signup" in sections[0].content
+
+    def test_strips_whitespace_from_title_and_content(self):
+        """Titles and content are trimmed."""
+        md = "##   Architecture & Tech Stack  \n\n  Content here.  \n\n"
+        sections = _parse_sections(md)
+        assert sections[0].title == "Architecture & Tech Stack"
+        assert sections[0].content == "Content here."
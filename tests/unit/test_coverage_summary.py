@@ -6,3 +6,19 @@ def test_summarize_code_coverage_parses_line_and_branch():
     assert meta is not None
     assert meta["line"] == 85.0
     assert meta["branch"] == 50.0
+
+
+def test_summarize_code_coverage_reads_root_beyond_head(tmp_path):
+    path = tmp_path / "coverage.xml"
+    padding = "<!-- " + "x" * 8192 + " -->\n"
+    path.write_text(f'<?xml version="1.0" ?>\n{padding}<coverage line-rate="0.25" branch-rate="0.75"><packages/></coverage>')
+    meta = summarize_code_coverage([str(path)])
+    assert meta is not None
+    assert meta["line"] == 25.0
+    assert meta["branch"] == 75.0
+
+
+def test_summarize_code_coverage_invalid_xml_returns_none(tmp_path):
+    path = tmp_path / "coverage.xml"
+    path.write_text("not xml at all")
+    assert summarize_code_coverage([str(path)]) is None
@@ -193,6 +193,22 @@ class TestUsers:
         db.user_create("b", "pass")
         assert db.user_count() == 2
 
+    def test_users_exist_caches_positive_answer(self, monkeypatch):
+        assert db.users_exist() is False
+        db.user_create("a", "pass")
+        assert db.users_exist() is True
+
+        monkeypatch.setattr(db, "user_count", lambda: pytest.fail("users table re-queried"))
+        assert db.users_exist() is True
+
+    def test_users_exist_resets_with_connection(self, tmp_path):
+        db.user_create("a", "pass")
+        assert db.users_exist() is True
+
+        db.reset_connection()
+        db.set_db_path(str(tmp_path / "other.db"))
+        assert db.users_exist() is False
+
     def test_duplicate_username(self):
         import sqlite3
         db.user_create("admin", "pass")
@@ -248,3 +264,31 @@ class TestSessions:
         assert removed == 1
         assert db.session_validate(t1) is None
         assert db.session_validate(t2) is not None
+
+    def test_validate_cached_within_ttl(self, monkeypatch):
+        uid = db.user_create("admin", "pass")
+        token = db.session_create(uid)
+        first = db.session_validate(token)
+
+        monkeypatch.setattr(db, "get_db", lambda: pytest.fail("session re-queried"))
+        assert db.session_validate(token) == first
+
+    def test_validate_requeries_after_ttl(self, monkeypatch):
+        uid = db.user_create("admin", "pass")
+        token = db.session_create(uid)
+        db.session_validate(token)
+        conn = db.get_db()
+        conn.execute("DELETE FROM sessions WHERE token = ?", (token,))
+        conn.commit()
+
+        clock = db.time.monotonic() + db._SESSION_CACHE_TTL + 1
+        monkeypatch.setattr(db.time, "monotonic", lambda: clock)
+        assert db.session_validate(token) is None
+
+    def test_delete_evicts_cached_session(self):
+        uid = db.user_create("admin", "pass")
+        token = db.session_create(uid)
+        assert db.session_validate(token) is not None
+
+        db.session_delete(token)
+        assert db.session_validate(token) is None
@@ -10,3 +10,18 @@ def test_generate_report_creates_file(tmp_path: Path):
     assert meta["output"] == out.as_posix()
     assert "summary" in meta and isinstance(meta["summary"], dict)
 
+
+
+def test_default_junit_files_and_artifacts_track_new_files(tmp_path: Path, monkeypatch):
+    from qaagent.report import collect_artifacts, find_default_junit_files
+
+    monkeypatch.chdir(tmp_path)
+    assert find_default_junit_files() == []
+    assert collect_artifacts()["junit"] == []
+
+    junit = tmp_path / "reports" / "pytest" / "junit.xml"
+    junit.parent.mkdir(parents=True)
+    junit.write_text("<testsuite/>")
+
+    assert find_default_junit_files() == [Path("reports/pytest/junit.xml")]
+    assert collect_artifacts()["junit"] == ["reports/pytest/junit.xml"]
@@ -30,3 +30,57 @@ def test_analyze_extras_parses_a11y_lighthouse_perf_and_api(tmp_path: Path, monk
     assert "perf" in extras and "requests" in extras["perf"]
     # API coverage should be computed since tests/fixtures/data/openapi.yaml exists and junit references GET /users
     assert "api_coverage" in extras and extras["api_coverage"]["total"] >= 1
+
+
+def test_summarize_api_coverage_reuses_result_until_junit_changes(tmp_path: Path, monkeypatch):
+    import os
+    import shutil
+
+    from qaagent import report
+
+    data = Path.cwd() / "tests/fixtures/data"
+    shutil.copy(data / "openapi.yaml", tmp_path / "openapi.yaml")
+    junit = tmp_path / "junit.xml"
+    shutil.copy(data / "junit_schemathesis.xml", junit)
+    monkeypatch.chdir(tmp_path)
+
+    calls = []
+    original = report._route_coverage_cached.__wrapped__
+
+    def counting(spec, junit_key):
+        calls.append(junit_key)
+        return original(spec, junit_key)
+
+    monkeypatch.setattr(report, "_route_coverage_cached", report.lru_cache(maxsize=32)(counting))
+
+    first = report.summarize_api_coverage({"junit": [str(junit)]})
+    second = report.summarize_api_coverage({"junit": [str(junit)]})
+    assert first == second and first["total"] >= 1
+    assert len(calls) == 1
+
+    stat = junit.stat()
+    os.utime(junit, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    report.summarize_api_coverage({"junit": [str(junit)]})
+    assert len(calls) == 2
+
+
+def test_openapi_candidates_refreshed_when_subdirectory_changes(tmp_path: Path):
+    import os
+
+    from qaagent import report
+
+    (tmp_path / "api").mkdir()
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "openapi.yaml").write_text("openapi: 3.0.0\n")
+    root_mtime = tmp_path.stat().st_mtime_ns
+
+    assert report._openapi_candidates(tmp_path) == (tmp_path / "docs" / "openapi.yaml",)
+
+    # Only api/ changes; the root directory's own mtime stays the same
+    (tmp_path / "api" / "openapi.yaml").write_text("openapi: 3.0.0\n")
+    os.utime(tmp_path, ns=(root_mtime, root_mtime))
+
+    assert report._openapi_candidates(tmp_path) == (
+        tmp_path / "api" / "openapi.yaml",
+        tmp_path / "docs" / "openapi.yaml",
+    )
@@ -17,6 +17,28 @@ VALID_SITEMAP = """\
 </urlset>
 """
 
+SITEMAP_INDEX = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-a.xml</loc></sitemap>
+  <sitemap><loc>https://example.com/sitemap-b.xml</loc></sitemap>
+</sitemapindex>
+"""
+
+
+def _stream_response(body: str, chunk_size: int = 16) -> MagicMock:
+    """Build a mock client.stream context manager yielding body in small chunks."""
+    data = body.encode()
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.iter_bytes.side_effect = lambda: (
+        data[i:i + chunk_size] for i in range(0, len(data), chunk_size)
+    )
+    ctx = MagicMock()
+    ctx.__enter__.return_value = response
+    ctx.__exit__.return_value = False
+    return ctx
+
 
 class TestFetchSitemapUrls:
     def _call(self, base_url="https://example.com", **kwargs):
@@ -24,12 +46,9 @@ class TestFetchSitemapUrls:
         from qaagent.sitemap import fetch_sitemap_urls
         return fetch_sitemap_urls(base_url, **kwargs)
 
-    @patch("httpx.get")
-    def test_parses_urls(self, mock_get):
-        response = MagicMock()
-        response.text = VALID_SITEMAP
-        response.raise_for_status = MagicMock()
-        mock_get.return_value = response
+    @patch("qaagent.sitemap._get_client")
+    def test_parses_urls(self, mock_client):
+        mock_client.return_value.stream.return_value = _stream_response(VALID_SITEMAP)
 
         urls = self._call("https://example.com")
 
@@ -38,54 +57,92 @@ class TestFetchSitemapUrls:
             "https://example.com/about",
             "https://example.com/contact",
         ]
-        mock_get.assert_called_once_with(
-            "https://example.com/sitemap.xml", timeout=15.0
+        mock_client.return_value.stream.assert_called_once_with(
+            "GET", "https://example.com/sitemap.xml"
         )
 
-    @patch("httpx.get")
-    def test_respects_limit(self, mock_get):
-        response = MagicMock()
-        response.text = VALID_SITEMAP
-        response.raise_for_status = MagicMock()
-        mock_get.return_value = response
+    @patch("qaagent.sitemap._get_client")
+    def test_respects_limit(self, mock_client):
+        mock_client.return_value.stream.return_value = _stream_response(VALID_SITEMAP)
 
         urls = self._call("https://example.com", limit=2)
 
         assert len(urls) == 2
 
-    @patch("httpx.get")
-    def test_strips_trailing_slash(self, mock_get):
-        response = MagicMock()
-        response.text = VALID_SITEMAP
-        response.raise_for_status = MagicMock()
-        mock_get.return_value = response
+    @patch("qaagent.sitemap._get_client")
+    def test_stops_reading_at_limit(self, mock_client):
+        body = VALID_SITEMAP.replace("</urlset>", "<url><loc>broken")
+        mock_client.return_value.stream.return_value = _stream_response(body)
+
+        # The malformed tail is never parsed once the limit is reached
+        urls = self._call("https://example.com", limit=1)
+
+        assert urls == ["https://example.com/"]
+
+    @patch("qaagent.sitemap._get_client")
+    def test_strips_trailing_slash(self, mock_client):
+        mock_client.return_value.stream.return_value = _stream_response(VALID_SITEMAP)
 
         self._call("https://example.com/")
 
-        mock_get.assert_called_once_with(
-            "https://example.com/sitemap.xml", timeout=15.0
+        mock_client.return_value.stream.assert_called_once_with(
+            "GET", "https://example.com/sitemap.xml"
         )
 
-    @patch("httpx.get")
-    def test_invalid_xml_raises(self, mock_get):
-        response = MagicMock()
-        response.text = "not xml at all <>"
-        response.raise_for_status = MagicMock()
-        mock_get.return_value = response
+    @patch("qaagent.sitemap._get_client")
+    def test_sitemap_index_follows_children(self, mock_client):
+        child_a = VALID_SITEMAP
+        child_b = VALID_SITEMAP.replace("example.com/", "example.com/b/")
+        mock_client.return_value.stream.side_effect = [
+            _stream_response(SITEMAP_INDEX),
+            _stream_response(child_a),
+            _stream_response(child_b),
+        ]
+
+        urls = self._call("https://example.com", limit=4)
+
+        assert urls == [
+            "https://example.com/",
+            "https://example.com/about",
+            "https://example.com/contact",
+            "https://example.com/b/",
+        ]
+        assert mock_client.return_value.stream.call_args_list[1].args[1] == "https://example.com/sitemap-a.xml"
+        assert mock_client.return_value.stream.call_args_list[2].args[1] == "https://example.com/sitemap-b.xml"
+
+    @patch("qaagent.sitemap._get_client")
+    def test_invalid_xml_raises(self, mock_client):
+        mock_client.return_value.stream.return_value = _stream_response("not xml at all <>")
 
         with pytest.raises(RuntimeError, match="Invalid sitemap"):
             self._call("https://example.com")
 
-    @patch("httpx.get")
-    def test_http_error_raises(self, mock_get):
+    @patch("qaagent.sitemap._get_client")
+    def test_http_error_raises(self, mock_client):
         import httpx
 
         mock_request = MagicMock()
         mock_response = MagicMock()
         mock_response.status_code = 404
-        mock_get.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
+        response = _stream_response("")
+        response.__enter__.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
             "404", request=mock_request, response=mock_response
         )
+        mock_client.return_value.stream.return_value = response
 
         with pytest.raises(Exception):
             self._call("https://example.com")
+
+
+class TestSharedClient:
+    def test_client_created_once(self):
+        import qaagent.sitemap as sitemap
+
+        httpx = MagicMock()
+        with patch.object(sitemap, "_CLIENT", None):
+            first = sitemap._get_client(httpx)
+            second = sitemap._get_client(httpx)
+
+        assert first is second
+        httpx.Client.assert_called_once()
+        assert httpx.Client.call_args.kwargs["follow_redirects"] is True
@@ -1,6 +1,11 @@
 """Tests for tools.py — CmdResult, run_command, which, ensure_dir."""
+import subprocess
+import sys
+import time
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+
+import pytest
 
 from qaagent.tools import CmdResult, run_command, which, ensure_dir
 
@@ -14,6 +19,12 @@ class TestCmdResult:
 
 
 class TestWhich:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        which.cache_clear()
+        yield
+        which.cache_clear()
+
     @patch("qaagent.tools.shutil.which", return_value="/usr/bin/python")
     def test_found(self, mock_which):
         assert which("python") == "/usr/bin/python"
@@ -22,81 +33,102 @@ class TestWhich:
     def test_not_found(self, mock_which):
         assert which("nonexistent") is None
 
+    @patch("qaagent.tools.shutil.which", return_value="/usr/bin/npx")
+    def test_lookup_cached(self, mock_which):
+        assert which("npx") == "/usr/bin/npx"
+        assert which("npx") == "/usr/bin/npx"
+        mock_which.assert_called_once_with("npx")
+
+
+def _py(code: str) -> list:
+    return [sys.executable, "-c", code]
+
 
 class TestRunCommand:
-    @patch("qaagent.tools.subprocess.run")
-    def test_success(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout="hello", stderr=""
-        )
-        result = run_command(["echo", "hello"])
+    def test_success(self):
+        result = run_command(_py("print('hello', end='')"))
 
         assert result.returncode == 0
         assert result.stdout == "hello"
         assert result.stderr == ""
 
-    @patch("qaagent.tools.subprocess.run")
-    def test_failure(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="error msg"
-        )
-        result = run_command(["false"])
+    def test_failure(self):
+        result = run_command(_py("import sys; sys.stderr.write('error msg'); sys.exit(1)"))
 
         assert result.returncode == 1
         assert result.stderr == "error msg"
 
-    @patch("qaagent.tools.subprocess.run")
-    def test_timeout(self, mock_run):
-        import subprocess
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd=["slow"], timeout=5)
-
-        result = run_command(["slow"], timeout=5)
+    def test_timeout(self):
+        result = run_command(_py("import time; time.sleep(30)"), timeout=1)
 
         assert result.returncode == -1
         assert "timed out" in result.stderr
 
-    @patch("qaagent.tools.subprocess.run")
-    def test_stdout_tail(self, mock_run):
-        long_output = "x" * 10000
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout=long_output, stderr=""
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX sleep")
+    def test_detached_grandchild_holding_pipes_does_not_block(self):
+        code = (
+            "import subprocess\n"
+            "subprocess.Popen(['sleep', '30'], start_new_session=True)\n"
+            "print('started', end='')"
         )
-        result = run_command(["cmd"], tail=100)
+        start = time.monotonic()
+        result = run_command(_py(code), timeout=2)
 
-        assert len(result.stdout) == 100
+        assert time.monotonic() - start < 10
+        assert result.returncode == 0
+        assert result.stdout == "started"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses start_new_session")
+    def test_grandchild_writing_after_exit_does_not_break_snapshot(self):
+        writer = (
+            "import sys, time\n"
+            "end = time.monotonic() + 3\n"
+            "while time.monotonic() < end: sys.stdout.write('tick\\n'); sys.stdout.flush()"
+        )
+        code = (
+            "import subprocess, sys\n"
+            f"subprocess.Popen([sys.executable, '-c', {writer!r}], start_new_session=True)\n"
+            "print('parent done', flush=True)"
+        )
+        result = run_command(_py(code), tail=50, timeout=1)
 
-    @patch("qaagent.tools.subprocess.run")
-    def test_cwd_passed(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        assert result.returncode == 0
+        assert len(result.stdout) <= 50
 
-        run_command(["ls"], cwd=tmp_path)
+    def test_stdout_tail(self):
+        result = run_command(_py("print('x' * 10000 + 'END', end='')"), tail=100)
 
-        _, kwargs = mock_run.call_args
-        assert kwargs["cwd"] == str(tmp_path)
+        assert len(result.stdout) == 100
+        assert result.stdout.endswith("END")
 
-    @patch("qaagent.tools.subprocess.run")
-    def test_env_merged(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+    def test_stdout_tail_across_many_writes(self):
+        code = "import sys\nfor i in range(5000): sys.stdout.write(f'{i:05d}\\n')"
+        result = run_command(_py(code), tail=12)
 
-        run_command(["cmd"], env={"MY_VAR": "val"})
+        assert result.stdout == "04998\n04999\n"
 
-        _, kwargs = mock_run.call_args
-        assert kwargs["env"]["MY_VAR"] == "val"
+    def test_cwd_passed(self, tmp_path):
+        result = run_command(_py("import os; print(os.getcwd(), end='')"), cwd=tmp_path)
 
-    @patch("qaagent.tools.subprocess.run")
-    def test_empty_stdout_stderr(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        assert Path(result.stdout).resolve() == tmp_path.resolve()
 
-        result = run_command(["cmd"])
+    def test_env_merged(self):
+        result = run_command(
+            _py("import os; print(os.environ['MY_VAR'], 'PATH' in os.environ, end='')"),
+            env={"MY_VAR": "val"},
+        )
 
-        assert result.stdout == ""
-        assert result.stderr == ""
+        assert result.stdout == "val True"
+
+    def test_env_inherited_without_copy(self):
+        with patch("qaagent.tools.subprocess.Popen", wraps=subprocess.Popen) as mock_popen:
+            result = run_command(_py("import os; print('PATH' in os.environ, end='')"))
 
-    @patch("qaagent.tools.subprocess.run")
-    def test_none_stdout_stderr(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr=None)
+        assert mock_popen.call_args.kwargs["env"] is None
+        assert result.stdout == "True"
 
-        result = run_command(["cmd"])
+    def test_empty_stdout_stderr(self):
+        result = run_command(_py("pass"))
 
         assert result.stdout == ""
         assert result.stderr == ""
@@ -1,7 +1,13 @@
 """Tests for Workspace class."""
 from __future__ import annotations
 
+import os
+import shutil
+import sys
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from qaagent.workspace import Workspace
 
@@ -74,6 +80,24 @@ class TestWorkspacePaths:
         assert fixtures_dir == tmp_path / "myapp" / "fixtures"
         assert fixtures_dir.is_dir()
 
+    def test_subdir_lookup_mkdirs_once(self, tmp_path):
+        ws = Workspace(base_dir=tmp_path)
+        with patch.object(Path, "mkdir", autospec=True) as mock_mkdir:
+            ws.get_reports_dir("myapp")
+
+        created = [call.args[0] for call in mock_mkdir.call_args_list]
+        assert created == [tmp_path / "myapp" / "reports"]
+
+    def test_recreates_dirs_removed_externally(self, tmp_path):
+        ws = Workspace(base_dir=tmp_path)
+        ws.get_reports_dir("myapp")
+        ws.get_tests_dir("myapp", "unit")
+
+        shutil.rmtree(tmp_path / "myapp")
+
+        assert ws.get_reports_dir("myapp").is_dir()
+        assert ws.get_tests_dir("myapp", "unit").is_dir()
+
 
 class TestWorkspaceClean:
     def test_clean_target(self, tmp_path):
@@ -85,6 +109,14 @@ class TestWorkspaceClean:
 
         assert not target_dir.exists()
 
+    def test_clean_target_then_recreate(self, tmp_path):
+        ws = Workspace(base_dir=tmp_path)
+        ws.get_tests_dir("myapp", "unit")
+
+        ws.clean_target("myapp")
+
+        assert ws.get_tests_dir("myapp", "unit").is_dir()
+
     def test_clean_target_nonexistent(self, tmp_path):
         ws = Workspace(base_dir=tmp_path)
         ws.clean_target("nonexistent")  # Should not raise
@@ -98,6 +130,7 @@ class TestWorkspaceClean:
 
         assert ws.base_dir.is_dir()
         assert ws.list_targets() == []
+        assert ws.get_reports_dir("app1").is_dir()
 
 
 class TestWorkspaceInfo:
@@ -142,6 +175,25 @@ class TestWorkspaceInfo:
 
         assert info["files"]["reports"] == 1
 
+    def test_info_counts_only_matching_test_files(self, tmp_path):
+        ws = Workspace(base_dir=tmp_path)
+        unit_dir = ws.get_tests_dir("myapp", "unit")
+        (unit_dir / "test_a.py").write_text("pass")
+        (unit_dir / "conftest.py").write_text("")
+        (unit_dir / "notes.txt").write_text("")
+        (unit_dir / "pkg.py").mkdir()
+        behave_dir = ws.get_tests_dir("myapp", "behave")
+        (behave_dir / "login.feature").write_text("Feature: Login")
+        fixtures_dir = ws.get_target_workspace("myapp") / "fixtures"
+        fixtures_dir.mkdir()
+        (fixtures_dir / "users.json").write_text("[]")
+
+        info = ws.get_workspace_info("myapp")
+
+        assert info["files"]["tests"] == {"unit": 2, "behave": 1}
+        assert info["files"]["fixtures"] == 1
+        assert "reports" not in info["files"]
+
 
 class TestWorkspaceCopyToTarget:
     def test_copy_files(self, tmp_path):
@@ -182,3 +234,74 @@ class TestWorkspaceCopyToTarget:
 
         assert len(copied) == 1
         assert not (dest / "file.txt").exists()
+
+    def test_copy_many_files(self, tmp_path):
+        ws = Workspace(base_dir=tmp_path / "workspace")
+        unit_dir = ws.get_tests_dir("myapp", "unit")
+        behave_dir = ws.get_tests_dir("myapp", "behave")
+        for i in range(20):
+            (unit_dir / f"test_{i}.py").write_text(f"# {i}")
+            (behave_dir / f"f_{i}.feature").write_text(f"Feature: {i}")
+
+        dest = tmp_path / "project"
+        copied = ws.copy_to_target("myapp", dest)
+
+        assert len(copied) == 40
+        for src_file, dest_file in copied:
+            assert dest_file.read_text() == src_file.read_text()
+
+    def test_copy_pattern_matches_like_rglob(self, tmp_path):
+        ws = Workspace(base_dir=tmp_path / "workspace")
+        target_ws = ws.get_target_workspace("myapp")
+        for rel in ["openapi.json", "reports/summary.json", "tests/unit/test_a.py",
+                    "tests/behave/login.feature", "fixtures/tests/data.py"]:
+            path = target_ws / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rel)
+
+        for pattern in ["*.json", "unit/*.py", "tests/*", "tests/*/*"]:
+            copied = ws.copy_to_target("myapp", tmp_path / "project", pattern, dry_run=True)
+            expected = {p for p in target_ws.rglob(pattern) if p.is_file()}
+            assert {src for src, _ in copied} == expected, pattern
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks and FIFOs need POSIX")
+    def test_copy_skips_broken_symlinks_and_special_files(self, tmp_path):
+        ws = Workspace(base_dir=tmp_path / "workspace")
+        target_ws = ws.get_target_workspace("myapp")
+        (target_ws / "real.json").write_text("{}")
+        (target_ws / "linked.json").symlink_to(target_ws / "real.json")
+        (target_ws / "dangling.json").symlink_to(target_ws / "missing.json")
+        os.mkfifo(target_ws / "pipe.json")
+
+        copied = ws.copy_to_target("myapp", tmp_path / "project", "*.json")
+
+        assert sorted(src.name for src, _ in copied) == ["linked.json", "real.json"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="directory symlinks need privileges on Windows")
+    def test_copy_follows_symlinked_dirs_once(self, tmp_path):
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        (shared / "common.json").write_text("{}")
+        ws = Workspace(base_dir=tmp_path / "workspace")
+        target_ws = ws.get_target_workspace("myapp")
+        (target_ws / "fixtures").symlink_to(shared, target_is_directory=True)
+        # A loop back to the workspace root must not recurse forever
+        (target_ws / "loop").symlink_to(target_ws, target_is_directory=True)
+
+        copied = ws.copy_to_target("myapp", tmp_path / "project", "*.json", dry_run=True)
+
+        assert [src for src, _ in copied] == [target_ws / "fixtures" / "common.json"]
+
+    def test_copy_pattern_uses_platform_case_rules(self, tmp_path, monkeypatch):
+        import ntpath
+
+        ws = Workspace(base_dir=tmp_path / "workspace")
+        target_ws = ws.get_target_workspace("myapp")
+        (target_ws / "Reports").mkdir()
+        (target_ws / "Reports" / "Summary.JSON").write_text("{}")
+
+        # Windows' normcase folds case, as rglob does there
+        monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+        copied = ws.copy_to_target("myapp", tmp_path / "project", "reports/*.json", dry_run=True)
+
+        assert [src for src, _ in copied] == [target_ws / "Reports" / "Summary.JSON"]